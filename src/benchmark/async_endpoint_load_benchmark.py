@@ -0,0 +1,113 @@
+"""
+Carga mista contra o endpoint síncrono (WSGI, uma thread por cliente) e o assíncrono (ASGI, um
+event loop com as simulações longas no BoundedSimulationExecutor). A maioria das requisições pede
+só o resumo; uma fração pede a evolução anual de 30 anos com capitalização diária. Mostra a
+latência p50/p95/p99 de cada tipo de requisição.
+
+Uso: python -m src.benchmark.async_endpoint_load_benchmark
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append("src/python")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import AsyncClient, Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from src.python.django_project.calculator.cache import get_async_simulation_executor  # noqa: E402
+
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 25
+LONG_EVERY = 10
+
+SHORT = {
+    "principal": 1000, "annual_rate": 0.12, "total_periods": 120, "compounding_frequency": "MONTHLY",
+    "contribution_amount": 100, "contribution_frequency": "MONTHLY",
+}
+
+
+def _request(client_index: int, request_index: int):
+    # Parâmetros variados para que o cache de relatórios não responda as longas
+    if (client_index * REQUESTS_PER_CLIENT + request_index) % LONG_EVERY:
+        return "short", SHORT
+    return "long", {
+        "principal": 1000 + client_index * REQUESTS_PER_CLIENT + request_index, "annual_rate": 0.1,
+        "total_periods": 30 * 365, "compounding_frequency": "DAILY",
+        "contribution_amount": 5, "contribution_frequency": "DAILY", "evolution": "yearly",
+    }
+
+
+def _percentiles(latencies):
+    if len(latencies) < 2:
+        return latencies * 3
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49], cuts[94], cuts[98]
+
+
+def _report(label: str, latencies, elapsed: float) -> None:
+    for kind in ("short", "long"):
+        p50, p95, p99 = _percentiles(latencies[kind])
+        print(f"{label:>6}{kind:>7}{len(latencies[kind]):>6}{p50 * 1000:>10.1f}{p95 * 1000:>10.1f}{p99 * 1000:>10.1f}")
+    total = sum(len(values) for values in latencies.values())
+    print(f"{label:>6}{'total':>7}{total:>6}{'':>10}{'':>10}{'':>10}  {total / elapsed:,.0f} req/s")
+
+
+def _run_wsgi() -> None:
+    latencies = {"short": [], "long": []}
+
+    def client_loop(client_index: int) -> None:
+        client = Client()
+        for request_index in range(REQUESTS_PER_CLIENT):
+            kind, params = _request(client_index, request_index)
+            started = time.perf_counter()
+            response = client.get("/api/investments/simulate/", params)
+            latencies[kind].append(time.perf_counter() - started)
+            assert response.status_code == 200
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+        list(pool.map(client_loop, range(CLIENTS)))
+    _report("WSGI", latencies, time.perf_counter() - started)
+
+
+async def _run_asgi() -> None:
+    latencies = {"short": [], "long": []}
+    rejected = 0
+
+    async def client_loop(client_index: int) -> None:
+        nonlocal rejected
+        client = AsyncClient()
+        for request_index in range(REQUESTS_PER_CLIENT):
+            kind, params = _request(client_index, request_index)
+            started = time.perf_counter()
+            response = await client.get("/api/investments/simulate-async/", params)
+            if response.status_code == 503:
+                rejected += 1
+                continue
+            latencies[kind].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop(index) for index in range(CLIENTS)))
+    _report("ASGI", latencies, time.perf_counter() - started)
+    print(f"{'':>6}{'503':>7}{rejected:>6}")
+
+
+def main() -> None:
+    setup_test_environment()
+    print(f"{'':>6}{'Tipo':>7}{'N':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    _run_wsgi()
+    asyncio.run(_run_asgi())
+    get_async_simulation_executor().close()
+
+
+if __name__ == "__main__":
+    main()
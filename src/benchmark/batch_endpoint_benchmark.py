@@ -0,0 +1,61 @@
+"""
+Compara N requisições GET /api/investments/simulate com uma única
+POST /api/investments/simulate-batch contendo os mesmos N cenários.
+
+Uso: python -m src.benchmark.batch_endpoint_benchmark
+"""
+import os
+import sys
+import time
+
+sys.path.append("src/python")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client, override_settings  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+
+def _scenarios(size: int):
+    return [
+        {
+            "principal": 1000.0 + index,
+            "annual_rate": 0.05 + (index % 10) / 100,
+            "total_periods": 12 * (1 + index % 30),
+            "compounding_frequency": "MONTHLY",
+            "contribution_amount": 100.0,
+            "contribution_frequency": "MONTHLY",
+        }
+        for index in range(size)
+    ]
+
+
+def main() -> None:
+    setup_test_environment()
+    client = Client()
+
+    print(f"{'Cenários':>10}{'N x GET (s)':>14}{'1 x POST (s)':>14}{'Ganho':>10}")
+    with override_settings(SIMULATION_CACHE={"BACKEND": None}):
+        from src.python.django_project.calculator.cache import get_simulation_cache
+        get_simulation_cache.cache_clear()
+
+        for size in (10, 100, 1000):
+            scenarios = _scenarios(size)
+
+            started = time.perf_counter()
+            for scenario in scenarios:
+                client.get("/api/investments/simulate/", scenario)
+            sequential = time.perf_counter() - started
+
+            started = time.perf_counter()
+            client.post("/api/investments/simulate-batch/", scenarios, content_type="application/json")
+            batch = time.perf_counter() - started
+
+            print(f"{size:>10}{sequential:>14.4f}{batch:>14.4f}{sequential / batch:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compara BatchCompoundInterestCalculator.simulate_many com um laço sobre
+CompoundInterestCalculator.simulate, para saldos finais e para a matriz de saldos.
+
+Uso: python -m src.benchmark.batch_simulation_benchmark
+"""
+import random
+import time
+
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.batch_compound_interest_calculator import BatchCompoundInterestCalculator
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+def _portfolio(size: int, seed: int = 42):
+    rng = random.Random(seed)
+    investments = []
+    for _ in range(size):
+        frequency = rng.choice([CompoundingFrequency.MONTHLY, CompoundingFrequency.YEARLY])
+        investments.append(
+            Investment(
+                principal=rng.uniform(0.0, 100000.0),
+                annual_rate=rng.uniform(0.0, 0.2),
+                total_periods=rng.randint(1, 40) * frequency.value,
+                compounding_frequency=frequency,
+                contribution=Contribution(amount=rng.uniform(0.0, 2000.0), frequency=frequency)
+            )
+        )
+    return investments
+
+
+def _time(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    calculator = CompoundInterestCalculator()
+    batch_calculator = BatchCompoundInterestCalculator()
+
+    print(f"{'Cenários':>10}{'Modo':>12}{'Laço (s)':>12}{'Lote (s)':>12}{'Ganho':>10}")
+    for size in (1000, 10000, 100000):
+        investments = _portfolio(size)
+
+        loop = _time(lambda: [calculator.simulate(i) for i in investments])
+        batch = _time(lambda: batch_calculator.simulate_many(investments))
+        print(f"{size:>10}{'resumo':>12}{loop:>12.4f}{batch:>12.4f}{loop / batch:>9.1f}x")
+
+        if size <= 10000:
+            loop = _time(lambda: [calculator.simulate(i, detailed=True) for i in investments])
+            batch = _time(lambda: batch_calculator.simulate_many(investments, with_balances=True))
+            print(f"{size:>10}{'saldos':>12}{loop:>12.4f}{batch:>12.4f}{loop / batch:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
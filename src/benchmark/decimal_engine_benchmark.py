@@ -0,0 +1,61 @@
+"""
+Sobrecarga do motor decimal (DecimalCompoundInterestCalculator) em relação ao laço float de
+CompoundInterestCalculator, para horizontes MONTHLY e DAILY, com e sem arredondamento por período.
+Inclui uma versão ingênua (contexto e expoente criados a cada período) para referência.
+
+Uso: python -m src.benchmark.decimal_engine_benchmark
+"""
+import timeit
+from decimal import Decimal, ROUND_HALF_EVEN, localcontext
+
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.decimal_compound_interest_calculator import DecimalCompoundInterestCalculator
+
+
+def _naive_decimal(investment: Investment) -> Decimal:
+    balance = Decimal(str(investment.principal))
+    for _ in range(investment.total_periods):
+        with localcontext() as context:
+            context.prec = 28
+            context.rounding = ROUND_HALF_EVEN
+            balance += Decimal(str(investment.contribution.amount))
+            rate = Decimal(str(investment.annual_rate)) / investment.compounding_frequency.value
+            balance += (balance * rate).quantize(Decimal("0.01"))
+    return balance
+
+
+def _per_call(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    float_calculator = CompoundInterestCalculator()
+    cents = DecimalCompoundInterestCalculator()
+    unrounded = DecimalCompoundInterestCalculator(places=None)
+
+    print(f"{'Horizonte':>16}{'Float (ms)':>12}{'Decimal (ms)':>14}{'Sem arred. (ms)':>17}{'Ingênuo (ms)':>14}{'Sobrecarga':>12}")
+    for frequency, years in ((CompoundingFrequency.MONTHLY, 30), (CompoundingFrequency.DAILY, 30)):
+        investment = Investment(
+            principal=10000.0,
+            annual_rate=0.1075,
+            total_periods=years * frequency.value,
+            compounding_frequency=frequency,
+            contribution=Contribution(amount=150.0, frequency=frequency)
+        )
+        number = 20 if frequency is CompoundingFrequency.MONTHLY else 2
+
+        float_time = _per_call(lambda: float_calculator.simulate(investment, detailed=True), number) * 1000
+        decimal_time = _per_call(lambda: cents.simulate(investment, detailed=True), number) * 1000
+        unrounded_time = _per_call(lambda: unrounded.simulate(investment, detailed=True), number) * 1000
+        naive_time = _per_call(lambda: _naive_decimal(investment), number) * 1000
+
+        label = f"{frequency.name} {years}a"
+        print(
+            f"{label:>16}{float_time:>12.3f}{decimal_time:>14.3f}{unrounded_time:>17.3f}"
+            f"{naive_time:>14.3f}{decimal_time / float_time:>11.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
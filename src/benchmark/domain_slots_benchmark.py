@@ -0,0 +1,60 @@
+"""
+Compara as linhas de relatório com slots (PeriodDetail, MonthlySummary, YearSummary e
+SimulationSummary) com cópias das mesmas classes sem slots, como eram antes: bytes por instância,
+medidos com tracemalloc sobre instâncias que compartilham os valores dos campos, e instâncias
+construídas por segundo com argumentos nomeados e posicionais.
+
+Uso: python -m src.benchmark.domain_slots_benchmark
+"""
+import timeit
+import tracemalloc
+from dataclasses import fields, make_dataclass
+
+from src.python.application.domain.full_simulation_report import SimulationSummary
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import PeriodDetail
+from src.python.application.domain.year_summary import YearSummary
+
+INSTANCES = 100_000
+ROUNDS = 15
+
+
+def _without_slots(cls):
+    return make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)], frozen=True)
+
+
+def _sample_values(cls):
+    return [index + 1 if field.type is int else (index + 1) * 1000.5 for index, field in enumerate(fields(cls))]
+
+
+def _bytes_per_instance(cls, values) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [cls(*values) for _ in range(INSTANCES)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    # Desconta o próprio array da lista: um ponteiro por instância
+    return (after - before) / INSTANCES - 8
+
+
+def _construction_rate(factory) -> float:
+    # Melhor de várias rodadas curtas, com o coletor desligado pelo timeit
+    batch = INSTANCES // 10
+    return batch / min(timeit.repeat(factory, number=batch, repeat=ROUNDS))
+
+
+def main() -> None:
+    print(f"{'Classe':<20}{'Versão':<10}{'B/instância':>13}{'Nomeados/s':>14}{'Posicionais/s':>16}")
+    for cls in (PeriodDetail, MonthlySummary, YearSummary, SimulationSummary):
+        values = _sample_values(cls)
+        keywords = dict(zip([f.name for f in fields(cls)], values))
+        for label, version in (("antes", _without_slots(cls)), ("slots", cls)):
+            size = _bytes_per_instance(version, values)
+            by_name = _construction_rate(lambda: version(**keywords))
+            positional = _construction_rate(lambda: version(*values))
+            print(f"{cls.__name__:<20}{label:<10}{size:>13.0f}{by_name:>14,.0f}{positional:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Carga mista realista: muitas simulações detalhadas que compartilham poucas combinações de
+taxa e frequência, variando principal, aporte e horizonte. Compara o laço período a período
+com o uso das tabelas de fatores de crescimento.
+
+Uso: python -m src.benchmark.growth_factor_table_benchmark
+"""
+import random
+import time
+
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+RATES = (0.06, 0.08, 0.1, 0.1075, 0.12, 0.15)
+
+
+def _workload(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    investments = []
+    for _ in range(size):
+        frequency = rng.choice([CompoundingFrequency.DAILY, CompoundingFrequency.MONTHLY, CompoundingFrequency.MONTHLY])
+        investments.append(
+            Investment(
+                principal=round(rng.uniform(0, 50000), 2),
+                annual_rate=rng.choice(RATES),
+                total_periods=rng.randint(1, 30) * frequency.value,
+                compounding_frequency=frequency,
+                contribution=Contribution(amount=round(rng.uniform(0, 2000), 2), frequency=frequency)
+            )
+        )
+    return investments
+
+
+def _time(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def _full_reports(use_case: SimulateInvestmentUseCase, investments) -> None:
+    for investment in investments:
+        report = use_case.execute(investment)
+        len(report.yearly_evolution)
+
+
+def main() -> None:
+    investments = _workload(500)
+    tables = GrowthFactorTables()
+
+    loop_calculator = CompoundInterestCalculator()
+    table_calculator = CompoundInterestCalculator(growth_tables=tables)
+
+    loop = _time(lambda: [loop_calculator.simulate(i, detailed=True) for i in investments])
+    cold = _time(lambda: [table_calculator.simulate(i, detailed=True) for i in investments])
+    warm = _time(lambda: [table_calculator.simulate(i, detailed=True) for i in investments])
+
+    print(f"{'Cenário':<40}{'Tempo (s)':>12}{'Ganho':>10}")
+    print(f"{'simulate(detailed=True) laço':<40}{loop:>12.4f}{1:>9.1f}x")
+    print(f"{'simulate(detailed=True) tabelas frias':<40}{cold:>12.4f}{loop / cold:>9.1f}x")
+    print(f"{'simulate(detailed=True) tabelas quentes':<40}{warm:>12.4f}{loop / warm:>9.1f}x")
+
+    streaming = _time(lambda: _full_reports(SimulateInvestmentUseCase(), investments))
+    tabled = _time(lambda: _full_reports(SimulateInvestmentUseCase(growth_tables=tables), investments))
+    print(f"{'relatório completo em streaming':<40}{streaming:>12.4f}{1:>9.1f}x")
+    print(f"{'relatório completo com tabelas':<40}{tabled:>12.4f}{streaming / tabled:>9.1f}x")
+    print(f"\n{tables.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Simula o controle deslizante de anos: a cada passo o prazo aumenta um ano e as evoluções são
+lidas. Compara o cálculo do zero com a retomada a partir do relatório em cache do passo anterior.
+
+Uso: python -m src.benchmark.incremental_report_benchmark
+"""
+import time
+from dataclasses import replace
+
+from src.python.application.cache.lru_simulation_cache import LRUSimulationCache
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+BASE = Investment(
+    principal=10000.0,
+    annual_rate=0.10,
+    total_periods=0,
+    compounding_frequency=CompoundingFrequency.DAILY,
+    contribution=Contribution(amount=15.0, frequency=CompoundingFrequency.DAILY)
+)
+
+
+def _drag_slider(use_case: SimulateInvestmentUseCase, years: int) -> float:
+    started = time.perf_counter()
+    for year in range(1, years + 1):
+        report = use_case.execute(replace(BASE, total_periods=year * BASE.compounding_frequency.value))
+        len(report.monthly_evolution)
+        len(report.yearly_evolution)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"{'Anos':>6}{'Do zero':>12}{'Retomando':>12}{'Ganho':>8}")
+    for years in (10, 30, 50):
+        scratch = _drag_slider(SimulateInvestmentUseCase(), years)
+        incremental = _drag_slider(SimulateInvestmentUseCase(cache=LRUSimulationCache(max_size=256)), years)
+        print(f"{years:>6}{scratch:>10.3f} s{incremental:>10.3f} s{scratch / incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
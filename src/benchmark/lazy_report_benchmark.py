@@ -0,0 +1,55 @@
+"""
+Compara as alocações de SimulateInvestmentUseCase.execute quando só o resumo é lido
+(como em CalculatorView.fetch) com a construção antecipada de todas as evoluções.
+
+Uso: python -m src.benchmark.lazy_report_benchmark
+"""
+import time
+import tracemalloc
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+def _eager_summary(investment: Investment):
+    result = CompoundInterestCalculator().simulate(investment, detailed=True)
+    report_builder = SimulationReportBuilder(result=result)
+    report_builder.build_monthly_evolution()
+    report_builder.build_yearly_evolution(investment.compounding_frequency)
+    return report_builder.build_summary(result, investment)
+
+
+def _lazy_summary(investment: Investment):
+    return SimulateInvestmentUseCase().execute(investment).summary
+
+
+def _measure(func, investment: Investment):
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(investment)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    print(f"{'Anos':>6}{'Períodos':>10}{'Pico antecipado':>18}{'Pico preguiçoso':>18}{'Redução':>10}")
+    for years in (1, 5, 10, 30, 50):
+        investment = Investment(
+            principal=10000.0,
+            annual_rate=0.10,
+            total_periods=years * CompoundingFrequency.DAILY.value,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=15.0, frequency=CompoundingFrequency.DAILY)
+        )
+        _, eager_peak = _measure(_eager_summary, investment)
+        _, lazy_peak = _measure(_lazy_summary, investment)
+        print(f"{years:>6}{investment.total_periods:>10}{eager_peak:>16,} B{lazy_peak:>16,} B"
+              f"{eager_peak / max(lazy_peak, 1):>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
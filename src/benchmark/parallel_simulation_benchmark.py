@@ -0,0 +1,52 @@
+"""
+Escalabilidade de ParallelSimulationExecutor para lotes de relatórios detalhados com 1, 2, 4 e 8
+workers. Com 1 worker o lote roda no próprio processo e serve de referência. O pool é aquecido
+antes da medição, já que é reaproveitado entre chamadas.
+
+Uso: python -m src.benchmark.parallel_simulation_benchmark
+"""
+import os
+import random
+import time
+
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.parallel_simulation_executor import ParallelSimulationExecutor
+
+
+def _portfolio(size: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [
+        Investment(
+            principal=rng.uniform(0.0, 100000.0),
+            annual_rate=rng.uniform(0.0, 0.2),
+            total_periods=rng.randint(10, 40) * CompoundingFrequency.MONTHLY.value,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=rng.uniform(0.0, 2000.0), frequency=CompoundingFrequency.MONTHLY)
+        )
+        for _ in range(size)
+    ]
+
+
+def _time(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    investments = _portfolio(2000)
+    print(f"CPUs disponíveis: {os.cpu_count()}")
+    print(f"{'Workers':>8}{'Tempo (s)':>12}{'Ganho':>10}")
+
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        with ParallelSimulationExecutor(max_workers=workers, serial_threshold=0) as executor:
+            executor.run(investments[:workers * 4])
+            elapsed = _time(lambda: executor.run(investments))
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>12.4f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
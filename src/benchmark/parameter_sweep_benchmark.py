@@ -0,0 +1,66 @@
+"""
+Compara ParameterSweepCalculator.sweep numa grade 100 taxas x 100 horizontes x 10 aportes
+com laços aninhados chamando SimulateInvestmentUseCase para cada combinação.
+
+Uso: python -m src.benchmark.parameter_sweep_benchmark
+"""
+import itertools
+import time
+
+import numpy as np
+
+from src.python.application.domain.parameter_sweep import SweepAxes
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.parameter_sweep_calculator import ParameterSweepCalculator
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+def _axes() -> SweepAxes:
+    return SweepAxes(
+        principal=10000.0,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        annual_rates=tuple(np.linspace(0.0, 0.2, 100).tolist()),
+        total_periods=tuple(range(12, 12 * 101, 12)),
+        contribution_amounts=tuple(np.linspace(0.0, 2000.0, 10).tolist())
+    )
+
+
+def _time(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def _nested_loops(axes: SweepAxes):
+    use_case = SimulateInvestmentUseCase()
+    return [
+        use_case.execute(
+            Investment(
+                principal=axes.principal,
+                annual_rate=rate,
+                total_periods=periods,
+                compounding_frequency=axes.compounding_frequency,
+                contribution=Contribution(amount=amount, frequency=axes.compounding_frequency)
+            )
+        ).summary.final_balance
+        for rate, periods, amount in itertools.product(
+            axes.annual_rates, axes.total_periods, axes.contribution_amounts
+        )
+    ]
+
+
+def main() -> None:
+    axes = _axes()
+    cells = int(np.prod(axes.shape))
+
+    loop, expected = _time(lambda: _nested_loops(axes))
+    sweep, result = _time(lambda: ParameterSweepCalculator().sweep(axes))
+
+    np.testing.assert_allclose(result.final_balances.ravel(), expected, rtol=1e-9)
+
+    print(f"{'Células':>10}{'Laço (s)':>12}{'Grade (s)':>12}{'Ganho':>10}")
+    print(f"{cells:>10}{loop:>12.4f}{sweep:>12.4f}{loop / sweep:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Suíte de desempenho: mede tempo e pico de memória de CompoundInterestCalculator.simulate (cada
+frequência, horizontes de 1 a 50 anos, com e sem detalhes), dos métodos do SimulationReportBuilder,
+de SimulateInvestmentUseCase.execute e de CalculatorView.fetch pelo cliente de testes do Django.
+
+Com --update os resultados são gravados no baseline JSON; sem ele são comparados ao baseline e o
+processo termina com código 1 se algum caso ficar mais lento que --threshold (fração, 0.25 = 25%)
+ou usar mais memória que --memory-threshold mais a folga --memory-slack, em bytes. O tempo de cada
+caso é o melhor de --repeat rodadas, cada uma com repetições suficientes para durar --min-time
+segundos; a memória é medida à parte, com tracemalloc, numa única execução.
+
+Uso: python -m src.benchmark.performance_suite [--update] [--baseline caminho] [--filter texto]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Raiz do repositório (pacote src) e src/python, a partir deste arquivo e não do diretório atual
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(path for path in (os.path.dirname(_SRC_DIR), os.path.join(_SRC_DIR, "python")) if path not in sys.path)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client, override_settings  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder  # noqa: E402
+from src.python.application.domain.simulation_result import (  # noqa: E402
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator  # noqa: E402
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase  # noqa: E402
+from src.python.django_project.calculator.cache import get_simulation_cache  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+HORIZON_YEARS = (1, 5, 10, 25, 50)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    func: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    seconds: float
+    peak_bytes: int
+
+
+def _investment(frequency: CompoundingFrequency, years: int) -> Investment:
+    return Investment(
+        principal=10000.0,
+        annual_rate=0.10,
+        total_periods=years * frequency.value,
+        compounding_frequency=frequency,
+        contribution=Contribution(amount=100.0, frequency=frequency)
+    )
+
+
+def _query(investment: Investment) -> Dict[str, object]:
+    return {
+        "principal": investment.principal,
+        "annual_rate": investment.annual_rate,
+        "total_periods": investment.total_periods,
+        "compounding_frequency": investment.compounding_frequency.name,
+        "contribution_amount": investment.contribution.amount,
+        "contribution_frequency": investment.contribution.frequency.name,
+    }
+
+
+def _calculator_cases() -> Iterator[BenchmarkCase]:
+    calculator = CompoundInterestCalculator()
+    for frequency in CompoundingFrequency:
+        for years in HORIZON_YEARS:
+            investment = _investment(frequency, years)
+            for detailed in (False, True):
+                yield BenchmarkCase(
+                    f"calculator.simulate[{frequency.name}-{years}y-{'detailed' if detailed else 'summary'}]",
+                    lambda investment=investment, detailed=detailed: calculator.simulate(investment, detailed)
+                )
+
+
+def _report_builder_cases() -> Iterator[BenchmarkCase]:
+    for frequency, years in ((CompoundingFrequency.MONTHLY, 50), (CompoundingFrequency.DAILY, 10)):
+        investment = _investment(frequency, years)
+        result = CompoundInterestCalculator().simulate(investment, detailed=True)
+        builder = SimulationReportBuilder(result=result)
+        label = f"{frequency.name}-{years}y"
+
+        yield BenchmarkCase(f"report_builder.build_monthly_evolution[{label}]", builder.build_monthly_evolution)
+        yield BenchmarkCase(
+            f"report_builder.build_yearly_evolution[{label}]",
+            lambda builder=builder, frequency=frequency: builder.build_yearly_evolution(frequency)
+        )
+        yield BenchmarkCase(
+            f"report_builder.build_summary[{label}]",
+            lambda builder=builder, result=result, investment=investment: builder.build_summary(result, investment)
+        )
+
+
+def _use_case_cases() -> Iterator[BenchmarkCase]:
+    use_case = SimulateInvestmentUseCase()
+    for frequency, years in ((CompoundingFrequency.MONTHLY, 30), (CompoundingFrequency.DAILY, 30)):
+        investment = _investment(frequency, years)
+        yield BenchmarkCase(
+            f"use_case.execute[{frequency.name}-{years}y-summary]",
+            lambda investment=investment: use_case.execute(investment).summary
+        )
+        yield BenchmarkCase(
+            f"use_case.execute[{frequency.name}-{years}y-evolutions]",
+            lambda investment=investment: len(use_case.execute(investment).yearly_evolution)
+        )
+
+
+def _view_cases() -> Iterator[BenchmarkCase]:
+    client = Client()
+    for frequency, years in ((CompoundingFrequency.YEARLY, 10), (CompoundingFrequency.MONTHLY, 30),
+                             (CompoundingFrequency.DAILY, 50)):
+        query = _query(_investment(frequency, years))
+        yield BenchmarkCase(
+            f"view.fetch[{frequency.name}-{years}y]",
+            lambda query=query: client.get("/api/investments/simulate/", query)
+        )
+
+
+def build_cases() -> List[BenchmarkCase]:
+    return [*_calculator_cases(), *_report_builder_cases(), *_use_case_cases(), *_view_cases()]
+
+
+def _time_per_call(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best / number
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case: BenchmarkCase, repeat: int, min_time: float) -> Measurement:
+    case.func()  # aquecimento: imports, caches de classe e tabelas
+    return Measurement(seconds=_time_per_call(case.func, repeat, min_time), peak_bytes=_peak_memory(case.func))
+
+
+def compare(
+        results: Dict[str, Measurement],
+        baseline: Dict[str, dict],
+        threshold: float,
+        memory_threshold: float,
+        memory_slack: int = 0
+) -> List[str]:
+    """Nomes dos casos que regrediram além dos limites; casos sem baseline são ignorados."""
+    regressions = []
+    for name, measurement in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        slower = measurement.seconds > reference["seconds"] * (1 + threshold)
+        # A folga absoluta evita falsos alarmes em casos que alocam poucos KiB
+        bigger = measurement.peak_bytes > reference["peak_bytes"] * (1 + memory_threshold) + memory_slack
+        if slower or bigger:
+            regressions.append(name)
+    return regressions
+
+
+def _load_baseline(path: str) -> Optional[Dict[str, dict]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["cases"]
+
+
+def _save_baseline(path: str, results: Dict[str, Measurement]) -> None:
+    # Casos fora do --filter mantêm os valores já gravados
+    cases = _load_baseline(path) or {}
+    cases.update(
+        (name, {"seconds": measurement.seconds, "peak_bytes": measurement.peak_bytes})
+        for name, measurement in results.items()
+    )
+    document = {
+        "environment": {"python": platform.python_version(), "machine": platform.machine(), "node": platform.node()},
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Suíte de desempenho do simulador")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="grava os resultados como novo baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--memory-threshold", type=float, default=0.10)
+    parser.add_argument("--memory-slack", type=int, default=16 * 1024, help="folga absoluta de memória, em bytes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--filter", default="", help="roda só os casos cujo nome contém o texto")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    setup_test_environment()
+    baseline = None if args.update else _load_baseline(args.baseline)
+
+    results: Dict[str, Measurement] = {}
+    print(f"{'Caso':<58}{'Tempo (ms)':>12}{'Pico (KiB)':>12}{'Baseline':>10}{'Razão':>8}")
+
+    # Sem o cache de relatórios, para que fetch e execute meçam a simulação e não o cache
+    with override_settings(SIMULATION_CACHE={"BACKEND": None}):
+        get_simulation_cache.cache_clear()
+        try:
+            for case in build_cases():
+                if args.filter not in case.name:
+                    continue
+                measurement = results[case.name] = measure(case, args.repeat, args.min_time)
+                reference = (baseline or {}).get(case.name)
+                ratio = f"{measurement.seconds / reference['seconds']:>7.2f}x" if reference else f"{'-':>8}"
+                reference_ms = f"{reference['seconds'] * 1000:>10.3f}" if reference else f"{'-':>10}"
+                print(f"{case.name:<58}{measurement.seconds * 1000:>12.3f}{measurement.peak_bytes / 1024:>12.1f}"
+                      f"{reference_ms}{ratio}")
+        finally:
+            get_simulation_cache.cache_clear()
+
+    if args.update or baseline is None:
+        _save_baseline(args.baseline, results)
+        print(f"Baseline gravado em {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold, args.memory_slack)
+    for name in regressions:
+        print(f"REGRESSÃO: {name}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
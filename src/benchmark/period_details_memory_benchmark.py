@@ -0,0 +1,45 @@
+"""
+Mede com tracemalloc a memória de uma lista de PeriodDetail contra o armazenamento
+colunar PeriodDetails, para horizontes diários longos.
+
+Uso: python -m src.benchmark.period_details_memory_benchmark
+"""
+import tracemalloc
+
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+def _traced_size(factory) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    value = factory()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return after - before
+
+
+def main() -> None:
+    calculator = CompoundInterestCalculator()
+
+    print(f"{'Anos':>6}{'Períodos':>10}{'Lista (B)':>16}{'Colunar (B)':>16}{'B/período':>18}{'Redução':>10}")
+    for years in (1, 10, 30, 50):
+        investment = Investment(
+            principal=10000.0,
+            annual_rate=0.10,
+            total_periods=years * CompoundingFrequency.DAILY.value,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=15.0, frequency=CompoundingFrequency.DAILY)
+        )
+        columnar_size = _traced_size(lambda: calculator.simulate(investment, detailed=True).period_details)
+        details = calculator.simulate(investment, detailed=True).period_details
+        list_size = _traced_size(lambda: list(details))
+
+        periods = investment.total_periods
+        print(f"{years:>6}{periods:>10}{list_size:>16,}{columnar_size:>16,}"
+              f"{list_size / periods:>9.0f} / {columnar_size / periods:<6.0f}{list_size / columnar_size:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Custo de um cronograma de taxas com poucos trechos em 30 anos de capitalização diária,
+comparado com a taxa constante: resumo (forma fechada trecho a trecho) e simulação
+detalhada com tabelas de fatores de crescimento.
+
+Uso: python -m src.benchmark.rate_schedule_benchmark
+"""
+import timeit
+from dataclasses import replace
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+
+CONSTANT = Investment(
+    principal=10000.0,
+    annual_rate=0.1075,
+    total_periods=30 * CompoundingFrequency.DAILY.value,
+    compounding_frequency=CompoundingFrequency.DAILY,
+    contribution=Contribution(amount=20.0, frequency=CompoundingFrequency.DAILY)
+)
+SCHEDULED = replace(CONSTANT, rate_schedule=(
+    RateSegment(1 * 365 + 1, 0.1375),
+    RateSegment(4 * 365 + 1, 0.1),
+    RateSegment(10 * 365 + 1, 0.065),
+    RateSegment(18 * 365 + 1, 0.09),
+))
+
+
+def _per_call(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    calculator = CompoundInterestCalculator()
+    tables_calculator = CompoundInterestCalculator(growth_tables=GrowthFactorTables())
+
+    cases = [
+        ("resumo", lambda i: calculator.simulate(i), 2000),
+        ("detalhado (laço)", lambda i: calculator.simulate(i, detailed=True), 3),
+        ("detalhado (tabelas)", lambda i: tables_calculator.simulate(i, detailed=True), 20),
+    ]
+
+    print(f"{'Modo':>22}{'Constante (ms)':>16}{'Cronograma (ms)':>17}{'Razão':>8}")
+    for name, run, number in cases:
+        constant = _per_call(lambda: run(CONSTANT), number) * 1000
+        scheduled = _per_call(lambda: run(SCHEDULED), number) * 1000
+        print(f"{name:>22}{constant:>16.4f}{scheduled:>17.4f}{scheduled / constant:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
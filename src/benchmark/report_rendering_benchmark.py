@@ -0,0 +1,108 @@
+"""
+Compara a renderização de relatórios grandes (resumo e evoluções) pelo caminho do DRF, com
+FullSimulationReportSerializer e serializers equivalentes para as linhas, com o
+SimulationReportJSONRenderer nos modos formatado e cru.
+
+Uso: python -m src.benchmark.report_rendering_benchmark
+"""
+import os
+import sys
+import time
+
+sys.path.append("src/python")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework import serializers  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from src.python.application.domain.simulation_result import (  # noqa: E402
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase  # noqa: E402
+from src.python.django_project.calculator.renderers import (  # noqa: E402
+    SimulationReportJSONRenderer,
+    SimulationReportPayload
+)
+from src.python.django_project.calculator.serializers import FullSimulationReportSerializer  # noqa: E402
+
+REPEAT = 5
+
+
+class _MoneyField(serializers.FloatField):
+    def to_representation(self, value):
+        return f"{super().to_representation(value):,.2f}"
+
+
+class _MonthlySerializer(serializers.Serializer):
+    month = serializers.IntegerField()
+    initial_balance = _MoneyField()
+    final_balance = _MoneyField()
+    deposits_this_month = _MoneyField()
+    deposits_total = _MoneyField()
+    interest_this_month = _MoneyField()
+    interest_total = _MoneyField()
+
+
+class _YearlySerializer(serializers.Serializer):
+    year = serializers.IntegerField()
+    initial_balance = _MoneyField()
+    final_balance = _MoneyField()
+    deposits_this_year = _MoneyField()
+    deposits_total = _MoneyField()
+    interest_this_year = _MoneyField()
+    interest_total = _MoneyField()
+
+
+def _drf_render(report) -> bytes:
+    data = dict(FullSimulationReportSerializer(report.summary).data)
+    data["yearly_evolution"] = _YearlySerializer(report.yearly_evolution, many=True).data
+    data["monthly_evolution"] = _MonthlySerializer(report.monthly_evolution, many=True).data
+    return JSONRenderer().render(data)
+
+
+def _fast_render(report, raw: bool) -> bytes:
+    payload = SimulationReportPayload(
+        summary=report.summary,
+        yearly_evolution=report.yearly_evolution,
+        monthly_evolution=report.monthly_evolution,
+        raw=raw
+    )
+    return SimulationReportJSONRenderer().render(payload)
+
+
+def _best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    print(f"{'Linhas':>8}{'DRF (s)':>10}{'Formatado (s)':>15}{'Cru (s)':>10}{'Ganho':>8}{'Ganho cru':>11}")
+    for years in (10, 30, 50):
+        investment = Investment(
+            principal=10000.0,
+            annual_rate=0.10,
+            total_periods=years * CompoundingFrequency.DAILY.value,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=15.0, frequency=CompoundingFrequency.DAILY)
+        )
+        report = SimulateInvestmentUseCase().execute(investment)
+        rows = len(report.monthly_evolution) + len(report.yearly_evolution)
+
+        drf = _best_of(_drf_render, report)
+        formatted = _best_of(_fast_render, report, False)
+        raw = _best_of(_fast_render, report, True)
+        print(f"{rows:>8}{drf:>10.3f}{formatted:>15.3f}{raw:>10.3f}{drf / formatted:>7.1f}x{drf / raw:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
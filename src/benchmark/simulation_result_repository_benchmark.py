@@ -0,0 +1,79 @@
+"""
+Grava resumos de lotes de simulações com DjangoSimulationResultRepository num banco SQLite em
+arquivo temporário: uma inserção por resultado (save) contra save_many, que usa bulk_create.
+Também mede a leitura de cada resultado pelo índice único de investment_hash.
+
+Uso: python -m src.benchmark.simulation_result_repository_benchmark
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append("src/python")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from src.python.application.builders.lazy_simulation_report_builder import LazySimulationReportBuilder  # noqa: E402
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution  # noqa: E402
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentBatchUseCase  # noqa: E402
+from src.python.django_project.calculator.models import SimulationResultModel  # noqa: E402
+from src.python.django_project.calculator.repository import DjangoSimulationResultRepository  # noqa: E402
+
+
+def _batch_results(size: int):
+    investments = [
+        Investment(
+            principal=10000.0,
+            annual_rate=0.01 + index * 1e-6,
+            total_periods=30 * 12,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=500.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+        for index in range(size)
+    ]
+    # Os mesmos pares que SimulateInvestmentBatchUseCase entrega ao repositório
+    summaries = SimulateInvestmentBatchUseCase().execute(investments)
+    return [
+        (investment, LazySimulationReportBuilder(investment).build(summary))
+        for investment, summary in zip(investments, summaries)
+    ]
+
+
+def _timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    repository = DjangoSimulationResultRepository()
+
+    with tempfile.TemporaryDirectory() as directory:
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            print(f"{'Resultados':>10}{'Um a um':>12}{'Em lote':>12}{'Ganho':>8}{'Leitura (µs)':>15}")
+            for size in (100, 1000, 5000):
+                results = _batch_results(size)
+
+                one_by_one = _timed(lambda: [repository.save(investment, report) for investment, report in results])
+                SimulationResultModel.objects.all().delete()
+                bulk = _timed(lambda: repository.save_many(results))
+
+                lookups = _timed(lambda: [repository.get(investment) for investment, _ in results])
+                SimulationResultModel.objects.all().delete()
+
+                print(f"{size:>10}{one_by_one:>10.3f} s{bulk:>10.3f} s{one_by_one / bulk:>7.1f}x"
+                      f"{lookups / size * 1e6:>15.1f}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
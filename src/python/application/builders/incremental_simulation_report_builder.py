@@ -0,0 +1,144 @@
+import threading
+from dataclasses import replace
+from typing import List, Optional, Sequence, Tuple
+
+from src.python.application.builders.streaming_simulation_report_builder import StreamingSimulationReportBuilder
+from src.python.application.domain.full_simulation_report import FullSimulationReport, SimulationSummary
+from src.python.application.domain.lazy_evolution import LazyEvolution
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import Investment, SimulationCheckpoint
+from src.python.application.domain.year_summary import YearSummary
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+def _is_materialized(evolution: Sequence) -> bool:
+    return not isinstance(evolution, LazyEvolution) or evolution.is_loaded
+
+
+def _partial_year(year: int, rows: Sequence[MonthlySummary], previous: Optional[YearSummary]) -> YearSummary:
+    # Mesma ordem de soma do StreamingSimulationReportBuilder, para chegar aos mesmos valores
+    interest_this_year = 0.0
+    deposits_this_year = 0.0
+    for row in rows:
+        interest_this_year += row.interest_this_month
+        deposits_this_year += row.deposits_this_month
+
+    return YearSummary(
+        year=year,
+        initial_balance=previous.final_balance if previous else 0.0,
+        final_balance=rows[-1].final_balance,
+        deposits_this_year=deposits_this_year,
+        deposits_total=(previous.deposits_total if previous else 0.0) + deposits_this_year,
+        interest_this_year=interest_this_year,
+        interest_total=(previous.interest_total if previous else 0.0) + interest_this_year
+    )
+
+
+class IncrementalSimulationReportBuilder:
+    """
+    Monta o relatório de um investimento a partir do relatório já calculado para o mesmo
+    investimento com outro total_periods. Ao encurtar o prazo as linhas são reaproveitadas; ao
+    estender, a simulação continua do fim do último ano completo, com custo proporcional aos
+    períodos novos. As linhas são idênticas às de um cálculo do zero. Como em
+    LazySimulationReportBuilder, as evoluções só são montadas no primeiro acesso.
+    """
+
+    def __init__(self, investment: Investment, calculator: Optional[CompoundInterestCalculator] = None) -> None:
+        self.investment = investment
+        self.calculator = calculator or CompoundInterestCalculator()
+        self._previous: Optional[Tuple[Investment, FullSimulationReport]] = None
+        self._evolutions: Optional[Tuple[List[MonthlySummary], List[YearSummary]]] = None
+        self._lock = threading.Lock()
+
+    def can_resume(self, previous_investment: Investment, previous_report: FullSimulationReport) -> bool:
+        investment = self.investment
+        uses_growth_tables = self.calculator.uses_growth_tables
+        return (
+            investment.total_periods > 0
+            and previous_investment.total_periods > 0
+            and replace(previous_investment, total_periods=investment.total_periods) == investment
+            and _is_materialized(previous_report.monthly_evolution)
+            and _is_materialized(previous_report.yearly_evolution)
+            and len(previous_report.monthly_evolution) == previous_investment.total_periods
+            # Tabelas de fatores e laço divergem na última casa: os dois prazos precisam usar o mesmo caminho
+            and uses_growth_tables(previous_investment) == uses_growth_tables(investment)
+        )
+
+    def build(
+            self,
+            summary: SimulationSummary,
+            previous_investment: Investment,
+            previous_report: FullSimulationReport
+    ) -> Optional[FullSimulationReport]:
+        """Relatório para self.investment, ou None se o relatório anterior não puder ser reaproveitado."""
+        if not self.can_resume(previous_investment, previous_report):
+            return None
+
+        self._previous = (previous_investment, previous_report)
+        return FullSimulationReport(
+            summary=summary,
+            yearly_evolution=LazyEvolution(self._yearly),
+            monthly_evolution=LazyEvolution(self._monthly)
+        )
+
+    def _load(self) -> Tuple[List[MonthlySummary], List[YearSummary]]:
+        with self._lock:
+            if self._evolutions is None:
+                self._evolutions = self._build_evolutions(*self._previous)
+                self._previous = None
+            return self._evolutions
+
+    def _monthly(self) -> List[MonthlySummary]:
+        return self._load()[0]
+
+    def _yearly(self) -> List[YearSummary]:
+        return self._load()[1]
+
+    def _build_evolutions(self, previous_investment: Investment, previous_report: FullSimulationReport):
+        monthly = list(previous_report.monthly_evolution)
+        yearly = list(previous_report.yearly_evolution)
+        if self.investment.total_periods <= previous_investment.total_periods:
+            return self._shorten(monthly, yearly)
+        return self._extend(monthly, yearly)
+
+    def _shorten(self, monthly: List[MonthlySummary], yearly: List[YearSummary]):
+        periods = self.investment.total_periods
+        periods_per_year = self.investment.compounding_frequency.value
+        full_years, remainder = divmod(periods, periods_per_year)
+
+        monthly = monthly[:periods]
+        yearly = yearly[:full_years]
+        if remainder:
+            yearly.append(_partial_year(
+                full_years + 1,
+                monthly[full_years * periods_per_year:],
+                yearly[-1] if yearly else None
+            ))
+        return monthly, yearly
+
+    def _extend(self, monthly: List[MonthlySummary], yearly: List[YearSummary]):
+        periods_per_year = self.investment.compounding_frequency.value
+        full_years = len(monthly) // periods_per_year
+        resume_period = full_years * periods_per_year
+
+        # O último ano do relatório anterior pode estar incompleto: recomeça do fim do último ano completo
+        monthly = monthly[:resume_period]
+        yearly = yearly[:full_years]
+
+        principal = self.investment.principal
+        checkpoint = SimulationCheckpoint(period=0, balance=principal, total_invested=principal)
+        resume_from = None
+        if resume_period:
+            last_month = monthly[-1]
+            checkpoint = SimulationCheckpoint(
+                period=resume_period,
+                balance=last_month.final_balance,
+                total_invested=principal + last_month.deposits_total
+            )
+            resume_from = (last_month, yearly[-1])
+
+        new_monthly, new_yearly = StreamingSimulationReportBuilder(self.investment.compounding_frequency).build(
+            self.calculator.resume_periods(self.investment, checkpoint),
+            resume_from
+        )
+        return monthly + new_monthly, yearly + new_yearly
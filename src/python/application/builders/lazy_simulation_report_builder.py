@@ -0,0 +1,60 @@
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.builders.streaming_simulation_report_builder import StreamingSimulationReportBuilder
+from src.python.application.domain.full_simulation_report import FullSimulationReport, SimulationSummary
+from src.python.application.domain.lazy_evolution import LazyEvolution
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.domain.year_summary import YearSummary
+from src.python.application.instrumentation.stage_timer import timed
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+class LazySimulationReportBuilder:
+    """
+    Monta um FullSimulationReport cujas evoluções só são calculadas no primeiro acesso.
+    Os períodos são percorridos uma única vez, qualquer que seja a evolução acessada primeiro.
+    """
+
+    def __init__(self, investment: Investment, calculator: Optional[CompoundInterestCalculator] = None) -> None:
+        self.investment = investment
+        self.calculator = calculator or CompoundInterestCalculator()
+        self._evolutions: Optional[Tuple[List[MonthlySummary], List[YearSummary]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Tuple[List[MonthlySummary], List[YearSummary]]:
+        with self._lock:
+            if self._evolutions is None:
+                self._evolutions = self._build_evolutions()
+            return self._evolutions
+
+    @timed("evolution")
+    def _build_evolutions(self) -> Tuple[List[MonthlySummary], List[YearSummary]]:
+        frequency = self.investment.compounding_frequency
+
+        # Com tabelas de fatores a simulação detalhada é vetorizada; sem elas, uma única passada em streaming
+        if self.calculator.growth_tables is not None:
+            report_builder = SimulationReportBuilder(result=self.calculator.simulate(self.investment, detailed=True))
+            return report_builder.build_monthly_evolution(), report_builder.build_yearly_evolution(frequency)
+
+        return StreamingSimulationReportBuilder(frequency).build(self.calculator.iter_periods(self.investment))
+
+    def _monthly(self) -> List[MonthlySummary]:
+        return self._load()[0]
+
+    def _yearly(self) -> List[YearSummary]:
+        return self._load()[1]
+
+    def build(
+            self,
+            summary: SimulationSummary,
+            yearly_evolution: Optional[Sequence[YearSummary]] = None,
+            monthly_evolution: Optional[Sequence[MonthlySummary]] = None
+    ) -> FullSimulationReport:
+        return FullSimulationReport(
+            summary=summary,
+            yearly_evolution=yearly_evolution if yearly_evolution is not None else LazyEvolution(self._yearly),
+            monthly_evolution=monthly_evolution if monthly_evolution is not None else LazyEvolution(self._monthly)
+        )
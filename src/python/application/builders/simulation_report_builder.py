@@ -20,22 +20,22 @@ class SimulationReportBuilder:
         accumulated_deposits = 0.0
         previous_balance = 0.0
 
-        for detail in self.result.period_details:
+        for period, final_balance, interest_earned, contribution in self.result.period_details.rows():
             initial_balance = previous_balance
-            final_balance = detail.balance
 
-            accumulated_interest += detail.interest_earned
-            accumulated_deposits += detail.contribution
+            accumulated_interest += interest_earned
+            accumulated_deposits += contribution
 
+            # Argumentos posicionais, na ordem dos campos: uma linha por período, construção mais barata
             monthly.append(
                 MonthlySummary(
-                    month=detail.period,
-                    initial_balance=initial_balance,
-                    final_balance=final_balance,
-                    deposits_this_month=detail.contribution,
-                    deposits_total=accumulated_deposits,
-                    interest_this_month=detail.interest_earned,
-                    interest_total=accumulated_interest
+                    period,
+                    initial_balance,
+                    final_balance,
+                    contribution,
+                    accumulated_deposits,
+                    interest_earned,
+                    accumulated_interest
                 )
             )
 
@@ -49,29 +49,22 @@ class SimulationReportBuilder:
             raise ValueError("Detailed simulation required")
 
         periods_per_year = frequency.value
+        balances = self.result.period_details.balances
+        interests = self.result.period_details.interests
+        contributions = self.result.period_details.contributions
 
         years = []
         accumulated_interest = 0.0
         accumulated_deposits = 0.0
 
-        for year_index in range(0, len(self.result.period_details), periods_per_year):
-
-            year_periods = self.result.period_details[
-                year_index: year_index + periods_per_year
-            ]
-
-            if not year_periods:
-                continue
-
-            initial_balance = (
-                self.result.period_details[year_index - 1].balance
-                if year_index > 0 else 0.0
-            )
+        for year_index in range(0, len(balances), periods_per_year):
+            year_end = min(year_index + periods_per_year, len(balances))
 
-            final_balance = year_periods[-1].balance
+            initial_balance = balances[year_index - 1] if year_index > 0 else 0.0
+            final_balance = balances[year_end - 1]
 
-            interest_this_year = sum(p.interest_earned for p in year_periods)
-            deposits_this_year = sum(p.contribution for p in year_periods)
+            interest_this_year = sum(interests[year_index:year_end])
+            deposits_this_year = sum(contributions[year_index:year_end])
 
             accumulated_interest += interest_this_year
             accumulated_deposits += deposits_this_year
@@ -0,0 +1,122 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import CompoundingFrequency, PeriodDetail
+from src.python.application.domain.year_summary import YearSummary
+
+
+class StreamingSimulationReportBuilder:
+    """
+    Consome os períodos uma única vez (por exemplo, de CompoundInterestCalculator.iter_periods)
+    e emite as linhas da evolução mensal e anual ao mesmo tempo, sem guardar a lista de períodos.
+    Com resume_from (última linha mensal e última linha anual de um relatório anterior, no fim de
+    um ano completo) os acumulados continuam de onde o relatório parou.
+    """
+
+    def __init__(self, frequency: CompoundingFrequency, monthly: bool = True, yearly: bool = True) -> None:
+        self.periods_per_year = frequency.value
+        self.monthly = monthly
+        self.yearly = yearly
+
+    def stream(
+            self,
+            periods: Iterable[PeriodDetail],
+            resume_from: Optional[Tuple[MonthlySummary, YearSummary]] = None
+    ) -> Iterator[Union[MonthlySummary, YearSummary]]:
+        periods_per_year = self.periods_per_year
+
+        accumulated_interest = 0.0
+        accumulated_deposits = 0.0
+        previous_balance = 0.0
+
+        year = 0
+        year_initial_balance = 0.0
+        periods_in_year = 0
+        interest_this_year = 0.0
+        deposits_this_year = 0.0
+        year_accumulated_interest = 0.0
+        year_accumulated_deposits = 0.0
+
+        if resume_from is not None:
+            last_month, last_year = resume_from
+            accumulated_interest = last_month.interest_total
+            accumulated_deposits = last_month.deposits_total
+            previous_balance = last_month.final_balance
+
+            year = last_year.year
+            year_initial_balance = last_year.final_balance
+            year_accumulated_interest = last_year.interest_total
+            year_accumulated_deposits = last_year.deposits_total
+
+        for detail in periods:
+            if self.monthly:
+                accumulated_interest += detail.interest_earned
+                accumulated_deposits += detail.contribution
+
+                yield MonthlySummary(
+                    detail.period,
+                    previous_balance,
+                    detail.balance,
+                    detail.contribution,
+                    accumulated_deposits,
+                    detail.interest_earned,
+                    accumulated_interest
+                )
+
+            previous_balance = detail.balance
+
+            if self.yearly:
+                interest_this_year += detail.interest_earned
+                deposits_this_year += detail.contribution
+                periods_in_year += 1
+
+                if periods_in_year == periods_per_year:
+                    year += 1
+                    year_accumulated_interest += interest_this_year
+                    year_accumulated_deposits += deposits_this_year
+
+                    yield YearSummary(
+                        year=year,
+                        initial_balance=year_initial_balance,
+                        final_balance=previous_balance,
+                        deposits_this_year=deposits_this_year,
+                        deposits_total=year_accumulated_deposits,
+                        interest_this_year=interest_this_year,
+                        interest_total=year_accumulated_interest
+                    )
+
+                    year_initial_balance = previous_balance
+                    periods_in_year = 0
+                    interest_this_year = 0.0
+                    deposits_this_year = 0.0
+
+        # Último ano incompleto, se houver
+        if self.yearly and periods_in_year:
+            yield YearSummary(
+                year=year + 1,
+                initial_balance=year_initial_balance,
+                final_balance=previous_balance,
+                deposits_this_year=deposits_this_year,
+                deposits_total=year_accumulated_deposits + deposits_this_year,
+                interest_this_year=interest_this_year,
+                interest_total=year_accumulated_interest + interest_this_year
+            )
+
+    def build(
+            self,
+            periods: Iterable[PeriodDetail],
+            resume_from: Optional[Tuple[MonthlySummary, YearSummary]] = None
+    ) -> Tuple[List[MonthlySummary], List[YearSummary]]:
+        monthly = []
+        yearly = []
+
+        for row in self.stream(periods, resume_from):
+            if isinstance(row, MonthlySummary):
+                monthly.append(row)
+            else:
+                yearly.append(row)
+
+        if not monthly and not yearly:
+            raise ValueError("Detailed simulation required")
+
+        return monthly, yearly
@@ -0,0 +1,41 @@
+import hashlib
+
+from src.python.application.domain.simulation_result import Investment
+
+_KEY_VERSION = "v1"
+
+
+def _canonical_float(value: float) -> str:
+    # float.hex é exato e independente de locale; "+ 0.0" normaliza -0.0 e inteiros
+    return (float(value) + 0.0).hex()
+
+
+def _canonical_rate_schedule(investment: Investment):
+    # Sem cronograma a chave continua idêntica à da versão v1, preservando o que já está em cache
+    if not investment.rate_schedule:
+        return ()
+    return (",".join(
+        f"{int(segment.start_period)}:{_canonical_float(segment.annual_rate)}" for segment in investment.rate_schedule
+    ),)
+
+
+def canonical_investment(investment: Investment) -> str:
+    contribution = "-"
+    if investment.contribution:
+        contribution = (
+            f"{_canonical_float(investment.contribution.amount)}:{investment.contribution.frequency.name}"
+        )
+
+    return "|".join((
+        _KEY_VERSION,
+        _canonical_float(investment.principal),
+        _canonical_float(investment.annual_rate),
+        str(int(investment.total_periods)),
+        investment.compounding_frequency.name,
+        contribution,
+        *_canonical_rate_schedule(investment),
+    ))
+
+
+def investment_key(investment: Investment) -> str:
+    return hashlib.sha256(canonical_investment(investment).encode("ascii")).hexdigest()
@@ -0,0 +1,129 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Optional, Tuple
+
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.repositories.simulation_cache import SimulationCache
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
+
+
+def _is_cacheable(investment: Investment) -> bool:
+    # NaN nunca é igual a si mesmo; chaves com valores não finitos nunca seriam reencontradas
+    values = [investment.principal, investment.annual_rate]
+    if investment.contribution:
+        values.append(investment.contribution.amount)
+    values.extend(segment.annual_rate for segment in investment.rate_schedule)
+    return all(math.isfinite(value) for value in values)
+
+
+def _family(investment: Investment) -> Investment:
+    # Investimentos que só diferem no prazo pertencem à mesma família
+    return replace(investment, total_periods=0)
+
+
+class LRUSimulationCache(SimulationCache):
+    def __init__(
+            self,
+            max_size: int = 1024,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Investment, Tuple[float, FullSimulationReport]]" = OrderedDict()
+        self._families: Dict[Investment, Investment] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, investment: Investment) -> Optional[FullSimulationReport]:
+        with self._lock:
+            entry = self._entries.get(investment)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, report = entry
+            if expires_at <= self.clock():
+                self._remove(investment)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(investment)
+            self._hits += 1
+            return report
+
+    def set(self, investment: Investment, report: FullSimulationReport) -> None:
+        if not _is_cacheable(investment):
+            return
+
+        expires_at = self.clock() + self.ttl if self.ttl is not None else math.inf
+        with self._lock:
+            self._entries[investment] = (expires_at, report)
+            self._entries.move_to_end(investment)
+            self._families[_family(investment)] = investment
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def find_resumable(self, investment: Investment) -> Optional[Tuple[Investment, FullSimulationReport]]:
+        if not _is_cacheable(investment):
+            return None
+
+        with self._lock:
+            # O membro da família gravado por último, em geral o prazo anterior de um controle deslizante
+            previous = self._families.get(_family(investment))
+            if previous is None or previous == investment:
+                return None
+
+            expires_at, report = self._entries[previous]
+            if expires_at <= self.clock():
+                self._remove(previous)
+                self._expirations += 1
+                return None
+            return previous, report
+
+    def _remove(self, investment: Investment) -> None:
+        del self._entries[investment]
+        family = _family(investment)
+        if self._families.get(family) == investment:
+            del self._families[family]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._families.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size
+            )
@@ -0,0 +1,121 @@
+import struct
+from typing import List, Optional
+
+from src.python.application.builders.lazy_simulation_report_builder import LazySimulationReportBuilder
+from src.python.application.domain.full_simulation_report import FullSimulationReport, SimulationSummary
+from src.python.application.domain.lazy_evolution import LazyEvolution
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.domain.year_summary import YearSummary
+
+# Formato (little-endian):
+#   cabeçalho  B versão, B flags (bit 0 = evolução anual presente, bit 1 = evolução mensal presente)
+#   resumo     5d
+#   seções     I quantidade de linhas, seguida das linhas i6d (ano/mês e os seis valores)
+# Evoluções ainda não materializadas (LazyEvolution) não são gravadas e voltam preguiçosas na leitura.
+_VERSION = 1
+_HAS_YEARLY = 0b01
+_HAS_MONTHLY = 0b10
+
+_HEADER = struct.Struct("<BB")
+_SUMMARY = struct.Struct("<5d")
+_COUNT = struct.Struct("<I")
+_ROW = struct.Struct("<i6d")
+
+
+def _is_available(section) -> bool:
+    return not isinstance(section, LazyEvolution) or section.is_loaded
+
+
+def _encode_rows(rows, pack) -> bytes:
+    return _COUNT.pack(len(rows)) + b"".join(pack(row) for row in rows)
+
+
+def _pack_year(row: YearSummary) -> bytes:
+    return _ROW.pack(
+        row.year, row.initial_balance, row.final_balance, row.deposits_this_year,
+        row.deposits_total, row.interest_this_year, row.interest_total
+    )
+
+
+def _pack_month(row: MonthlySummary) -> bytes:
+    return _ROW.pack(
+        row.month, row.initial_balance, row.final_balance, row.deposits_this_month,
+        row.deposits_total, row.interest_this_month, row.interest_total
+    )
+
+
+def encode_report(report: FullSimulationReport) -> bytes:
+    flags = 0
+    sections = []
+
+    if _is_available(report.yearly_evolution):
+        flags |= _HAS_YEARLY
+        sections.append(_encode_rows(report.yearly_evolution, _pack_year))
+    if _is_available(report.monthly_evolution):
+        flags |= _HAS_MONTHLY
+        sections.append(_encode_rows(report.monthly_evolution, _pack_month))
+
+    summary = report.summary
+    return b"".join([
+        _HEADER.pack(_VERSION, flags),
+        _SUMMARY.pack(
+            summary.final_balance, summary.total_invested, summary.total_interest,
+            summary.total_deposits, summary.effective_annual_rate
+        ),
+        *sections,
+    ])
+
+
+def encode_yearly_evolution(report: FullSimulationReport) -> Optional[bytes]:
+    """Só a evolução anual, com o mesmo cabeçalho e linhas de encode_report; None se ainda não foi calculada."""
+    if not _is_available(report.yearly_evolution):
+        return None
+    return _HEADER.pack(_VERSION, _HAS_YEARLY) + _encode_rows(report.yearly_evolution, _pack_year)
+
+
+def _decode_rows(data: memoryview, offset: int):
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    end = offset + count * _ROW.size
+    return _ROW.iter_unpack(data[offset:end]), end
+
+
+def _decode_header(view: memoryview) -> int:
+    version, flags = _HEADER.unpack_from(view, 0)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported report encoding version: {version}")
+    return flags
+
+
+def decode_yearly_evolution(data: bytes) -> List[YearSummary]:
+    view = memoryview(data)
+    if not _decode_header(view) & _HAS_YEARLY:
+        raise ValueError("Encoded data has no yearly evolution")
+    rows, _ = _decode_rows(view, _HEADER.size)
+    return [YearSummary(*row) for row in rows]
+
+
+def decode_report(data: bytes, investment: Investment) -> FullSimulationReport:
+    view = memoryview(data)
+    flags = _decode_header(view)
+
+    offset = _HEADER.size
+    summary = SimulationSummary(*_SUMMARY.unpack_from(view, offset))
+    offset += _SUMMARY.size
+
+    yearly: Optional[List[YearSummary]] = None
+    if flags & _HAS_YEARLY:
+        rows, offset = _decode_rows(view, offset)
+        yearly = [YearSummary(*row) for row in rows]
+
+    monthly: Optional[List[MonthlySummary]] = None
+    if flags & _HAS_MONTHLY:
+        rows, offset = _decode_rows(view, offset)
+        monthly = [MonthlySummary(*row) for row in rows]
+
+    return LazySimulationReportBuilder(investment).build(
+        summary,
+        yearly_evolution=yearly,
+        monthly_evolution=monthly
+    )
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List, Optional
+
+from src.python.application.domain.simulation_result import PeriodDetail, PeriodDetails, SimulationResult
+
+
+@dataclass(frozen=True)
+class DecimalSimulationResult:
+    final_amount: Decimal
+    total_invested: Decimal
+    total_interest: Decimal
+    # PeriodDetail com campos Decimal, na ordem dos períodos
+    period_details: Optional[List[PeriodDetail]] = None
+
+    def to_simulation_result(self) -> SimulationResult:
+        """Converte para float, para uso com SimulationReportBuilder e os serializers."""
+        period_details = None
+        if self.period_details is not None:
+            period_details = PeriodDetails(first_period=1)
+            for detail in self.period_details:
+                period_details.append(float(detail.balance), float(detail.interest_earned), float(detail.contribution))
+
+        return SimulationResult(
+            final_amount=float(self.final_amount),
+            total_invested=float(self.total_invested),
+            total_interest=float(self.total_interest),
+            period_details=period_details
+        )
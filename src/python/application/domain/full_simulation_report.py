@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence
 
 from src.python.application.domain.monthly_summary import MonthlySummary
 from src.python.application.domain.year_summary import YearSummary
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationSummary:
     final_balance: float
     total_invested: float
@@ -17,5 +17,5 @@ class SimulationSummary:
 @dataclass(frozen=True)
 class FullSimulationReport:
     summary: SimulationSummary
-    yearly_evolution: List[YearSummary]
-    monthly_evolution: List[MonthlySummary]
+    yearly_evolution: Sequence[YearSummary]
+    monthly_evolution: Sequence[MonthlySummary]
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class GoalSeekVariable(Enum):
+    CONTRIBUTION_AMOUNT = "contribution_amount"
+    ANNUAL_RATE = "annual_rate"
+    TOTAL_PERIODS = "total_periods"
+
+
+class GoalSeekMethod(Enum):
+    CLOSED_FORM = "closed_form"
+    NEWTON = "newton"
+    BISECTION = "bisection"
+
+
+@dataclass(frozen=True)
+class GoalSeekResult:
+    solve_for: GoalSeekVariable
+    value: float
+    target_balance: float
+    achieved_balance: float
+    method: GoalSeekMethod
+    # Iterações do método numérico (0 para forma fechada) e simulações executadas no total
+    iterations: int
+    evaluations: int
+    converged: bool
@@ -0,0 +1,54 @@
+import threading
+from typing import Callable, Generic, Iterator, List, Optional, Sequence, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazyEvolution(Sequence[T], Generic[T]):
+    """Sequência que só executa o loader no primeiro acesso aos itens."""
+
+    def __init__(self, loader: Callable[[], List[T]]) -> None:
+        self._loader: Optional[Callable[[], List[T]]] = loader
+        self._items: Optional[List[T]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._items is not None
+
+    def load(self) -> List[T]:
+        """Executa o loader agora, se ainda não executou, e devolve os itens."""
+        return self._materialize()
+
+    def _materialize(self) -> List[T]:
+        if self._items is None:
+            with self._lock:
+                if self._items is None:
+                    self._items = self._loader()
+                    self._loader = None
+        return self._items
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._materialize())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyEvolution):
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __repr__(self) -> str:
+        if self._items is None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({self._items!r})"
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from src.python.application.domain.year_summary import YearSummary
+
+
+class RateDistribution(Enum):
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+
+
+@dataclass(frozen=True)
+class StochasticRateModel:
+    """
+    Retornos por período sorteados em torno da taxa do investimento (de Investment.annual_rate ou do
+    trecho de Investment.rate_schedule em que o período cai). A volatilidade é anual e é
+    convertida para o período por sqrt(frequência). Na lognormal, log(1 + retorno) é normal com média
+    e variância ajustadas para reproduzir a média e a volatilidade informadas.
+    """
+    annual_volatility: float
+    distribution: RateDistribution = RateDistribution.NORMAL
+    seed: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class PercentileBand:
+    percentile: float
+    # Cada campo de YearSummary é o percentil daquele campo entre os caminhos, ano a ano
+    yearly_evolution: List[YearSummary]
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    paths: int
+    percentiles: Tuple[float, ...]
+    bands: List[PercentileBand]
+
+    def band(self, percentile: float) -> PercentileBand:
+        for band in self.bands:
+            if band.percentile == percentile:
+                return band
+        raise KeyError(percentile)
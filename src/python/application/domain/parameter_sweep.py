@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.python.application.domain.simulation_result import CompoundingFrequency
+
+
+@dataclass(frozen=True)
+class SweepAxes:
+    principal: float
+    compounding_frequency: CompoundingFrequency
+    annual_rates: Tuple[float, ...]
+    total_periods: Tuple[int, ...]
+    contribution_amounts: Tuple[float, ...]
+    contribution_frequency: Optional[CompoundingFrequency] = None
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return len(self.annual_rates), len(self.total_periods), len(self.contribution_amounts)
+
+
+@dataclass(frozen=True, eq=False)
+class SweepResult:
+    axes: SweepAxes
+    # Saldos finais indexados por [taxa, horizonte, aporte]
+    final_balances: np.ndarray
+    # Total investido indexado por [horizonte, aporte]; não depende da taxa
+    total_invested: np.ndarray
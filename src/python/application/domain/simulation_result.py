@@ -1,6 +1,8 @@
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from itertools import count
+from typing import Iterator, Optional, List, Sequence, Tuple, Union, overload
 
 
 class CompoundingFrequency(Enum):
@@ -25,6 +27,13 @@ class Contribution:
     frequency: CompoundingFrequency
 
 
+@dataclass(frozen=True)
+class RateSegment:
+    # A taxa passa a valer no período start_period (numerado a partir de 1) e segue até o próximo segmento
+    start_period: int
+    annual_rate: float
+
+
 @dataclass(frozen=True)
 class Investment:
     principal: float
@@ -32,9 +41,19 @@ class Investment:
     total_periods: int
     compounding_frequency: CompoundingFrequency
     contribution: Optional[Contribution] = None
+    # Vazio: annual_rate vale para todo o horizonte. Antes do primeiro segmento também vale annual_rate
+    rate_schedule: Tuple[RateSegment, ...] = ()
 
 
 @dataclass(frozen=True)
+class SimulationCheckpoint:
+    # Estado ao fim do período informado; period == 0 é o estado inicial
+    period: int
+    balance: float
+    total_invested: float
+
+
+@dataclass(frozen=True, slots=True)
 class PeriodDetail:
     period: int
     balance: float
@@ -42,9 +61,89 @@ class PeriodDetail:
     contribution: float
 
 
+class PeriodDetails(Sequence[PeriodDetail]):
+    """
+    Armazenamento colunar dos detalhes por período: três buffers array('d') paralelos
+    (saldo, juros e aporte) e o número do primeiro período. Indexar devolve PeriodDetail;
+    rows() percorre as colunas sem criar objetos.
+    """
+
+    __slots__ = ("first_period", "balances", "interests", "contributions")
+
+    def __init__(
+            self,
+            first_period: int = 1,
+            balances: Optional[array] = None,
+            interests: Optional[array] = None,
+            contributions: Optional[array] = None
+    ) -> None:
+        self.first_period = first_period
+        self.balances = balances if balances is not None else array("d")
+        self.interests = interests if interests is not None else array("d")
+        self.contributions = contributions if contributions is not None else array("d")
+
+    def append(self, balance: float, interest_earned: float, contribution: float) -> None:
+        self.balances.append(balance)
+        self.interests.append(interest_earned)
+        self.contributions.append(contribution)
+
+    def rows(self) -> Iterator[Tuple[int, float, float, float]]:
+        return zip(count(self.first_period), self.balances, self.interests, self.contributions)
+
+    def __len__(self) -> int:
+        return len(self.balances)
+
+    @overload
+    def __getitem__(self, index: int) -> PeriodDetail: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Union["PeriodDetails", List[PeriodDetail]]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return PeriodDetails(
+                first_period=self.first_period + start,
+                balances=self.balances[start:stop],
+                interests=self.interests[start:stop],
+                contributions=self.contributions[start:stop]
+            )
+
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("period index out of range")
+        return PeriodDetail(
+            period=self.first_period + position,
+            balance=self.balances[position],
+            interest_earned=self.interests[position],
+            contribution=self.contributions[position]
+        )
+
+    def __iter__(self) -> Iterator[PeriodDetail]:
+        for period, balance, interest_earned, contribution in self.rows():
+            yield PeriodDetail(period, balance, interest_earned, contribution)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PeriodDetails):
+            return (
+                self.first_period == other.first_period
+                and self.balances == other.balances
+                and self.interests == other.interests
+                and self.contributions == other.contributions
+            )
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PeriodDetails(first_period={self.first_period}, periods={len(self)})"
+
+
 @dataclass(frozen=True)
 class SimulationResult:
     final_amount: float
     total_invested: float
     total_interest: float
-    period_details: Optional[List[PeriodDetail]] = None
+    period_details: Optional[PeriodDetails] = None
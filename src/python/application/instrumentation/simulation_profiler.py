@@ -0,0 +1,132 @@
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from src.python.application.cache.investment_key import investment_key
+from src.python.application.domain.simulation_result import Investment
+
+T = TypeVar("T")
+
+PROFILE_FORMATS = ("pstats", "collapsed")
+
+
+def investment_params(investment: Investment) -> Dict[str, object]:
+    contribution = investment.contribution
+    return {
+        "principal": investment.principal,
+        "annual_rate": investment.annual_rate,
+        "total_periods": investment.total_periods,
+        "compounding_frequency": investment.compounding_frequency.name,
+        "contribution": {
+            "amount": contribution.amount,
+            "frequency": contribution.frequency.name,
+        } if contribution else None,
+        "rate_schedule": [[segment.start_period, segment.annual_rate] for segment in investment.rate_schedule],
+    }
+
+
+def _frame_label(function: Tuple[str, int, str]) -> str:
+    filename, line, name = function
+    # Separadores do formato collapsed: ";" entre quadros e espaço antes do valor
+    return f"{os.path.basename(filename)}:{line}({name})".replace(";", "_").replace(" ", "_")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> str:
+    """
+    Converte o grafo do cProfile em linhas "chamador;função microssegundos" (formato collapsed dos
+    flame graphs). O cProfile só guarda pares chamador/chamado, então cada pilha tem dois quadros;
+    funções sem chamador aparecem sozinhas. O valor é o tempo próprio (tottime) da função.
+    """
+    lines = []
+    for function, (_, _, total_time, _, callers) in stats.stats.items():
+        label = _frame_label(function)
+        if not callers:
+            lines.append(f"{label} {round(total_time * 1e6)}")
+        for caller, caller_stats in callers.items():
+            lines.append(f"{_frame_label(caller)};{label} {round(caller_stats[2] * 1e6)}")
+    return "\n".join(sorted(lines)) + "\n"
+
+
+class SimulationProfiler:
+    """
+    Executa uma simulação sob cProfile e grava o perfil em directory, junto com um JSON com os
+    parâmetros do Investment. Para não virar vetor de abuso sob carga, no máximo um perfil é
+    capturado a cada min_interval segundos e nunca dois ao mesmo tempo; fora disso a função roda
+    sem perfil.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            min_interval: float = 60.0,
+            profile_format: str = "pstats",
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if min_interval < 0:
+            raise ValueError("min_interval must not be negative")
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"profile_format must be one of {PROFILE_FORMATS}")
+
+        self.directory = directory
+        self.min_interval = min_interval
+        self.profile_format = profile_format
+        self.clock = clock
+        self._last_started: Optional[float] = None
+        self._lock = threading.Lock()
+        self._running = threading.Lock()
+
+    def _acquire(self) -> bool:
+        if not self._running.acquire(blocking=False):
+            return False
+
+        with self._lock:
+            now = self.clock()
+            if self._last_started is not None and now - self._last_started < self.min_interval:
+                self._running.release()
+                return False
+            self._last_started = now
+        return True
+
+    def run(self, investment: Investment, func: Callable[[], T]) -> Tuple[T, Optional[str]]:
+        """Resultado de func e o caminho do perfil gravado, ou None se o limite impediu a captura."""
+        if not self._acquire():
+            return func(), None
+
+        try:
+            profile = cProfile.Profile()
+            started = time.perf_counter()
+            result = profile.runcall(func)
+            elapsed = time.perf_counter() - started
+            return result, self._write(investment, profile, elapsed)
+        finally:
+            self._running.release()
+
+    def _write(self, investment: Investment, profile: cProfile.Profile, elapsed: float) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        created_at = datetime.now(timezone.utc)
+        base = os.path.join(
+            self.directory,
+            f"{created_at:%Y%m%dT%H%M%S%f}-{investment_key(investment)[:12]}"
+        )
+
+        if self.profile_format == "pstats":
+            path = f"{base}.pstats"
+            profile.dump_stats(path)
+        else:
+            path = f"{base}.collapsed"
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(collapsed_stacks(pstats.Stats(profile)))
+
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump({
+                "investment": investment_params(investment),
+                "profile": os.path.basename(path),
+                "elapsed_seconds": elapsed,
+                "created_at": created_at.isoformat(),
+            }, file, indent=2)
+        return path
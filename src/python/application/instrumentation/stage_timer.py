@@ -0,0 +1,130 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Sequence, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# Limites superiores dos buckets, em segundos
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NOOP = nullcontext()
+
+
+class StageTimings:
+    """Duração acumulada de cada etapa de uma requisição, na ordem em que terminaram pela primeira vez."""
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+
+_current_timings: ContextVar[Optional[StageTimings]] = ContextVar("stage_timings", default=None)
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[StageTimings]:
+    """Ativa a coleta no contexto atual (thread ou tarefa asyncio) até o fim do bloco."""
+    timings = StageTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+class _StageTimer:
+    __slots__ = ("timings", "stage", "started")
+
+    def __init__(self, timings: StageTimings, stage: str) -> None:
+        self.timings = timings
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> bool:
+        self.timings.add(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+def timed_stage(stage: str) -> ContextManager[None]:
+    """
+    Mede o bloco como a etapa informada. Fora de collect_stage_timings devolve um contexto vazio
+    compartilhado: o custo é uma leitura de ContextVar.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        return _NOOP
+    return _StageTimer(timings, stage)
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Versão decorator de timed_stage."""
+    def decorate(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timings = _current_timings.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.add(stage, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+class StageHistograms:
+    """Histogramas cumulativos por etapa, no estilo Prometheus (contagem, soma e buckets "le")."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(set(buckets)) or not buckets:
+            raise ValueError("buckets must be a non-empty strictly increasing sequence")
+
+        self.buckets = tuple(buckets)
+        self._counts: Dict[str, list] = {}
+        self._sums: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.get(stage)
+            if counts is None:
+                # Um contador por bucket mais o último, para valores acima do maior limite
+                counts = self._counts[stage] = [0] * (len(self.buckets) + 1)
+                self._sums[stage] = 0.0
+            counts[index] += 1
+            self._sums[stage] += seconds
+
+    def observe_all(self, timings: StageTimings) -> None:
+        for stage, seconds in timings.durations.items():
+            self.observe(stage, seconds)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            counts = {stage: list(values) for stage, values in self._counts.items()}
+            sums = dict(self._sums)
+
+        snapshot = {}
+        for stage, values in counts.items():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip((*self.buckets, math.inf), values):
+                cumulative += count
+                buckets["+Inf" if bound == math.inf else repr(bound)] = cumulative
+            snapshot[stage] = {"count": cumulative, "sum": sums[stage], "buckets": buckets}
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
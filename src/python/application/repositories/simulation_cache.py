@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple
+
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.simulation_result import Investment
+
+
+class SimulationCache(ABC):
+    @abstractmethod
+    def get(self, investment: Investment) -> Optional[FullSimulationReport]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, investment: Investment, report: FullSimulationReport) -> None:
+        raise NotImplementedError
+
+    def find_resumable(self, investment: Investment) -> Optional[Tuple[Investment, FullSimulationReport]]:
+        """
+        Um relatório em cache do mesmo investimento com outro total_periods, para ser reaproveitado
+        por IncrementalSimulationReportBuilder. Caches que não indexam por família devolvem None.
+        """
+        return None
+
+    def get_or_compute(
+            self,
+            investment: Investment,
+            compute: Callable[[], FullSimulationReport]
+    ) -> FullSimulationReport:
+        report = self.get(investment)
+        if report is None:
+            report = compute()
+            self.set(investment, report)
+        return report
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Tuple
+
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.simulation_result import Investment
+
+
+class SimulationResultRepository(ABC):
+    @abstractmethod
+    def get(self, investment: Investment) -> Optional[FullSimulationReport]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, results: Sequence[Tuple[Investment, FullSimulationReport]]) -> None:
+        """
+        Grava os resultados que ainda não existem; os já gravados para o mesmo Investment são mantidos,
+        mas recebem a evolução anual do novo relatório quando ela está carregada.
+        """
+        raise NotImplementedError
+
+    def save(self, investment: Investment, report: FullSimulationReport) -> None:
+        self.save_many([(investment, report)])
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.python.application.domain.simulation_result import Investment, SimulationResult
+from src.python.application.service.compound_interest_calculator import (
+    _MAX_LOG_GROWTH,
+    CompoundInterestCalculator,
+    _convert_annual_rate_to_period_rate,
+    _has_mixed_frequency_contribution,
+    _periodic_contribution_amount,
+)
+
+
+@dataclass(frozen=True, eq=False)
+class BatchSimulationResult:
+    final_amounts: np.ndarray
+    total_invested: np.ndarray
+    total_interest: np.ndarray
+    # Matriz (investimentos x períodos); posições além do horizonte de cada linha ficam com NaN
+    balances: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.final_amounts)
+
+    def to_simulation_results(self) -> List[SimulationResult]:
+        return [
+            SimulationResult(
+                final_amount=float(final_amount),
+                total_invested=float(total_invested),
+                total_interest=float(total_interest)
+            )
+            for final_amount, total_invested, total_interest in zip(
+                self.final_amounts.tolist(),
+                self.total_invested.tolist(),
+                self.total_interest.tolist()
+            )
+        ]
+
+
+@dataclass(frozen=True, eq=False)
+class _PackedInvestments:
+    principals: np.ndarray
+    period_rates: np.ndarray
+    periods: np.ndarray
+    contributions: np.ndarray
+    mixed_contributions: np.ndarray
+    rate_schedules: np.ndarray
+
+
+def _pack(investments: Sequence[Investment]) -> _PackedInvestments:
+    return _PackedInvestments(
+        principals=np.fromiter((i.principal for i in investments), dtype=np.float64, count=len(investments)),
+        period_rates=np.fromiter(
+            (_convert_annual_rate_to_period_rate(i.annual_rate, i.compounding_frequency) for i in investments),
+            dtype=np.float64,
+            count=len(investments)
+        ),
+        periods=np.fromiter((max(i.total_periods, 0) for i in investments), dtype=np.int64, count=len(investments)),
+        contributions=np.fromiter(
+            (_periodic_contribution_amount(i) for i in investments),
+            dtype=np.float64,
+            count=len(investments)
+        ),
+        mixed_contributions=np.fromiter(
+            (_has_mixed_frequency_contribution(i) for i in investments),
+            dtype=np.bool_,
+            count=len(investments)
+        ),
+        rate_schedules=np.fromiter(
+            (bool(i.rate_schedule) for i in investments),
+            dtype=np.bool_,
+            count=len(investments)
+        ),
+    )
+
+
+def _growth_and_accumulation(period_rates: np.ndarray, periods: np.ndarray):
+    # Mesma fórmula fechada do motor escalar: (1 + r)^n e o fator da anuidade antecipada;
+    # crescimentos além do maior float ficam em inf, como em _closed_form_balance
+    log_growth = periods * np.log1p(period_rates)
+    growth_minus_one = np.full(log_growth.shape, np.inf)
+    np.expm1(log_growth, out=growth_minus_one, where=log_growth <= _MAX_LOG_GROWTH)
+    with np.errstate(over="ignore"):
+        numerator = (1 + period_rates) * growth_minus_one
+        accumulation = np.divide(
+            numerator,
+            period_rates,
+            out=np.broadcast_to(periods, numerator.shape).astype(np.float64),
+            where=period_rates != 0.0
+        )
+    return growth_minus_one + 1.0, accumulation
+
+
+def _balances_from_factors(principals, growth, contributions, accumulation) -> np.ndarray:
+    # Parcelas nulas ficam nulas mesmo com crescimento infinito (0 * inf seria nan)
+    with np.errstate(over="ignore", invalid="ignore"):
+        principal_part = np.where(principals != 0.0, principals * growth, 0.0)
+        contribution_part = np.where(contributions != 0.0, contributions * accumulation, 0.0)
+        return principal_part + contribution_part
+
+
+class BatchCompoundInterestCalculator:
+    def __init__(self, scalar_calculator: Optional[CompoundInterestCalculator] = None) -> None:
+        self.scalar_calculator = scalar_calculator or CompoundInterestCalculator()
+
+    def simulate_many(self, investments: Sequence[Investment], with_balances: bool = False) -> BatchSimulationResult:
+        packed = _pack(investments)
+        # Taxas <= -100% por período não têm logaritmo, aportes com frequência diferente da
+        # capitalização seguem o cronograma de eventos e cronogramas de taxa são capitalizados
+        # trecho a trecho: essas linhas passam pelo motor escalar
+        supported = (packed.period_rates > -1.0) & ~packed.mixed_contributions & ~packed.rate_schedules
+        safe_rates = np.where(supported, packed.period_rates, 0.0)
+
+        growth, accumulation = _growth_and_accumulation(safe_rates, packed.periods)
+        final_amounts = _balances_from_factors(packed.principals, growth, packed.contributions, accumulation)
+        total_invested = packed.principals + packed.contributions * packed.periods
+
+        for index in np.flatnonzero(~supported).tolist():
+            scalar = self.scalar_calculator.simulate(investments[index])
+            final_amounts[index] = scalar.final_amount
+            total_invested[index] = scalar.total_invested
+
+        balances = self._balances(investments, packed, supported) if with_balances else None
+
+        return BatchSimulationResult(
+            final_amounts=final_amounts,
+            total_invested=total_invested,
+            total_interest=final_amounts - total_invested,
+            balances=balances
+        )
+
+    def _balances(
+            self,
+            investments: Sequence[Investment],
+            packed: _PackedInvestments,
+            supported: np.ndarray
+    ) -> np.ndarray:
+        max_periods = int(packed.periods.max(initial=0))
+        elapsed = np.arange(1, max_periods + 1, dtype=np.float64)
+        safe_rates = np.where(supported, packed.period_rates, 0.0)[:, np.newaxis]
+
+        # Limita o expoente ao horizonte de cada linha para não estourar nas posições que serão descartadas
+        horizons = packed.periods[:, np.newaxis]
+        growth, accumulation = _growth_and_accumulation(safe_rates, np.minimum(elapsed, horizons))
+        balances = _balances_from_factors(
+            packed.principals[:, np.newaxis],
+            growth,
+            packed.contributions[:, np.newaxis],
+            accumulation
+        )
+        balances[elapsed > horizons] = np.nan
+
+        for index in np.flatnonzero(~supported).tolist():
+            details = self.scalar_calculator.simulate(investments[index], detailed=True).period_details
+            balances[index, :len(details)] = details.balances
+
+        return balances
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Callable, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Todas as vagas do executor (em execução e na fila) estão ocupadas."""
+
+
+class BoundedSimulationExecutor:
+    """
+    Tira simulações longas do event loop, executando-as num pool com max_concurrency workers.
+    Além das que estão em execução, no máximo max_pending esperam na fila do pool; acima disso
+    run recusa na hora com ExecutorSaturatedError, para que a requisição receba 503 em vez de
+    esperar indefinidamente. A vaga só é liberada quando o trabalho termina no pool, mesmo que
+    quem aguardava tenha sido cancelado.
+    """
+
+    def __init__(
+            self,
+            max_concurrency: Optional[int] = None,
+            max_pending: int = 0,
+            executor_class: Type[Executor] = ProcessPoolExecutor
+    ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if max_pending < 0:
+            raise ValueError("max_pending must not be negative")
+
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.executor_class = executor_class
+        self._executor: Optional[Executor] = None
+        self._admitted = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_concurrency + self.max_pending
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._admitted
+
+    def _get_executor(self) -> Executor:
+        # Chamado com self._lock adquirido
+        if self._executor is None:
+            self._executor = self.executor_class(max_workers=self.max_concurrency)
+        return self._executor
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    def _submit(self, func: Callable[..., T], *args):
+        with self._lock:
+            if self._admitted >= self.capacity:
+                raise ExecutorSaturatedError(f"{self._admitted} simulations already admitted")
+            executor = self._get_executor()
+            self._admitted += 1
+
+        try:
+            future = executor.submit(partial(func, *args))
+        except BrokenProcessPool:
+            # Um worker morreu: descarta o pool para que a próxima chamada crie outro
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            self._release()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        return await asyncio.wrap_future(self._submit(func, *args))
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -1,5 +1,19 @@
+import math
+import sys
+from itertools import chain, repeat
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
 from src.python.application.domain.simulation_result import SimulationResult, CompoundingFrequency, Investment, \
-    PeriodDetail
+    PeriodDetail, PeriodDetails, SimulationCheckpoint
+from src.python.application.service.contribution_schedule import ContributionSchedule
+from src.python.application.service.growth_factor_table import GrowthFactorTables, to_column
+from src.python.application.service.rate_schedule import rate_intervals
+
+
+# Maior x com exp(x) finito; acima disso a capitalização estoura para inf, como no laço período a período
+_MAX_LOG_GROWTH = math.log(sys.float_info.max)
 
 
 def _convert_annual_rate_to_period_rate(annual_rate: float, frequency: CompoundingFrequency) -> float:
@@ -7,38 +21,132 @@ def _convert_annual_rate_to_period_rate(annual_rate: float, frequency: Compoundi
     return annual_rate / periods_per_year
 
 
+def _periodic_contribution_amount(investment: Investment) -> float:
+    if investment.contribution and investment.contribution.frequency == investment.compounding_frequency:
+        return investment.contribution.amount
+    return 0.0
+
+
+def _has_mixed_frequency_contribution(investment: Investment) -> bool:
+    return bool(investment.contribution) and investment.contribution.frequency != investment.compounding_frequency
+
+
+def _iter_contribution_amounts(investment: Investment, start: int = 1) -> Iterator[float]:
+    schedule = ContributionSchedule.for_investment(investment)
+    if schedule is None:
+        return repeat(0.0, max(investment.total_periods - start + 1, 0))
+    return schedule.iter_amounts(investment.total_periods, start)
+
+
+def _iter_period_rates(investment: Investment, start: int = 1) -> Iterator[float]:
+    periods = max(investment.total_periods, 0)
+    if not investment.rate_schedule:
+        period_rate = _convert_annual_rate_to_period_rate(investment.annual_rate, investment.compounding_frequency)
+        return repeat(period_rate, max(periods - start + 1, 0))
+    return chain.from_iterable(
+        repeat(period_rate, last - max(first, start) + 1)
+        for first, last, period_rate in rate_intervals(investment, periods)
+        if last >= start
+    )
+
+
+def _has_closed_form(investment: Investment) -> bool:
+    # A forma fechada usa log(1 + r): todas as taxas por período precisam ser maiores que -100%
+    if not investment.rate_schedule:
+        return _convert_annual_rate_to_period_rate(investment.annual_rate, investment.compounding_frequency) > -1.0
+    return all(
+        period_rate > -1.0
+        for _, _, period_rate in rate_intervals(investment, max(investment.total_periods, 0))
+    )
+
+
+def _closed_form_balance(principal: float, period_rate: float, periods: int, contribution_amount: float) -> float:
+    # Série geométrica com aporte no início de cada período (anuidade antecipada):
+    # P * (1 + r)^n + c * (1 + r) * ((1 + r)^n - 1) / r
+    if periods <= 0:
+        return principal
+    if period_rate == 0.0:
+        return principal + contribution_amount * periods
+
+    log_growth = periods * math.log1p(period_rate)
+    growth_minus_one = math.expm1(log_growth) if log_growth <= _MAX_LOG_GROWTH else math.inf
+    growth = growth_minus_one + 1.0
+    accumulation = (1 + period_rate) * growth_minus_one / period_rate
+    # Parcelas nulas ficam nulas mesmo com crescimento infinito (0 * inf seria nan)
+    principal_part = principal * growth if principal else 0.0
+    contribution_part = contribution_amount * accumulation if contribution_amount else 0.0
+    return principal_part + contribution_part
+
+
+def _event_schedule_balance(
+        principal: float,
+        period_rate: float,
+        schedule: ContributionSchedule,
+        periods: int,
+        start: int = 1
+) -> float:
+    # Capitaliza em forma fechada entre um aporte e o seguinte, do período start ao período periods,
+    # partindo do saldo principal ao fim do período start - 1: custo O(número de aportes)
+    log_growth = math.log1p(period_rate)
+    growth_by_gap: Dict[int, float] = {0: 1.0}
+
+    def growth(gap: int) -> float:
+        factor = growth_by_gap.get(gap)
+        if factor is None:
+            exponent = gap * log_growth
+            factor = growth_by_gap[gap] = math.exp(exponent) if exponent <= _MAX_LOG_GROWTH else math.inf
+        return factor
+
+    balance = principal
+    elapsed = start - 1
+    for period, amount in schedule.events(periods, start):
+        balance = (balance * growth(period - 1 - elapsed) if balance else 0.0) + amount
+        elapsed = period - 1
+    return balance * growth(periods - elapsed) if balance else 0.0
+
+
+def _segmented_balance(investment: Investment, periods: int) -> float:
+    # Cada trecho de taxa constante é capitalizado em forma fechada a partir do saldo do trecho anterior
+    schedule = None
+    if _has_mixed_frequency_contribution(investment):
+        schedule = ContributionSchedule.for_investment(investment)
+    contribution_amount = _periodic_contribution_amount(investment)
+
+    balance = investment.principal
+    for first, last, period_rate in rate_intervals(investment, periods):
+        if schedule is None:
+            balance = _closed_form_balance(balance, period_rate, last - first + 1, contribution_amount)
+        else:
+            balance = _event_schedule_balance(balance, period_rate, schedule, last, start=first)
+    return balance
+
+
 class CompoundInterestCalculator:
+    def __init__(self, growth_tables: Optional[GrowthFactorTables] = None) -> None:
+        self.growth_tables = growth_tables
+
     def simulate(self, investment: Investment, detailed: bool = False) -> SimulationResult:
-        period_rate = _convert_annual_rate_to_period_rate(
-            investment.annual_rate,
-            investment.compounding_frequency
-        )
+        if not detailed and _has_closed_form(investment):
+            return self._simulate_summary(investment)
+
+        if self._uses_growth_tables(investment, investment.total_periods):
+            return self._simulate_from_tables(investment)
 
         balance = investment.principal
         total_invested = investment.principal
-        period_details = []
+        period_details = PeriodDetails()
+        append_detail = period_details.append
 
-        for period in range(1, investment.total_periods + 1):
-
-            contribution_amount = 0.0
-            if investment.contribution:
-                if investment.contribution.frequency == investment.compounding_frequency:
-                    contribution_amount = investment.contribution.amount
-                    balance += contribution_amount
-                    total_invested += contribution_amount
+        amounts_and_rates = zip(_iter_contribution_amounts(investment), _iter_period_rates(investment))
+        for contribution_amount, period_rate in amounts_and_rates:
+            balance += contribution_amount
+            total_invested += contribution_amount
 
             interest = balance * period_rate
             balance += interest
 
             if detailed:
-                period_details.append(
-                    PeriodDetail(
-                        period=period,
-                        balance=balance,
-                        interest_earned=interest,
-                        contribution=contribution_amount
-                    )
-                )
+                append_detail(balance, interest, contribution_amount)
 
         total_interest = balance - total_invested
 
@@ -47,4 +155,151 @@ class CompoundInterestCalculator:
             total_invested=total_invested,
             total_interest=total_interest,
             period_details=period_details if detailed else None
-        )
\ No newline at end of file
+        )
+
+    def iter_periods(
+            self,
+            investment: Investment,
+            checkpoint: Optional[SimulationCheckpoint] = None
+    ) -> Iterator[PeriodDetail]:
+        """Períodos 1..total_periods, ou a partir do período seguinte ao checkpoint."""
+        start = checkpoint.period + 1 if checkpoint else 1
+        balance = checkpoint.balance if checkpoint else investment.principal
+        amounts_and_rates = zip(_iter_contribution_amounts(investment, start), _iter_period_rates(investment, start))
+
+        for period, (contribution_amount, period_rate) in enumerate(amounts_and_rates, start=start):
+            balance += contribution_amount
+            interest = balance * period_rate
+            balance += interest
+
+            yield PeriodDetail(period, balance, interest, contribution_amount)
+
+    def checkpoint(self, investment: Investment, period: int) -> SimulationCheckpoint:
+        """Estado ao fim do período informado, sem simular os períodos anteriores."""
+        schedule = ContributionSchedule.for_investment(investment)
+        return SimulationCheckpoint(
+            period=period,
+            balance=self.balance_at(investment, period),
+            total_invested=investment.principal + (schedule.total_until(period) if schedule else 0.0)
+        )
+
+    def resume_periods(self, investment: Investment, checkpoint: SimulationCheckpoint) -> Iterable[PeriodDetail]:
+        """
+        Períodos seguintes ao checkpoint com os mesmos valores de uma simulação detalhada completa:
+        com tabelas de fatores, uma janela de period_details; sem elas, o laço a partir do checkpoint.
+        """
+        if self.uses_growth_tables(investment):
+            return self._period_details_from_tables(investment, checkpoint.period + 1, investment.total_periods + 1)
+        return self.iter_periods(investment, checkpoint)
+
+    def uses_growth_tables(self, investment: Investment) -> bool:
+        return self._uses_growth_tables(investment, investment.total_periods)
+
+    def balance_at(self, investment: Investment, period: int) -> float:
+        if not 0 <= period <= investment.total_periods:
+            raise ValueError("period out of range")
+
+        period_rate = _convert_annual_rate_to_period_rate(investment.annual_rate, investment.compounding_frequency)
+        contribution_amount = _periodic_contribution_amount(investment)
+
+        if period == 0:
+            return investment.principal
+        if not _has_closed_form(investment):
+            return self.period_details(investment, period, period + 1).balances[0]
+        if investment.rate_schedule:
+            return _segmented_balance(investment, period)
+        if self._uses_growth_tables(investment, period):
+            factors = self.growth_tables.get(period_rate, investment.compounding_frequency, period)
+            return factors.balance_at(investment.principal, contribution_amount, period)
+        if _has_mixed_frequency_contribution(investment):
+            schedule = ContributionSchedule.for_investment(investment)
+            return _event_schedule_balance(investment.principal, period_rate, schedule, period)
+        return _closed_form_balance(investment.principal, period_rate, period, contribution_amount)
+
+    def period_details(self, investment: Investment, start: int, stop: int) -> PeriodDetails:
+        """Detalhes dos períodos start..stop-1 (numerados a partir de 1), sem simular os anteriores."""
+        stop = min(stop, investment.total_periods + 1)
+        start = max(start, 1)
+        if start >= stop:
+            return PeriodDetails(first_period=start)
+
+        if self._uses_growth_tables(investment, stop):
+            return self._period_details_from_tables(investment, start, stop)
+
+        return self.simulate(investment, detailed=True).period_details[start - 1:stop - 1]
+
+    def _uses_growth_tables(self, investment: Investment, periods: int) -> bool:
+        return (
+            self.growth_tables is not None
+            and self.growth_tables.supports(periods)
+            and not _has_mixed_frequency_contribution(investment)
+            and _has_closed_form(investment)
+        )
+
+    def _period_details_from_tables(self, investment: Investment, start: int, stop: int) -> PeriodDetails:
+        contribution_amount = _periodic_contribution_amount(investment)
+        frequency = investment.compounding_frequency
+
+        # Saldos ao fim dos períodos start-1..stop-1 e taxa de cada período start..stop-1, consultando
+        # a tabela de cada trecho de taxa constante a partir do saldo com que o trecho começa
+        previous_parts = [np.array([investment.principal])] if start == 1 else []
+        rate_parts = []
+        balance = investment.principal
+        for first, last, period_rate in rate_intervals(investment, stop - 1):
+            factors = self.growth_tables.get(period_rate, frequency, last - first + 1)
+            if last >= start - 1:
+                offset = max(first, start - 1) - first + 1
+                previous_parts.append(factors.balances(balance, contribution_amount, offset, last - first + 2))
+                rate_parts.append(np.full(last - max(first, start) + 1, period_rate))
+            balance = factors.balance_at(balance, contribution_amount, last - first + 1)
+
+        previous = np.concatenate(previous_parts)
+        balances = previous[1:]
+        interests = (previous[:-1] + contribution_amount) * (np.concatenate(rate_parts) if rate_parts else 0.0)
+
+        return PeriodDetails(
+            first_period=start,
+            balances=to_column(balances),
+            interests=to_column(interests),
+            contributions=to_column(np.full(len(balances), contribution_amount))
+        )
+
+    def _simulate_from_tables(self, investment: Investment) -> SimulationResult:
+        periods = max(investment.total_periods, 0)
+        contribution_amount = _periodic_contribution_amount(investment)
+
+        period_details = self._period_details_from_tables(investment, 1, periods + 1)
+        balance = period_details.balances[-1] if periods else investment.principal
+        total_invested = investment.principal + contribution_amount * periods
+
+        return SimulationResult(
+            final_amount=balance,
+            total_invested=total_invested,
+            total_interest=balance - total_invested,
+            period_details=period_details
+        )
+
+    def _simulate_summary(self, investment: Investment) -> SimulationResult:
+        periods = max(investment.total_periods, 0)
+        period_rate = _convert_annual_rate_to_period_rate(investment.annual_rate, investment.compounding_frequency)
+
+        if _has_mixed_frequency_contribution(investment):
+            schedule = ContributionSchedule.for_investment(investment)
+            if investment.rate_schedule:
+                balance = _segmented_balance(investment, periods)
+            else:
+                balance = _event_schedule_balance(investment.principal, period_rate, schedule, periods)
+            total_invested = investment.principal + schedule.total_until(periods)
+        else:
+            contribution_amount = _periodic_contribution_amount(investment)
+            if investment.rate_schedule:
+                balance = _segmented_balance(investment, periods)
+            else:
+                balance = _closed_form_balance(investment.principal, period_rate, periods, contribution_amount)
+            total_invested = investment.principal + contribution_amount * periods
+
+        return SimulationResult(
+            final_amount=balance,
+            total_invested=total_invested,
+            total_interest=balance - total_invested
+        )
@@ -0,0 +1,79 @@
+from itertools import repeat
+from typing import Iterator, Optional, Tuple
+
+from src.python.application.domain.simulation_result import Investment
+
+
+class ContributionSchedule:
+    """
+    Linha do tempo dos aportes de um investimento, medida em períodos de capitalização.
+
+    O k-ésimo aporte (k = 0, 1, ...) acontece no início do período floor(k * f / fc) + 1, onde f é o
+    número de capitalizações por ano e fc o número de aportes por ano. Assim, até o fim do período n
+    foram feitos ceil(n * fc / f) aportes. Quando as frequências coincidem há exatamente um aporte por
+    período; aportes mais frequentes que a capitalização são somados dentro do mesmo período.
+    """
+
+    __slots__ = ("amount", "periods_per_year", "contributions_per_year")
+
+    def __init__(self, amount: float, periods_per_year: int, contributions_per_year: int) -> None:
+        self.amount = amount
+        self.periods_per_year = periods_per_year
+        self.contributions_per_year = contributions_per_year
+
+    @classmethod
+    def for_investment(cls, investment: Investment) -> Optional["ContributionSchedule"]:
+        if not investment.contribution:
+            return None
+        return cls(
+            amount=investment.contribution.amount,
+            periods_per_year=investment.compounding_frequency.value,
+            contributions_per_year=investment.contribution.frequency.value
+        )
+
+    @property
+    def is_uniform(self) -> bool:
+        return self.periods_per_year == self.contributions_per_year
+
+    def deposits_until(self, period: int) -> int:
+        if period <= 0:
+            return 0
+        return -(-period * self.contributions_per_year // self.periods_per_year)
+
+    def total_until(self, period: int) -> float:
+        return self.amount * self.deposits_until(period)
+
+    def amount_for_period(self, period: int) -> float:
+        return self.amount * (self.deposits_until(period) - self.deposits_until(period - 1))
+
+    def iter_amounts(self, periods: int, start: int = 1) -> Iterator[float]:
+        """Valor aportado em cada um dos períodos start..periods."""
+        if self.is_uniform:
+            return repeat(self.amount, max(periods - start + 1, 0))
+        return self._iter_mixed_amounts(periods, start)
+
+    def _iter_mixed_amounts(self, periods: int, start: int) -> Iterator[float]:
+        amount = self.amount
+        contributions_per_year = self.contributions_per_year
+        periods_per_year = self.periods_per_year
+        previous = self.deposits_until(start - 1)
+        for period in range(start, periods + 1):
+            deposits = -(-period * contributions_per_year // periods_per_year)
+            yield amount * (deposits - previous)
+            previous = deposits
+
+    def events(self, periods: int, start: int = 1) -> Iterator[Tuple[int, float]]:
+        """
+        Pares (período, valor) apenas para os períodos start..periods que recebem aporte.
+        O custo é proporcional ao número de eventos, não ao número de períodos.
+        """
+        if self.contributions_per_year <= self.periods_per_year:
+            for deposit in range(self.deposits_until(start - 1), self.deposits_until(periods)):
+                yield deposit * self.periods_per_year // self.contributions_per_year + 1, self.amount
+            return
+
+        previous = self.deposits_until(start - 1)
+        for period in range(max(start, 1), periods + 1):
+            deposits = self.deposits_until(period)
+            yield period, self.amount * (deposits - previous)
+            previous = deposits
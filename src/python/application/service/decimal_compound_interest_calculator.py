@@ -0,0 +1,108 @@
+from decimal import Context, Decimal, ROUND_HALF_EVEN, localcontext
+from itertools import chain, repeat
+from typing import Dict, Iterator, Optional
+
+from src.python.application.domain.decimal_simulation_result import DecimalSimulationResult
+from src.python.application.domain.simulation_result import Investment, PeriodDetail
+from src.python.application.service.contribution_schedule import ContributionSchedule
+from src.python.application.service.rate_schedule import annual_rate_intervals
+
+
+def to_decimal(value: float) -> Decimal:
+    # repr dá o menor literal que identifica o float: 0.12 vira Decimal("0.12"), não a expansão binária
+    return Decimal(repr(value))
+
+
+class DecimalCompoundInterestCalculator:
+    """
+    Motor em decimal.Decimal para conciliar com extratos bancários. Os juros de cada período são
+    arredondados para places casas (centavos por padrão) com a regra informada, por exemplo
+    ROUND_HALF_EVEN (bancário) ou ROUND_HALF_UP; com places=None nada é arredondado além da precisão
+    do contexto. O contexto e o expoente de quantize são criados uma vez, no construtor.
+    """
+
+    def __init__(self, precision: int = 28, rounding: str = ROUND_HALF_EVEN, places: Optional[int] = 2) -> None:
+        if precision <= 0:
+            raise ValueError("precision must be positive")
+        if places is not None and places < 0:
+            raise ValueError("places must not be negative")
+
+        self.precision = precision
+        self.rounding = rounding
+        self.places = places
+        self.context = Context(prec=precision, rounding=rounding)
+        self._quantum = Decimal(1).scaleb(-places) if places is not None else None
+        self._period_rates: Dict[tuple, Decimal] = {}
+
+    def _round(self, value: Decimal) -> Decimal:
+        if self._quantum is None:
+            return self.context.plus(value)
+        return value.quantize(self._quantum, context=self.context)
+
+    def _period_rate(self, annual_rate: float, periods_per_year: int) -> Decimal:
+        # A taxa por período é derivada da taxa anual em decimal (0.12 / 12 = 0.01 exato)
+        key = (annual_rate, periods_per_year)
+        rate = self._period_rates.get(key)
+        if rate is None:
+            rate = self._period_rates[key] = self.context.divide(to_decimal(annual_rate), Decimal(periods_per_year))
+        return rate
+
+    def _iter_period_rates(self, investment: Investment, periods: int) -> Iterator[Decimal]:
+        periods_per_year = investment.compounding_frequency.value
+        return chain.from_iterable(
+            repeat(self._period_rate(annual_rate, periods_per_year), last - first + 1)
+            for first, last, annual_rate in annual_rate_intervals(investment, periods)
+        )
+
+    def _iter_contributions(self, investment: Investment, periods: int) -> Iterator[Decimal]:
+        schedule = ContributionSchedule.for_investment(investment)
+        if schedule is None:
+            return repeat(Decimal(0), periods)
+
+        amount = self._round(to_decimal(schedule.amount))
+        if schedule.is_uniform:
+            return repeat(amount, periods)
+        # Mais de um aporte no mesmo período soma valores já arredondados
+        deposits_until = schedule.deposits_until
+        return (amount * (deposits_until(p) - deposits_until(p - 1)) for p in range(1, periods + 1))
+
+    def simulate(self, investment: Investment, detailed: bool = False) -> DecimalSimulationResult:
+        periods = max(investment.total_periods, 0)
+        quantum = self._quantum
+
+        balance = self._round(to_decimal(investment.principal))
+        total_invested = balance
+        total_interest = Decimal(0)
+        period_details = [] if detailed else None
+
+        # Um único contexto local para todo o laço: as operações aritméticas usam precisão e
+        # arredondamento configurados sem criar contextos por iteração
+        with localcontext(self.context):
+            amounts_and_rates = zip(
+                self._iter_contributions(investment, periods),
+                self._iter_period_rates(investment, periods)
+            )
+            for period, (contribution, period_rate) in enumerate(amounts_and_rates, start=1):
+                balance += contribution
+                total_invested += contribution
+
+                interest = balance * period_rate
+                if quantum is not None:
+                    interest = interest.quantize(quantum)
+                balance += interest
+                total_interest += interest
+
+                if detailed:
+                    period_details.append(PeriodDetail(
+                        period=period,
+                        balance=balance,
+                        interest_earned=interest,
+                        contribution=contribution
+                    ))
+
+        return DecimalSimulationResult(
+            final_amount=balance,
+            total_invested=total_invested,
+            total_interest=total_interest,
+            period_details=period_details
+        )
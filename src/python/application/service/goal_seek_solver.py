@@ -0,0 +1,219 @@
+import math
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from src.python.application.domain.goal_seek import GoalSeekMethod, GoalSeekResult, GoalSeekVariable
+from src.python.application.domain.simulation_result import Contribution, Investment
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+class _Objective:
+    """Saldo final do investimento em função de uma variável, contando as simulações feitas."""
+
+    def __init__(self, calculator: CompoundInterestCalculator) -> None:
+        self.calculator = calculator
+        self.evaluations = 0
+
+    def balance(self, investment: Investment) -> float:
+        self.evaluations += 1
+        try:
+            return self.calculator.simulate(investment).final_amount
+        except OverflowError:
+            return math.inf
+
+
+class GoalSeekSolver:
+    """
+    Encontra o aporte, a taxa anual ou o número de períodos que levam o investimento ao saldo alvo.
+    O investimento informado serve de modelo: o valor da variável resolvida é ignorado (no caso da
+    taxa, é usado apenas como chute inicial).
+
+    - Aporte: o saldo é linear no aporte, então a solução é exata com duas simulações.
+    - Períodos: logaritmo da forma fechada quando o aporte acompanha a capitalização, seguido de
+      ajuste para o menor inteiro que atinge o alvo; busca binária nos demais casos.
+    - Taxa: Newton com derivada numérica, protegido por um intervalo que garante convergência
+      (passo de bisseção sempre que Newton sai do intervalo).
+    """
+
+    def __init__(
+            self,
+            calculator: Optional[CompoundInterestCalculator] = None,
+            tolerance: float = 1e-10,
+            max_iterations: int = 200,
+            max_years: int = 1000
+    ) -> None:
+        self.calculator = calculator or CompoundInterestCalculator()
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.max_years = max_years
+
+    def solve(self, investment: Investment, target_balance: float, solve_for: GoalSeekVariable) -> GoalSeekResult:
+        if not math.isfinite(target_balance):
+            raise ValueError("target_balance must be finite")
+
+        objective = _Objective(self.calculator)
+        if solve_for is GoalSeekVariable.CONTRIBUTION_AMOUNT:
+            value, method, iterations, converged = self._solve_contribution(objective, investment, target_balance)
+            solved = self._with_contribution(investment, value)
+        elif solve_for is GoalSeekVariable.TOTAL_PERIODS:
+            value, method, iterations, converged = self._solve_periods(objective, investment, target_balance)
+            solved = replace(investment, total_periods=value)
+        else:
+            value, method, iterations, converged = self._solve_rate(objective, investment, target_balance)
+            solved = replace(investment, annual_rate=value)
+
+        achieved = objective.balance(solved)
+        return GoalSeekResult(
+            solve_for=solve_for,
+            value=value,
+            target_balance=target_balance,
+            achieved_balance=achieved,
+            method=method,
+            iterations=iterations,
+            evaluations=objective.evaluations,
+            converged=converged
+        )
+
+    @staticmethod
+    def _with_contribution(investment: Investment, amount: float) -> Investment:
+        frequency = investment.contribution.frequency if investment.contribution else investment.compounding_frequency
+        return replace(investment, contribution=Contribution(amount=amount, frequency=frequency))
+
+    def _solve_contribution(
+            self,
+            objective: _Objective,
+            investment: Investment,
+            target_balance: float
+    ) -> Tuple[float, GoalSeekMethod, int, bool]:
+        # saldo(c) = saldo sem aportes + c * saldo de aportes unitários
+        without_contributions = objective.balance(replace(investment, contribution=None))
+        unit = objective.balance(self._with_contribution(replace(investment, principal=0.0), 1.0))
+
+        if without_contributions >= target_balance:
+            return 0.0, GoalSeekMethod.CLOSED_FORM, 0, True
+        if unit <= 0.0:
+            raise ValueError("target_balance cannot be reached with contributions")
+        return (target_balance - without_contributions) / unit, GoalSeekMethod.CLOSED_FORM, 0, True
+
+    def _solve_periods(
+            self,
+            objective: _Objective,
+            investment: Investment,
+            target_balance: float
+    ) -> Tuple[int, GoalSeekMethod, int, bool]:
+        def reaches(periods: int) -> bool:
+            return objective.balance(replace(investment, total_periods=periods)) >= target_balance
+
+        if investment.principal >= target_balance:
+            return 0, GoalSeekMethod.CLOSED_FORM, 0, True
+
+        max_periods = self.max_years * investment.compounding_frequency.value
+        estimate = self._estimate_periods(investment, target_balance)
+        if estimate is not None:
+            if estimate > max_periods:
+                raise ValueError("target_balance is not reached within the maximum horizon")
+            # A estimativa pode errar por um período por arredondamento; ajusta para o menor inteiro válido
+            periods, iterations = max(estimate, 1), 0
+            while not reaches(periods) and iterations < self.max_iterations:
+                periods += 1
+                iterations += 1
+            while periods > 1 and reaches(periods - 1) and iterations < self.max_iterations:
+                periods -= 1
+                iterations += 1
+            return periods, GoalSeekMethod.CLOSED_FORM, iterations, reaches(periods)
+
+        # Sem forma fechada: dobra o horizonte até atingir o alvo e faz busca binária
+        low, high, iterations = 0, 1, 0
+        while not reaches(high):
+            iterations += 1
+            if high >= max_periods:
+                raise ValueError("target_balance is not reached within the maximum horizon")
+            low, high = high, min(2 * high, max_periods)
+        while high - low > 1:
+            iterations += 1
+            middle = (low + high) // 2
+            if reaches(middle):
+                high = middle
+            else:
+                low = middle
+        return high, GoalSeekMethod.BISECTION, iterations, True
+
+    @staticmethod
+    def _estimate_periods(investment: Investment, target_balance: float):
+        contribution = investment.contribution
+        if investment.rate_schedule or (contribution and contribution.frequency != investment.compounding_frequency):
+            return None
+
+        amount = contribution.amount if contribution else 0.0
+        period_rate = investment.annual_rate / investment.compounding_frequency.value
+        if period_rate <= -1.0:
+            return None
+
+        if period_rate == 0.0:
+            if amount <= 0.0:
+                raise ValueError("target_balance cannot be reached without interest or contributions")
+            return math.ceil((target_balance - investment.principal) / amount)
+
+        # saldo(n) = (P + K) * (1 + r)^n - K, com K = c * (1 + r) / r
+        offset = amount * (1 + period_rate) / period_rate
+        ratio = (target_balance + offset) / (investment.principal + offset) if investment.principal + offset else 0.0
+        periods = math.log(ratio) / math.log1p(period_rate) if ratio > 0.0 else math.nan
+        if not math.isfinite(periods) or periods < 0:
+            raise ValueError("target_balance cannot be reached with this rate and contribution")
+        return math.ceil(periods)
+
+    def _solve_rate(
+            self,
+            objective: _Objective,
+            investment: Investment,
+            target_balance: float
+    ) -> Tuple[float, GoalSeekMethod, int, bool]:
+        if investment.total_periods <= 0:
+            raise ValueError("total_periods must be positive to solve for the rate")
+        if investment.rate_schedule:
+            raise ValueError("solving for the rate is not supported with a rate schedule")
+        contribution = investment.contribution
+        if investment.principal <= 0 and not (contribution and contribution.amount > 0):
+            raise ValueError("the balance does not depend on the rate without principal or contributions")
+
+        periods_per_year = investment.compounding_frequency.value
+
+        def gap(annual_rate: float) -> float:
+            return objective.balance(replace(investment, annual_rate=annual_rate)) - target_balance
+
+        # O saldo cresce com a taxa; o intervalo vai de quase -100% por período até uma taxa que supere o alvo
+        low = -periods_per_year * (1 - 1e-9)
+        if gap(low) > 0:
+            raise ValueError("target_balance is below the balance reachable with any rate")
+        high = 1.0
+        # "not >=" também trata NaN (saldo zero vezes um fator que estourou) como alvo não atingido
+        while not gap(high) >= 0:
+            if high > 1e6:
+                raise ValueError("target_balance cannot be reached with any rate")
+            low, high = high, 2 * high
+
+        rate = investment.annual_rate if low < investment.annual_rate < high else (low + high) / 2
+        method = GoalSeekMethod.NEWTON
+        tolerance = self.tolerance * max(1.0, abs(target_balance))
+
+        for iteration in range(1, self.max_iterations + 1):
+            value = gap(rate)
+            if abs(value) <= tolerance:
+                return rate, method, iteration, True
+
+            if value < 0:
+                low = rate
+            else:
+                high = rate
+            if high - low <= 1e-15 * max(1.0, abs(rate)):
+                return high, method, iteration, True
+
+            step = 1e-7 * max(1.0, abs(rate))
+            derivative = (gap(rate + step) - value) / step
+            candidate = rate - value / derivative if derivative > 0 and math.isfinite(derivative) else math.nan
+            if not low < candidate < high:
+                candidate = (low + high) / 2
+                method = GoalSeekMethod.BISECTION
+            rate = candidate
+
+        return rate, method, self.max_iterations, False
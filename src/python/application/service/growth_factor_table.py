@@ -0,0 +1,144 @@
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.python.application.domain.simulation_result import CompoundingFrequency
+
+
+@dataclass(frozen=True, eq=False)
+class GrowthFactors:
+    """
+    Fatores acumulados para uma taxa por período r, indexados pelo número de períodos k:
+    growth[k] = (1 + r)^k e accumulation[k] = soma de (1 + r)^j para j = 1..k
+    (saldo gerado por um aporte unitário no início de cada período).
+    """
+    period_rate: float
+    growth: np.ndarray
+    accumulation: np.ndarray
+
+    @property
+    def horizon(self) -> int:
+        return len(self.growth) - 1
+
+    # Parcelas com principal ou aporte nulo são omitidas: com fatores que estouraram para inf,
+    # 0 * inf daria nan onde o laço período a período chega a inf
+    def balance_at(self, principal: float, contribution: float, period: int) -> float:
+        with np.errstate(over="ignore"):
+            balance = principal * self.growth[period] if principal else 0.0
+            if contribution:
+                balance += contribution * self.accumulation[period]
+        return float(balance)
+
+    def balances(self, principal: float, contribution: float, start: int, stop: int) -> np.ndarray:
+        with np.errstate(over="ignore"):
+            balances = principal * self.growth[start:stop] if principal else np.zeros(stop - start)
+            if contribution:
+                balances += contribution * self.accumulation[start:stop]
+        return balances
+
+
+def _compute_factors(period_rate: float, horizon: int, previous: Optional[GrowthFactors] = None) -> GrowthFactors:
+    if previous is None:
+        previous = GrowthFactors(period_rate=period_rate, growth=np.ones(1), accumulation=np.zeros(1))
+    if horizon <= previous.horizon:
+        return previous
+
+    # Taxas altas em horizontes longos estouram para inf, como no laço período a período
+    with np.errstate(over="ignore"):
+        new_growth = previous.growth[-1] * np.cumprod(np.full(horizon - previous.horizon, 1.0 + period_rate))
+        new_accumulation = previous.accumulation[-1] + np.cumsum(new_growth)
+
+    return GrowthFactors(
+        period_rate=period_rate,
+        growth=np.concatenate((previous.growth, new_growth)),
+        accumulation=np.concatenate((previous.accumulation, new_accumulation))
+    )
+
+
+@dataclass(frozen=True)
+class GrowthFactorTableStats:
+    hits: int
+    misses: int
+    extensions: int
+    evictions: int
+    tables: int
+    cached_factors: int
+
+
+class GrowthFactorTables:
+    """
+    Cache LRU de GrowthFactors por (taxa por período, frequência). O total de fatores guardados
+    é limitado por max_cached_factors; horizontes acima de max_horizon não são tabelados.
+    """
+
+    def __init__(self, max_cached_factors: int = 1_000_000, max_horizon: int = 100 * CompoundingFrequency.DAILY.value):
+        if max_cached_factors <= 0 or max_horizon <= 0:
+            raise ValueError("max_cached_factors and max_horizon must be positive")
+
+        self.max_cached_factors = max_cached_factors
+        self.max_horizon = max_horizon
+        self._tables: "OrderedDict[Tuple[float, CompoundingFrequency], GrowthFactors]" = OrderedDict()
+        self._cached_factors = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._extensions = 0
+        self._evictions = 0
+
+    def supports(self, horizon: int) -> bool:
+        return horizon <= self.max_horizon
+
+    def get(self, period_rate: float, frequency: CompoundingFrequency, horizon: int) -> GrowthFactors:
+        if not self.supports(horizon):
+            raise ValueError(f"horizon {horizon} exceeds max_horizon {self.max_horizon}")
+
+        key = (period_rate, frequency)
+        with self._lock:
+            factors = self._tables.get(key)
+            if factors is not None and factors.horizon >= horizon:
+                self._tables.move_to_end(key)
+                self._hits += 1
+                return factors
+
+            if factors is None:
+                self._misses += 1
+            else:
+                self._extensions += 1
+                self._cached_factors -= len(factors.growth)
+                del self._tables[key]
+
+            # Cresce em dobro para amortizar extensões sucessivas do mesmo horizonte
+            target = min(max(horizon, 2 * (factors.horizon if factors else 0)), self.max_horizon)
+            factors = _compute_factors(period_rate, target, factors)
+
+            if len(factors.growth) <= self.max_cached_factors:
+                self._tables[key] = factors
+                self._cached_factors += len(factors.growth)
+                while self._cached_factors > self.max_cached_factors:
+                    _, evicted = self._tables.popitem(last=False)
+                    self._cached_factors -= len(evicted.growth)
+                    self._evictions += 1
+
+            return factors
+
+    @property
+    def stats(self) -> GrowthFactorTableStats:
+        with self._lock:
+            return GrowthFactorTableStats(
+                hits=self._hits,
+                misses=self._misses,
+                extensions=self._extensions,
+                evictions=self._evictions,
+                tables=len(self._tables),
+                cached_factors=self._cached_factors
+            )
+
+
+def to_column(values: np.ndarray) -> array:
+    column = array("d")
+    column.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return column
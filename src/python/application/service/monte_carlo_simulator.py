@@ -0,0 +1,171 @@
+import math
+from typing import List, Sequence
+
+import numpy as np
+
+from src.python.application.domain.monte_carlo import (
+    MonteCarloResult,
+    PercentileBand,
+    RateDistribution,
+    StochasticRateModel
+)
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.domain.year_summary import YearSummary
+from src.python.application.service.contribution_schedule import ContributionSchedule
+from src.python.application.service.rate_schedule import period_rates
+
+
+class MonteCarloSimulator:
+    """
+    Simula caminhos de taxa estocástica em blocos de caminhos. Cada bloco gera a matriz de retornos
+    (caminhos x períodos), percorre os períodos de forma vetorizada entre os caminhos e guarda apenas
+    o saldo no fim de cada ano. O bloco tem no máximo chunk_paths caminhos e é reduzido para que a
+    matriz de retornos caiba em max_chunk_bytes; como cada bloco sorteia caminhos inteiros, o
+    resultado não depende do tamanho do bloco. Os percentis são exatos, então os saldos de fim de
+    ano de todos os caminhos (caminhos x anos) ficam em memória até o fim.
+    """
+
+    def __init__(self, chunk_paths: int = 2048, max_chunk_bytes: int = 32 * 1024 * 1024) -> None:
+        if chunk_paths <= 0:
+            raise ValueError("chunk_paths must be positive")
+        if max_chunk_bytes <= 0:
+            raise ValueError("max_chunk_bytes must be positive")
+        self.chunk_paths = chunk_paths
+        self.max_chunk_bytes = max_chunk_bytes
+
+    def _paths_per_chunk(self, periods: int) -> int:
+        row_bytes = max(periods, 1) * np.dtype(np.float64).itemsize
+        return max(1, min(self.chunk_paths, self.max_chunk_bytes // row_bytes))
+
+    def simulate(
+            self,
+            investment: Investment,
+            model: StochasticRateModel,
+            paths: int,
+            percentiles: Sequence[float] = (5.0, 25.0, 50.0, 75.0, 95.0)
+    ) -> MonteCarloResult:
+        if paths <= 0:
+            raise ValueError("paths must be positive")
+        if model.annual_volatility < 0:
+            raise ValueError("annual_volatility must not be negative")
+        if any(not 0.0 <= p <= 100.0 for p in percentiles):
+            raise ValueError("percentiles must be between 0 and 100")
+
+        periods = max(investment.total_periods, 0)
+        periods_per_year = investment.compounding_frequency.value
+        year_ends = list(range(periods_per_year, periods + 1, periods_per_year))
+        if periods % periods_per_year:
+            year_ends.append(periods)
+
+        contributions = self._contributions(investment, periods)
+        rng = np.random.default_rng(model.seed)
+
+        year_end_balances = np.empty((paths, len(year_ends)))
+        chunk_paths = self._paths_per_chunk(periods)
+        for start in range(0, paths, chunk_paths):
+            stop = min(start + chunk_paths, paths)
+            growth = self._draw_growth(rng, investment, model, stop - start, periods)
+            self._simulate_chunk(investment.principal, contributions, growth, year_ends, year_end_balances[start:stop])
+            # Libera o bloco antes de sortear o próximo, para não manter duas matrizes vivas
+            del growth
+
+        percentiles = tuple(float(p) for p in percentiles)
+        bands = self._bands(investment.principal, contributions, year_ends, year_end_balances, percentiles)
+        return MonteCarloResult(paths=paths, percentiles=percentiles, bands=bands)
+
+    @staticmethod
+    def _contributions(investment: Investment, periods: int) -> np.ndarray:
+        schedule = ContributionSchedule.for_investment(investment)
+        if schedule is None:
+            return np.zeros(periods)
+        return np.fromiter(schedule.iter_amounts(periods), dtype=np.float64, count=periods)
+
+    @staticmethod
+    def _draw_growth(
+            rng: np.random.Generator,
+            investment: Investment,
+            model: StochasticRateModel,
+            paths: int,
+            periods: int
+    ) -> np.ndarray:
+        # Com cronograma de taxas, a média de cada período segue o trecho em que ele cai
+        mean = period_rates(investment, periods)
+        volatility = model.annual_volatility / math.sqrt(investment.compounding_frequency.value)
+
+        if model.distribution is RateDistribution.LOGNORMAL:
+            if np.any(mean <= -1.0):
+                raise ValueError("lognormal returns require a period rate above -100%")
+            log_variance = np.log1p((volatility / (1.0 + mean)) ** 2)
+            log_mean = np.log1p(mean) - log_variance / 2
+            growth = rng.normal(log_mean, np.sqrt(log_variance), size=(paths, periods))
+            return np.exp(growth, out=growth)
+
+        # Na normal, retornos abaixo de -100% significariam saldo negativo: limita à perda total
+        growth = rng.normal(1.0 + mean, volatility, size=(paths, periods))
+        return np.maximum(growth, 0.0, out=growth)
+
+    @staticmethod
+    def _simulate_chunk(
+            principal: float,
+            contributions: np.ndarray,
+            growth: np.ndarray,
+            year_ends: List[int],
+            out: np.ndarray
+    ) -> None:
+        balances = np.full(growth.shape[0], principal, dtype=np.float64)
+        year = 0
+        for period in range(growth.shape[1]):
+            balances += contributions[period]
+            balances *= growth[:, period]
+            if year < len(year_ends) and period + 1 == year_ends[year]:
+                out[:, year] = balances
+                year += 1
+
+    @staticmethod
+    def _bands(
+            principal: float,
+            contributions: np.ndarray,
+            year_ends: List[int],
+            year_end_balances: np.ndarray,
+            percentiles: Sequence[float]
+    ) -> List[PercentileBand]:
+        year_end_indexes = np.asarray(year_ends, dtype=np.int64) - 1
+        deposits_total = np.cumsum(contributions)[year_end_indexes] if year_ends else np.empty(0)
+        deposits_this_year = np.diff(deposits_total, prepend=0.0)
+
+        # Um ano por vez: as grandezas derivadas ocupam uma coluna de caminhos, não outra matriz caminhos x anos
+        shape = (len(percentiles), len(year_ends))
+        final_q, initial_q = np.empty(shape), np.empty(shape)
+        interest_year_q, interest_total_q = np.empty(shape), np.empty(shape)
+        start_balances = np.full(year_end_balances.shape[0], principal)
+        for year in range(len(year_ends)):
+            final_balances = year_end_balances[:, year]
+            final_q[:, year] = np.percentile(final_balances, percentiles)
+            # Como em SimulationReportBuilder, o saldo inicial do primeiro ano é reportado como zero
+            initial_q[:, year] = final_q[:, year - 1] if year else 0.0
+            interest_year_q[:, year] = np.percentile(
+                final_balances - start_balances - deposits_this_year[year], percentiles
+            )
+            interest_total_q[:, year] = np.percentile(
+                final_balances - principal - deposits_total[year], percentiles
+            )
+            start_balances = final_balances
+
+        return [
+            PercentileBand(
+                percentile=percentile,
+                yearly_evolution=[
+                    YearSummary(
+                        year=year + 1,
+                        initial_balance=float(initial_q[index, year]),
+                        final_balance=float(final_q[index, year]),
+                        deposits_this_year=float(deposits_this_year[year]),
+                        deposits_total=float(deposits_total[year]),
+                        interest_this_year=float(interest_year_q[index, year]),
+                        interest_total=float(interest_total_q[index, year])
+                    )
+                    for year in range(len(year_ends))
+                ]
+            )
+            for index, percentile in enumerate(percentiles)
+        ]
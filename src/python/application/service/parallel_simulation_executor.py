@@ -0,0 +1,139 @@
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import List, Optional, Sequence
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.cache.report_codec import decode_report, encode_report
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+def simulate_full_report(
+        investment: Investment,
+        calculator: Optional[CompoundInterestCalculator] = None
+) -> FullSimulationReport:
+    """
+    Relatório completo, com as evoluções mensal e anual já materializadas. O resumo vem da
+    forma fechada, como em SimulateInvestmentUseCase, para que os dois caminhos devolvam o mesmo valor.
+    """
+    calculator = calculator or CompoundInterestCalculator()
+    summary_result = calculator.simulate(investment)
+    result = calculator.simulate(investment, detailed=True)
+    builder = SimulationReportBuilder(result=result)
+
+    has_periods = bool(result.period_details)
+    return FullSimulationReport(
+        summary=builder.build_summary(summary_result, investment),
+        yearly_evolution=builder.build_yearly_evolution(investment.compounding_frequency) if has_periods else [],
+        monthly_evolution=builder.build_monthly_evolution() if has_periods else []
+    )
+
+
+def simulate_encoded_report(investment: Investment) -> bytes:
+    """simulate_full_report codificado com report_codec, para devolver o relatório de outro processo."""
+    return encode_report(simulate_full_report(investment))
+
+
+def _simulate_chunk(investments: Sequence[Investment]) -> List[bytes]:
+    # Executado nos workers: devolve os relatórios no formato binário de report_codec,
+    # bem mais barato de serializar entre processos do que as listas de dataclasses
+    calculator = CompoundInterestCalculator()
+    return [encode_report(simulate_full_report(investment, calculator)) for investment in investments]
+
+
+class ParallelSimulationExecutor:
+    """
+    Executa lotes de simulações detalhadas num ProcessPoolExecutor, dividindo o lote em blocos.
+    O pool é criado no primeiro uso e reaproveitado entre chamadas até close(). Lotes menores que
+    serial_threshold (ou max_workers == 1) são simulados no próprio processo.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            serial_threshold: int = 64,
+            chunks_per_worker: int = 4,
+            mp_context=None
+    ) -> None:
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.serial_threshold = serial_threshold
+        self.chunks_per_worker = chunks_per_worker
+        self.mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ParallelSimulationExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context)
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _is_serial(self, size: int) -> bool:
+        return self.max_workers == 1 or size < self.serial_threshold
+
+    @property
+    def workers(self) -> int:
+        return self.max_workers or os.cpu_count() or 1
+
+    def _chunk_size_for(self, size: int) -> int:
+        if self.chunk_size is not None:
+            return self.chunk_size
+        return max(1, math.ceil(size / (self.workers * self.chunks_per_worker)))
+
+    def run_encoded(self, investments: Sequence[Investment]) -> List[bytes]:
+        """Relatórios codificados com report_codec, na mesma ordem das entradas."""
+        investments = list(investments)
+        if self._is_serial(len(investments)):
+            return _simulate_chunk(investments)
+
+        pool = self._get_pool()
+        size = self._chunk_size_for(len(investments))
+        chunks = [investments[start:start + size] for start in range(0, len(investments), size)]
+
+        try:
+            return list(chain.from_iterable(pool.map(_simulate_chunk, chunks)))
+        except BrokenProcessPool:
+            # Um worker morreu: descarta o pool para que a próxima chamada crie outro
+            self._discard_pool(pool)
+            raise
+
+    def run(self, investments: Sequence[Investment]) -> List[FullSimulationReport]:
+        investments = list(investments)
+        if self._is_serial(len(investments)):
+            calculator = CompoundInterestCalculator()
+            return [simulate_full_report(investment, calculator) for investment in investments]
+
+        return [
+            decode_report(data, investment)
+            for investment, data in zip(investments, self.run_encoded(investments))
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
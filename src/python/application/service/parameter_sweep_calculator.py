@@ -0,0 +1,94 @@
+import numpy as np
+
+from src.python.application.domain.parameter_sweep import SweepAxes, SweepResult
+from src.python.application.service.contribution_schedule import ContributionSchedule
+
+
+class ParameterSweepCalculator:
+    """
+    Calcula a grade taxa x horizonte x aporte de uma só vez. O saldo final é linear no aporte:
+    saldo = P * G(taxa, n) + aporte * S(taxa, n), onde G é o fator de crescimento e S o saldo gerado
+    por aportes unitários. G e S são calculados uma vez por (taxa, horizonte) e reaproveitados para
+    todos os valores de aporte.
+    """
+
+    def sweep(self, axes: SweepAxes) -> SweepResult:
+        periods_per_year = axes.compounding_frequency.value
+        contribution_frequency = axes.contribution_frequency or axes.compounding_frequency
+
+        period_rates = np.asarray(axes.annual_rates, dtype=np.float64)[:, np.newaxis] / periods_per_year
+        horizons = np.maximum(np.asarray(axes.total_periods, dtype=np.int64), 0)
+        contributions = np.asarray(axes.contribution_amounts, dtype=np.float64)
+
+        if np.any(period_rates <= -1.0):
+            raise ValueError("annual_rate must be greater than -100% per period")
+
+        log_growth = np.log1p(period_rates)
+        # Taxas altas em horizontes longos estouram para inf, como no motor escalar
+        with np.errstate(over="ignore"):
+            growth = np.exp(horizons[np.newaxis, :] * log_growth)
+
+        schedule = ContributionSchedule(
+            amount=1.0,
+            periods_per_year=periods_per_year,
+            contributions_per_year=contribution_frequency.value
+        )
+        if schedule.is_uniform:
+            unit_balances = self._uniform_unit_balances(period_rates, horizons)
+        else:
+            unit_balances = self._scheduled_unit_balances(log_growth, horizons, schedule)
+
+        deposits = np.array([schedule.deposits_until(int(h)) for h in horizons], dtype=np.float64)
+
+        # Parcelas nulas ficam nulas mesmo com crescimento infinito (0 * inf seria nan)
+        with np.errstate(over="ignore", invalid="ignore"):
+            principal_part = axes.principal * growth[:, :, np.newaxis] if axes.principal else 0.0
+            contribution_part = np.where(
+                contributions[np.newaxis, np.newaxis, :] != 0.0,
+                unit_balances[:, :, np.newaxis] * contributions[np.newaxis, np.newaxis, :],
+                0.0
+            )
+            final_balances = principal_part + contribution_part
+        total_invested = axes.principal + deposits[:, np.newaxis] * contributions[np.newaxis, :]
+
+        return SweepResult(axes=axes, final_balances=final_balances, total_invested=total_invested)
+
+    @staticmethod
+    def _uniform_unit_balances(period_rates: np.ndarray, horizons: np.ndarray) -> np.ndarray:
+        # Anuidade antecipada: (1 + r) * ((1 + r)^n - 1) / r, ou n quando r = 0
+        with np.errstate(over="ignore"):
+            numerator = (1 + period_rates) * np.expm1(horizons[np.newaxis, :] * np.log1p(period_rates))
+            return np.divide(
+                numerator,
+                period_rates,
+                out=np.broadcast_to(horizons, numerator.shape).astype(np.float64),
+                where=period_rates != 0.0
+            )
+
+    @staticmethod
+    def _scheduled_unit_balances(
+            log_growth: np.ndarray,
+            horizons: np.ndarray,
+            schedule: ContributionSchedule
+    ) -> np.ndarray:
+        # S(n) = (1 + r)^n * soma, para cada aporte no período p <= n, de (1 + r)^(1 - p).
+        # A soma é um prefixo acumulado sobre os aportes, compartilhado por todos os horizontes.
+        # Tudo em logaritmo: (1 + r)^(1 - p) sairia 0 em horizontes longos com taxa alta, e
+        # (1 + r)^n * 0 daria nan em vez do inf do motor escalar
+        max_horizon = int(horizons.max(initial=0))
+        events = np.array(list(schedule.events(max_horizon)), dtype=np.float64).reshape(-1, 2)
+        deposit_periods = events[:, 0]
+        deposit_amounts = events[:, 1]
+
+        with np.errstate(divide="ignore"):
+            log_amounts = np.log(deposit_amounts)
+        log_discounted = log_amounts[np.newaxis, :] + (1.0 - deposit_periods)[np.newaxis, :] * log_growth
+        log_prefix = np.concatenate(
+            (np.full((len(log_growth), 1), -np.inf), np.logaddexp.accumulate(log_discounted, axis=1)),
+            axis=1
+        )
+
+        # Quantos eventos de aporte caem em cada horizonte
+        events_until = np.searchsorted(deposit_periods, horizons, side="right")
+        with np.errstate(over="ignore"):
+            return np.exp(horizons[np.newaxis, :] * log_growth + log_prefix[:, events_until])
@@ -0,0 +1,50 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from src.python.application.domain.simulation_result import Investment
+
+# (primeiro período, último período, taxa), com períodos numerados a partir de 1
+RateInterval = Tuple[int, int, float]
+
+
+def validate_rate_schedule(investment: Investment) -> None:
+    previous = 0
+    for segment in investment.rate_schedule:
+        if segment.start_period <= previous:
+            raise ValueError("rate_schedule segments must start at period >= 1 in strictly increasing order")
+        previous = segment.start_period
+
+
+def annual_rate_intervals(investment: Investment, periods: int) -> List[RateInterval]:
+    """Como rate_intervals, mas com a taxa anual de cada trecho."""
+    validate_rate_schedule(investment)
+
+    intervals = []
+    first, annual_rate = 1, investment.annual_rate
+    for segment in investment.rate_schedule:
+        if segment.start_period > periods:
+            break
+        if segment.start_period > first:
+            intervals.append((first, segment.start_period - 1, annual_rate))
+        first, annual_rate = segment.start_period, segment.annual_rate
+    if first <= periods:
+        intervals.append((first, periods, annual_rate))
+    return intervals
+
+
+def rate_intervals(investment: Investment, periods: int) -> List[RateInterval]:
+    """Intervalos de taxa constante que cobrem os períodos 1..periods, sem intervalos vazios."""
+    periods_per_year = investment.compounding_frequency.value
+    return [
+        (first, last, annual_rate / periods_per_year)
+        for first, last, annual_rate in annual_rate_intervals(investment, periods)
+    ]
+
+
+def period_rates(investment: Investment, periods: int) -> np.ndarray:
+    """Taxa de cada um dos períodos 1..periods."""
+    rates = np.empty(max(periods, 0), dtype=np.float64)
+    for first, last, period_rate in rate_intervals(investment, periods):
+        rates[first - 1:last] = period_rate
+    return rates
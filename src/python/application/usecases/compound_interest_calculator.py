@@ -1,22 +1,201 @@
+from typing import List, Optional, Sequence
+
+from src.python.application.builders.incremental_simulation_report_builder import IncrementalSimulationReportBuilder
+from src.python.application.builders.lazy_simulation_report_builder import LazySimulationReportBuilder
 from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
-from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.full_simulation_report import FullSimulationReport, SimulationSummary
+from src.python.application.domain.goal_seek import GoalSeekResult, GoalSeekVariable
+from src.python.application.domain.lazy_evolution import LazyEvolution
+from src.python.application.domain.monte_carlo import MonteCarloResult, StochasticRateModel
+from src.python.application.domain.parameter_sweep import SweepAxes, SweepResult
 from src.python.application.domain.simulation_result import Investment
+from src.python.application.instrumentation.stage_timer import timed_stage
+from src.python.application.repositories.simulation_cache import SimulationCache
+from src.python.application.repositories.simulation_result_repository import SimulationResultRepository
+from src.python.application.service.batch_compound_interest_calculator import BatchCompoundInterestCalculator
 from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.decimal_compound_interest_calculator import DecimalCompoundInterestCalculator
+from src.python.application.service.goal_seek_solver import GoalSeekSolver
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+from src.python.application.service.monte_carlo_simulator import MonteCarloSimulator
+from src.python.application.service.parallel_simulation_executor import ParallelSimulationExecutor
+from src.python.application.service.parameter_sweep_calculator import ParameterSweepCalculator
+
+# Até este horizonte a evolução anual é barata e sempre vai para o repositório; acima dele, só se foi pedida
+PERSISTED_YEARLY_EVOLUTION_MAX_PERIODS = 50 * 12
+
+
+def _is_pending(evolution) -> bool:
+    return isinstance(evolution, LazyEvolution) and not evolution.is_loaded
+
+
+def _load_yearly_evolution(report: FullSimulationReport) -> None:
+    # Sem a evolução carregada o repositório grava só o resumo
+    if _is_pending(report.yearly_evolution):
+        report.yearly_evolution.load()
 
 
 class SimulateInvestmentUseCase:
+    def __init__(
+            self,
+            cache: Optional[SimulationCache] = None,
+            growth_tables: Optional[GrowthFactorTables] = None,
+            repository: Optional[SimulationResultRepository] = None
+    ):
+        self.cache = cache
+        self.growth_tables = growth_tables
+        self.repository = repository
 
-    def execute(self, investment: Investment) -> FullSimulationReport:
-        result = CompoundInterestCalculator().simulate(investment, detailed=True)
-        report_builder = SimulationReportBuilder(result=result)
+    def execute(self, investment: Investment, with_yearly_evolution: bool = False) -> FullSimulationReport:
+        """
+        with_yearly_evolution indica que quem chamou vai ler a evolução anual; só então, ou quando o
+        horizonte é curto, ela é calculada para ser gravada no repositório junto com o resumo.
+        """
+        if self.cache is None:
+            return self._load_or_simulate(investment, with_yearly_evolution)
+
+        return self.cache.get_or_compute(
+            investment,
+            lambda: self._load_or_simulate(investment, with_yearly_evolution)
+        )
+
+    def _load_or_simulate(self, investment: Investment, with_yearly_evolution: bool) -> FullSimulationReport:
+        if self.repository is None:
+            return self._simulate(investment)
+
+        with timed_stage("repository"):
+            report = self.repository.get(investment)
+        has_periods = investment.total_periods > 0
+        if report is not None:
+            # Uma linha só com o resumo recebe a evolução anual na primeira vez que ela é pedida
+            if not (has_periods and with_yearly_evolution and _is_pending(report.yearly_evolution)):
+                return report
+        else:
+            report = self._simulate(investment)
+
+        if has_periods and (with_yearly_evolution or investment.total_periods <= PERSISTED_YEARLY_EVOLUTION_MAX_PERIODS):
+            _load_yearly_evolution(report)
+        with timed_stage("repository"):
+            self.repository.save(investment, report)
+        return report
+
+    def _simulate(self, investment: Investment) -> FullSimulationReport:
+        calculator = CompoundInterestCalculator(growth_tables=self.growth_tables)
+        with timed_stage("calculator"):
+            result = calculator.simulate(investment)
+
+        with timed_stage("report"):
+            summary = SimulationReportBuilder(result=result).build_summary(result, investment)
+
+            report = self._resume(investment, calculator, summary)
+            if report is not None:
+                return report
+
+            return LazySimulationReportBuilder(investment, calculator).build(summary)
+
+    def _resume(
+            self,
+            investment: Investment,
+            calculator: CompoundInterestCalculator,
+            summary: SimulationSummary
+    ) -> Optional[FullSimulationReport]:
+        # Mudou só o prazo de um investimento em cache: reaproveita as evoluções já calculadas
+        if self.cache is None:
+            return None
+
+        resumable = self.cache.find_resumable(investment)
+        if resumable is None:
+            return None
+
+        previous_investment, previous_report = resumable
+        return IncrementalSimulationReportBuilder(investment, calculator).build(
+            summary, previous_investment, previous_report
+        )
+
+
+class SimulateInvestmentBatchUseCase:
+    def __init__(self, repository: Optional[SimulationResultRepository] = None):
+        self.repository = repository
 
-        monthly = report_builder.build_monthly_evolution()
-        yearly = report_builder.build_yearly_evolution(investment.compounding_frequency)
+    def execute(self, investments: Sequence[Investment]) -> List[SimulationSummary]:
+        results = BatchCompoundInterestCalculator().simulate_many(investments).to_simulation_results()
 
-        summary = report_builder.build_summary(result, investment)
+        summaries = [
+            SimulationReportBuilder(result=result).build_summary(result, investment)
+            for investment, result in zip(investments, results)
+        ]
+
+        if self.repository is not None:
+            # Só os resumos: as evoluções continuam preguiçosas e não são gravadas
+            self.repository.save_many([
+                (investment, LazySimulationReportBuilder(investment).build(summary))
+                for investment, summary in zip(investments, summaries)
+            ])
+        return summaries
+
+
+class SimulateInvestmentSweepUseCase:
+
+    def execute(self, axes: SweepAxes) -> SweepResult:
+        return ParameterSweepCalculator().sweep(axes)
+
+
+class SimulateInvestmentDetailedBatchUseCase:
+    """
+    Sem executor informado, cria um ParallelSimulationExecutor próprio, reaproveitado entre chamadas
+    de execute e encerrado em close() ou ao sair do bloco with. Um executor recebido pertence a
+    quem o passou e não é encerrado aqui.
+    """
+
+    def __init__(self, executor: Optional[ParallelSimulationExecutor] = None):
+        self._owns_executor = executor is None
+        self.executor = executor or ParallelSimulationExecutor()
+
+    def __enter__(self) -> "SimulateInvestmentDetailedBatchUseCase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def execute(self, investments: Sequence[Investment]) -> List[FullSimulationReport]:
+        return self.executor.run(investments)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.close()
+
+
+class SolveInvestmentGoalUseCase:
+
+    def execute(self, investment: Investment, target_balance: float, solve_for: GoalSeekVariable) -> GoalSeekResult:
+        return GoalSeekSolver().solve(investment, target_balance, solve_for)
+
+
+class SimulateInvestmentMonteCarloUseCase:
+
+    def execute(
+            self,
+            investment: Investment,
+            model: StochasticRateModel,
+            paths: int,
+            percentiles: Sequence[float] = (5.0, 25.0, 50.0, 75.0, 95.0)
+    ) -> MonteCarloResult:
+        return MonteCarloSimulator().simulate(investment, model, paths, percentiles)
+
+
+class SimulateInvestmentDecimalUseCase:
+    def __init__(self, calculator: Optional[DecimalCompoundInterestCalculator] = None):
+        self.calculator = calculator or DecimalCompoundInterestCalculator()
+
+    def execute(self, investment: Investment) -> FullSimulationReport:
+        result = self.calculator.simulate(investment, detailed=True).to_simulation_result()
+        report_builder = SimulationReportBuilder(result=result)
+        has_periods = bool(result.period_details)
 
         return FullSimulationReport(
-            summary=summary,
-            yearly_evolution=yearly,
-            monthly_evolution=monthly
+            summary=report_builder.build_summary(result, investment),
+            yearly_evolution=(
+                report_builder.build_yearly_evolution(investment.compounding_frequency) if has_periods else []
+            ),
+            monthly_evolution=report_builder.build_monthly_evolution() if has_periods else []
         )
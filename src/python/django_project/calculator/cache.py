@@ -0,0 +1,272 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from src.python.application.cache.investment_key import investment_key
+from src.python.application.cache.lru_simulation_cache import LRUSimulationCache
+from src.python.application.cache.report_codec import decode_report, encode_report
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.lazy_evolution import LazyEvolution
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.repositories.simulation_cache import SimulationCache
+from src.python.application.repositories.simulation_result_repository import SimulationResultRepository
+from src.python.application.instrumentation.simulation_profiler import SimulationProfiler
+from src.python.application.instrumentation.stage_timer import DEFAULT_BUCKETS, StageHistograms
+from src.python.application.service.bounded_simulation_executor import BoundedSimulationExecutor
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+from src.python.django_project.calculator.repository import DjangoSimulationResultRepository
+
+
+_EXECUTOR_CLASSES = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+def _is_pending(evolution) -> bool:
+    return isinstance(evolution, LazyEvolution) and not evolution.is_loaded
+
+
+class DjangoSimulationCache(SimulationCache):
+    """
+    Cache compartilhado entre workers através de django.core.cache. Os relatórios são gravados
+    no formato binário de report_codec. Em get_or_compute cada chave é calculada por uma única
+    requisição: dentro do processo as threads esperam num lock local, e entre processos o lock é
+    feito com cache.add; quem não obteve o lock aguarda o valor ficar disponível.
+
+    Evoluções ainda não carregadas não entram no valor gravado. Quando a requisição as carrega,
+    a entrada é regravada com as linhas, para que find_resumable possa retomar dela.
+    """
+
+    def __init__(
+            self,
+            alias: str = "default",
+            ttl: Optional[float] = None,
+            key_prefix: str = "simulation",
+            lock_timeout: float = 30.0,
+            wait_timeout: float = 10.0,
+            poll_interval: float = 0.05
+    ) -> None:
+        self.alias = alias
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._local_locks: Dict[str, List] = {}
+        self._local_locks_guard = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _key(self, investment: Investment) -> str:
+        return f"{self.key_prefix}:{investment_key(investment)}"
+
+    def _family_key(self, investment: Investment) -> str:
+        return f"{self.key_prefix}:family:{investment_key(replace(investment, total_periods=0))}"
+
+    def _store(self, backend, key: str, investment: Investment, report: FullSimulationReport) -> None:
+        backend.set_many({
+            key: encode_report(report),
+            # Prazo gravado por último para os investimentos que só diferem em total_periods
+            self._family_key(investment): investment.total_periods
+        }, self.ttl)
+
+    def _store_when_loaded(self, investment: Investment, report: FullSimulationReport) -> FullSimulationReport:
+        if not (_is_pending(report.yearly_evolution) or _is_pending(report.monthly_evolution)):
+            return report
+
+        lock = threading.Lock()
+        stored = []
+
+        def store_loaded(evolution: LazyEvolution) -> LazyEvolution:
+            def load():
+                items = list(evolution)
+                with lock:
+                    if not stored:
+                        stored.append(True)
+                        # As duas evoluções saem da mesma passada: a segunda já não custa outra simulação
+                        self.set(investment, FullSimulationReport(
+                            summary=report.summary,
+                            yearly_evolution=list(report.yearly_evolution),
+                            monthly_evolution=list(report.monthly_evolution)
+                        ))
+                return items
+            return LazyEvolution(load)
+
+        yearly, monthly = report.yearly_evolution, report.monthly_evolution
+        return FullSimulationReport(
+            summary=report.summary,
+            yearly_evolution=store_loaded(yearly) if _is_pending(yearly) else yearly,
+            monthly_evolution=store_loaded(monthly) if _is_pending(monthly) else monthly
+        )
+
+    def get(self, investment: Investment) -> Optional[FullSimulationReport]:
+        data = self.backend.get(self._key(investment))
+        if data is None:
+            return None
+        return self._store_when_loaded(investment, decode_report(data, investment))
+
+    def set(self, investment: Investment, report: FullSimulationReport) -> None:
+        self._store(self.backend, self._key(investment), investment, report)
+
+    def find_resumable(self, investment: Investment) -> Optional[Tuple[Investment, FullSimulationReport]]:
+        total_periods = self.backend.get(self._family_key(investment))
+        if total_periods is None or total_periods == investment.total_periods:
+            return None
+
+        previous = replace(investment, total_periods=total_periods)
+        report = self.get(previous)
+        return (previous, report) if report is not None else None
+
+    @contextmanager
+    def _local_lock(self, key: str) -> Iterator[None]:
+        with self._local_locks_guard:
+            entry = self._local_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._local_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._local_locks[key]
+
+    def get_or_compute(
+            self,
+            investment: Investment,
+            compute: Callable[[], FullSimulationReport]
+    ) -> FullSimulationReport:
+        backend = self.backend
+        key = self._key(investment)
+
+        data = backend.get(key)
+        if data is not None:
+            report = decode_report(data, investment)
+        else:
+            with self._local_lock(key):
+                report = self._compute_single_flight(backend, key, investment, compute)
+        return self._store_when_loaded(investment, report)
+
+    def _compute_single_flight(
+            self,
+            backend,
+            key: str,
+            investment: Investment,
+            compute: Callable[[], FullSimulationReport]
+    ) -> FullSimulationReport:
+        data = backend.get(key)
+        if data is not None:
+            return decode_report(data, investment)
+
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        if backend.add(lock_key, token, self.lock_timeout):
+            try:
+                report = compute()
+                self._store(backend, key, investment, report)
+                return report
+            finally:
+                if backend.get(lock_key) == token:
+                    backend.delete(lock_key)
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            data = backend.get(key)
+            if data is not None:
+                return decode_report(data, investment)
+            if backend.get(lock_key) is None:
+                break
+
+        # O dono do lock falhou ou demorou demais: calcula localmente sem bloquear a requisição
+        report = compute()
+        self._store(backend, key, investment, report)
+        return report
+
+
+@lru_cache(maxsize=None)
+def get_simulation_cache() -> Optional[SimulationCache]:
+    config = getattr(settings, "SIMULATION_CACHE", None) or {}
+    backend = config.get("BACKEND", "local")
+
+    if backend == "local":
+        max_size = config.get("MAX_SIZE", 0)
+        if not max_size:
+            return None
+        return LRUSimulationCache(max_size=max_size, ttl=config.get("TTL"))
+
+    if backend == "django":
+        return DjangoSimulationCache(
+            alias=config.get("ALIAS", "default"),
+            ttl=config.get("TTL"),
+            lock_timeout=config.get("LOCK_TIMEOUT", 30.0),
+            wait_timeout=config.get("WAIT_TIMEOUT", 10.0)
+        )
+
+    if backend is None:
+        return None
+
+    raise ValueError(f"Unknown SIMULATION_CACHE backend: {backend!r}")
+
+
+@lru_cache(maxsize=None)
+def get_growth_factor_tables() -> Optional[GrowthFactorTables]:
+    config = getattr(settings, "SIMULATION_GROWTH_TABLES", None) or {}
+    max_cached_factors = config.get("MAX_CACHED_FACTORS", 0)
+    if not max_cached_factors:
+        return None
+
+    return GrowthFactorTables(
+        max_cached_factors=max_cached_factors,
+        max_horizon=config.get("MAX_HORIZON", 100 * 365)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_simulation_executor() -> BoundedSimulationExecutor:
+    config = getattr(settings, "SIMULATION_ASYNC", None) or {}
+    executor = config.get("EXECUTOR", "process")
+    if executor not in _EXECUTOR_CLASSES:
+        raise ValueError(f"Unknown SIMULATION_ASYNC executor: {executor!r}")
+
+    return BoundedSimulationExecutor(
+        max_concurrency=config.get("MAX_CONCURRENCY"),
+        max_pending=config.get("MAX_PENDING", 32),
+        executor_class=_EXECUTOR_CLASSES[executor]
+    )
+
+
+@lru_cache(maxsize=None)
+def get_stage_histograms() -> StageHistograms:
+    config = getattr(settings, "SIMULATION_METRICS", None) or {}
+    return StageHistograms(buckets=config.get("BUCKETS", DEFAULT_BUCKETS))
+
+
+@lru_cache(maxsize=None)
+def get_simulation_profiler() -> Optional[SimulationProfiler]:
+    config = getattr(settings, "SIMULATION_PROFILING", None) or {}
+    if not config.get("ENABLED", False):
+        return None
+
+    return SimulationProfiler(
+        directory=str(config["DIRECTORY"]),
+        min_interval=config.get("MIN_INTERVAL", 60.0),
+        profile_format=config.get("FORMAT", "pstats")
+    )
+
+
+@lru_cache(maxsize=None)
+def get_simulation_result_repository() -> Optional[SimulationResultRepository]:
+    config = getattr(settings, "SIMULATION_PERSISTENCE", None) or {}
+    if not config.get("ENABLED", False):
+        return None
+
+    return DjangoSimulationResultRepository(batch_size=config.get("BATCH_SIZE", 500))
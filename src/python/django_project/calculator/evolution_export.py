@@ -0,0 +1,52 @@
+import csv
+import json
+import math
+from dataclasses import fields
+from typing import Iterable, Iterator, Sequence
+
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.year_summary import YearSummary
+
+MONTHLY_FIELDS = tuple(f.name for f in fields(MonthlySummary))
+YEARLY_FIELDS = tuple(f.name for f in fields(YearSummary))
+
+# Linhas agrupadas por bloco para não entregar um pedaço minúsculo por linha ao servidor
+CHUNK_ROWS = 256
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def _chunked(lines: Iterable[str]) -> Iterator[str]:
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == CHUNK_ROWS:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _finite_or_none(value):
+    # nan e ±inf não são JSON válido; viram null, como nos números crus de render_simulation_report
+    return value if math.isfinite(value) else None
+
+
+def iter_ndjson(rows: Iterable, field_names: Sequence[str]) -> Iterator[str]:
+    dumps = json.dumps
+    return _chunked(
+        dumps({name: _finite_or_none(getattr(row, name)) for name in field_names}, allow_nan=False) + "\n"
+        for row in rows
+    )
+
+
+def iter_csv(rows: Iterable, field_names: Sequence[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(field_names)
+    yield from _chunked(
+        writer.writerow([getattr(row, name) for name in field_names])
+        for row in rows
+    )
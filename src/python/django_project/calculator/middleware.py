@@ -0,0 +1,59 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from src.python.application.instrumentation.stage_timer import StageTimings, collect_stage_timings
+from src.python.django_project.calculator.cache import get_stage_histograms
+
+
+class ServerTimingMiddleware:
+    """
+    Mede as etapas (timed_stage) das requisições cujo caminho começa com PATH_PREFIX, devolve as
+    durações no cabeçalho Server-Timing e as agrega nos histogramas do endpoint de métricas.
+    Com SIMULATION_METRICS["ENABLED"] falso o Django remove o middleware da cadeia.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        config = getattr(settings, "SIMULATION_METRICS", None) or {}
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.path_prefix = config.get("PATH_PREFIX", "/api/investments/")
+        self.histograms = get_stage_histograms()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not request.path.startswith(self.path_prefix):
+            return self.get_response(request)
+
+        with collect_stage_timings() as timings:
+            started = time.perf_counter()
+            response = self.get_response(request)
+            timings.add("total", time.perf_counter() - started)
+        return self._finish(response, timings)
+
+    async def __acall__(self, request):
+        if not request.path.startswith(self.path_prefix):
+            return await self.get_response(request)
+
+        with collect_stage_timings() as timings:
+            started = time.perf_counter()
+            response = await self.get_response(request)
+            timings.add("total", time.perf_counter() - started)
+        return self._finish(response, timings)
+
+    def _finish(self, response, timings: StageTimings):
+        self.histograms.observe_all(timings)
+        response["Server-Timing"] = ", ".join(
+            f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings.durations.items()
+        )
+        return response
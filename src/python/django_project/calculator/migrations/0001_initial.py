@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimulationResultModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('investment_hash', models.CharField(max_length=64, unique=True)),
+                ('final_balance', models.FloatField()),
+                ('total_invested', models.FloatField()),
+                ('total_interest', models.FloatField()),
+                ('total_deposits', models.FloatField()),
+                ('effective_annual_rate', models.FloatField()),
+                ('yearly_evolution', models.BinaryField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'simulation_results',
+            },
+        ),
+    ]
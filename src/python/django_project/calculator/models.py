@@ -1,3 +1,20 @@
 from django.db import models
 
-# Create your models here.
+
+class SimulationResultModel(models.Model):
+    # investment_key do Investment: SHA-256 em hexadecimal da forma canônica
+    investment_hash = models.CharField(max_length=64, unique=True)
+    final_balance = models.FloatField()
+    total_invested = models.FloatField()
+    total_interest = models.FloatField()
+    total_deposits = models.FloatField()
+    effective_annual_rate = models.FloatField()
+    # Evolução anual no formato de report_codec; nula quando só o resumo foi calculado
+    yearly_evolution = models.BinaryField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'simulation_results'
+
+    def __str__(self):
+        return self.investment_hash
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
+
+from rest_framework.renderers import JSONRenderer
+
+from src.python.application.domain.full_simulation_report import SimulationSummary
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.year_summary import YearSummary
+from src.python.application.instrumentation.stage_timer import timed_stage
+from src.python.django_project.calculator.evolution_export import MONTHLY_FIELDS, YEARLY_FIELDS
+
+# Mesmos formatos de FullSimulationReportSerializer, com o método format já resolvido
+format_money = "{:,.2f}".format
+format_rate = "{:.2f}%".format
+
+
+@dataclass(frozen=True)
+class SimulationReportPayload:
+    """Dados de uma resposta de simulação, convertidos direto para JSON por SimulationReportJSONRenderer."""
+    summary: SimulationSummary
+    yearly_evolution: Optional[Sequence[YearSummary]] = None
+    monthly_evolution: Optional[Sequence[MonthlySummary]] = None
+    raw: bool = False
+
+
+def summary_representation(summary: SimulationSummary, raw: bool = False) -> Dict[str, Any]:
+    """Equivalente a FullSimulationReportSerializer(summary).data, sem passar pelos campos do DRF."""
+    if raw:
+        return {
+            "final_balance": summary.final_balance,
+            "total_invested": summary.total_invested,
+            "total_interest": summary.total_interest,
+            "total_deposits": summary.total_deposits,
+            "effective_annual_rate": summary.effective_annual_rate,
+        }
+
+    return {
+        "final_balance": format_money(summary.final_balance),
+        "total_invested": format_money(summary.total_invested),
+        "total_interest": format_money(summary.total_interest),
+        "total_deposits": format_money(summary.total_deposits),
+        "effective_annual_rate": format_rate(summary.effective_annual_rate * 100),
+    }
+
+
+class _RowEncoder:
+    """
+    Codifica linhas de evolução com um molde por linha, sem montar dicionários. O primeiro campo é
+    o número do mês ou ano; os demais são valores, formatados como "1,234.56" ou crus.
+    """
+
+    def __init__(self, field_names: Sequence[str], raw: bool) -> None:
+        index_name, *value_names = field_names
+        if raw:
+            # str de float (e de numpy.float64) é a mesma representação usada por json.dumps
+            template = "{" + ",".join([f'"{index_name}":%d'] + [f'"{name}":%s' for name in value_names]) + "}"
+            self.encode_row = template.__mod__
+        else:
+            template = "{{" + ",".join(
+                [f'"{index_name}":{{}}'] + [f'"{name}":"{{:,.2f}}"' for name in value_names]
+            ) + "}}"
+            self.encode_row = lambda values: template.format(*values)
+        self.getter = attrgetter(*field_names)
+
+    def encode(self, rows: Sequence) -> str:
+        encode_row = self.encode_row
+        getter = self.getter
+        return "[" + ",".join([encode_row(getter(row)) for row in rows]) + "]"
+
+
+_YEARLY_ENCODERS = {raw: _RowEncoder(YEARLY_FIELDS, raw) for raw in (False, True)}
+_MONTHLY_ENCODERS = {raw: _RowEncoder(MONTHLY_FIELDS, raw) for raw in (False, True)}
+
+
+def _null_non_finite(content: str) -> str:
+    # Nenhuma chave contém "nan" ou "inf"; nos valores crus essas sequências só aparecem em
+    # float("nan") e float("±inf"), que não são JSON válido e viram null
+    if "nan" in content or "inf" in content:
+        return content.replace("-inf", "null").replace("inf", "null").replace("nan", "null")
+    return content
+
+
+def render_simulation_report(payload: SimulationReportPayload) -> str:
+    summary = summary_representation(payload.summary, payload.raw)
+    parts: List[str] = [",".join(
+        f'"{name}":{value}' if payload.raw else f'"{name}":"{value}"'
+        for name, value in summary.items()
+    )]
+
+    if payload.yearly_evolution is not None:
+        rows = _YEARLY_ENCODERS[payload.raw].encode(payload.yearly_evolution)
+        parts.append(f'"yearly_evolution":{rows}')
+    if payload.monthly_evolution is not None:
+        rows = _MONTHLY_ENCODERS[payload.raw].encode(payload.monthly_evolution)
+        parts.append(f'"monthly_evolution":{rows}')
+
+    content = "{" + ",".join(parts) + "}"
+    return _null_non_finite(content) if payload.raw else content
+
+
+class SimulationReportJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer que converte SimulationReportPayload direto em JSON, com a formatação dos números
+    resolvida uma vez por molde de linha. Qualquer outro dado segue pelo JSONRenderer do DRF.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed_stage("serialization"):
+            if isinstance(data, SimulationReportPayload):
+                return render_simulation_report(data).encode()
+            return super().render(data, accepted_media_type, renderer_context)
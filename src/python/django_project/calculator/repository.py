@@ -0,0 +1,80 @@
+from typing import Optional, Sequence, Tuple
+
+from src.python.application.builders.lazy_simulation_report_builder import LazySimulationReportBuilder
+from src.python.application.cache.investment_key import investment_key
+from src.python.application.cache.report_codec import decode_yearly_evolution, encode_yearly_evolution
+from src.python.application.domain.full_simulation_report import FullSimulationReport, SimulationSummary
+from src.python.application.domain.simulation_result import Investment
+from src.python.application.repositories.simulation_result_repository import SimulationResultRepository
+from src.python.django_project.calculator.models import SimulationResultModel
+
+
+def _to_domain(model: SimulationResultModel, investment: Investment) -> FullSimulationReport:
+    summary = SimulationSummary(
+        final_balance=model.final_balance,
+        total_invested=model.total_invested,
+        total_interest=model.total_interest,
+        total_deposits=model.total_deposits,
+        effective_annual_rate=model.effective_annual_rate
+    )
+    yearly = model.yearly_evolution
+    return LazySimulationReportBuilder(investment).build(
+        summary,
+        yearly_evolution=decode_yearly_evolution(bytes(yearly)) if yearly is not None else None
+    )
+
+
+class DjangoSimulationResultRepository(SimulationResultRepository):
+    """
+    Resultados de simulação persistidos, um por Investment (pelo índice único de investment_hash).
+    A evolução mensal não é gravada e volta preguiçosa na leitura.
+    """
+
+    def __init__(
+            self,
+            simulation_result_model: type[SimulationResultModel] = SimulationResultModel,
+            batch_size: Optional[int] = 500
+    ):
+        self.simulation_result_model = simulation_result_model
+        self.batch_size = batch_size
+
+    def get(self, investment: Investment) -> Optional[FullSimulationReport]:
+        try:
+            model = self.simulation_result_model.objects.get(investment_hash=investment_key(investment))
+            return _to_domain(model, investment)
+        except self.simulation_result_model.DoesNotExist:
+            return None
+
+    def _to_model(self, investment: Investment, report: FullSimulationReport) -> SimulationResultModel:
+        summary = report.summary
+        return self.simulation_result_model(
+            investment_hash=investment_key(investment),
+            final_balance=summary.final_balance,
+            total_invested=summary.total_invested,
+            total_interest=summary.total_interest,
+            total_deposits=summary.total_deposits,
+            effective_annual_rate=summary.effective_annual_rate,
+            yearly_evolution=encode_yearly_evolution(report)
+        )
+
+    def save_many(self, results: Sequence[Tuple[Investment, FullSimulationReport]]) -> None:
+        models = [self._to_model(investment, report) for investment, report in results]
+        summary_only = [model for model in models if model.yearly_evolution is None]
+        with_yearly = [model for model in models if model.yearly_evolution is not None]
+
+        # ignore_conflicts: outro worker pode ter gravado o mesmo Investment entre a leitura e a escrita
+        if summary_only:
+            self.simulation_result_model.objects.bulk_create(
+                summary_only,
+                batch_size=self.batch_size,
+                ignore_conflicts=True
+            )
+        # Uma linha já gravada só com o resumo recebe a evolução anual; o resumo gravado é mantido
+        if with_yearly:
+            self.simulation_result_model.objects.bulk_create(
+                with_yearly,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["investment_hash"],
+                update_fields=["yearly_evolution"]
+            )
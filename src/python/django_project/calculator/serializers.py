@@ -1,24 +1,137 @@
+import math
 from typing import Optional
 
 from rest_framework import serializers
 
-from src.python.application.domain.simulation_result import CompoundingFrequency, Contribution
+from src.python.application.domain.goal_seek import GoalSeekVariable
+from src.python.application.domain.simulation_result import CompoundingFrequency, Contribution, RateSegment
+
+class FiniteFloatField(serializers.FloatField):
+    """FloatField que recusa nan e ±inf, aceitos por float() mas sem sentido numa simulação."""
+    default_error_messages = {"non_finite": "A finite number is required."}
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if not math.isfinite(value):
+            self.fail("non_finite")
+        return value
+
 
 class InvestmentQuerySerializer(serializers.Serializer):
-    principal = serializers.FloatField(required=False, default=0.0)
-    annual_rate = serializers.FloatField(required=False, default=0.0)
+    principal = FiniteFloatField(required=False, default=0.0)
+    annual_rate = FiniteFloatField(required=False, default=0.0)
     total_periods = serializers.IntegerField(required=False, default=0)
     compounding_frequency = serializers.ChoiceField(
         choices=[(c.name, c.value) for c in CompoundingFrequency],
         required=False,
         default=CompoundingFrequency.YEARLY.value
     )
-    contribution_amount = serializers.FloatField(required=False, default=0.0)
+    contribution_amount = FiniteFloatField(required=False, default=0.0)
     contribution_frequency = serializers.ChoiceField(
         choices=[(c.name, c.value) for c in CompoundingFrequency],
         required=False,
         default=CompoundingFrequency.YEARLY.value
     )
+    # Trechos "período_inicial:taxa_anual" separados por vírgula, por exemplo "13:0.10,25:0.08"
+    rate_schedule = serializers.CharField(required=False, allow_blank=True, default="")
+
+    def validate_rate_schedule(self, value):
+        segments = []
+        for item in filter(None, (part.strip() for part in value.split(","))):
+            start_period, separator, annual_rate = item.partition(":")
+            try:
+                segment = RateSegment(start_period=int(start_period), annual_rate=float(annual_rate))
+            except ValueError:
+                raise serializers.ValidationError(f"Invalid segment {item!r}, expected start_period:annual_rate")
+            if not separator or segment.start_period < 1:
+                raise serializers.ValidationError(f"Invalid segment {item!r}, expected start_period:annual_rate")
+            if not math.isfinite(segment.annual_rate):
+                raise serializers.ValidationError(f"Invalid segment {item!r}, annual_rate must be a finite number")
+            if segments and segment.start_period <= segments[-1].start_period:
+                raise serializers.ValidationError("Segments must be in strictly increasing start_period order")
+            segments.append(segment)
+        return tuple(segments)
+
+class SimulationReportQuerySerializer(InvestmentQuerySerializer):
+    evolution = serializers.ChoiceField(choices=["none", "yearly", "monthly", "all"], required=False, default="none")
+    # Números crus (float) em vez de textos formatados como "1,234.56"
+    raw = serializers.BooleanField(required=False, default=False)
+
+
+class EvolutionExportQuerySerializer(InvestmentQuerySerializer):
+    granularity = serializers.ChoiceField(choices=["monthly", "yearly"], required=False, default="yearly")
+    export_format = serializers.ChoiceField(choices=["ndjson", "csv"], required=False, default="ndjson")
+
+
+class GoalSeekQuerySerializer(InvestmentQuerySerializer):
+    target_balance = serializers.FloatField()
+    solve_for = serializers.ChoiceField(choices=[v.value for v in GoalSeekVariable])
+
+
+class SweepQuerySerializer(serializers.Serializer):
+    MAX_CELLS = 1_000_000
+
+    principal = FiniteFloatField(required=False, default=0.0)
+    compounding_frequency = serializers.ChoiceField(
+        choices=[(c.name, c.value) for c in CompoundingFrequency],
+        required=False,
+        default=CompoundingFrequency.YEARLY.value
+    )
+    contribution_frequency = serializers.ChoiceField(
+        choices=[(c.name, c.value) for c in CompoundingFrequency],
+        required=False,
+        allow_null=True,
+        default=None
+    )
+    rate_start = FiniteFloatField()
+    rate_stop = FiniteFloatField()
+    rate_steps = serializers.IntegerField(required=False, default=1, min_value=1)
+    periods_start = serializers.IntegerField(min_value=0)
+    periods_stop = serializers.IntegerField(min_value=0)
+    periods_steps = serializers.IntegerField(required=False, default=1, min_value=1)
+    contribution_start = FiniteFloatField(required=False, default=0.0)
+    contribution_stop = FiniteFloatField(required=False, default=0.0)
+    contribution_steps = serializers.IntegerField(required=False, default=1, min_value=1)
+
+    def validate(self, attrs):
+        cells = attrs["rate_steps"] * attrs["periods_steps"] * attrs["contribution_steps"]
+        if cells > self.MAX_CELLS:
+            raise serializers.ValidationError(f"The sweep grid is limited to {self.MAX_CELLS} cells, got {cells}")
+
+        periods_per_year = CompoundingFrequency(attrs["compounding_frequency"]).value
+        if min(attrs["rate_start"], attrs["rate_stop"]) <= -periods_per_year:
+            raise serializers.ValidationError("annual rates must be greater than -100% per period")
+        return attrs
+
+
+class InvestmentBatchSerializer(serializers.ListSerializer):
+    """
+    Valida uma lista de InvestmentQuerySerializer mantendo os erros por item: itens inválidos
+    aparecem em validated_data como ValidationError, sem invalidar o lote inteiro.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("child", InvestmentQuerySerializer())
+        kwargs.setdefault("allow_empty", False)
+        kwargs.setdefault("max_length", 1000)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+        if self.max_length is not None and len(data) > self.max_length:
+            self.fail("max_length", max_length=self.max_length)
+
+        items = []
+        for item in data:
+            try:
+                items.append(self.child.run_validation(item))
+            except serializers.ValidationError as exc:
+                items.append(exc)
+        return items
+
 
 class FullSimulationReportSerializer(serializers.Serializer):
     final_balance = serializers.FloatField()
@@ -1,3 +1,739 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, replace
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from src.python.application.builders.incremental_simulation_report_builder import IncrementalSimulationReportBuilder
+from src.python.application.cache.investment_key import investment_key
+from src.python.application.cache.lru_simulation_cache import LRUSimulationCache
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+from src.python.django_project.calculator.cache import (
+    DjangoSimulationCache,
+    get_async_simulation_executor,
+    get_growth_factor_tables,
+    get_simulation_cache,
+    get_simulation_profiler,
+    get_simulation_result_repository,
+    get_stage_histograms,
+)
+from src.python.django_project.calculator.models import SimulationResultModel
+from src.python.django_project.calculator.renderers import (
+    SimulationReportPayload,
+    render_simulation_report,
+    summary_representation,
+)
+from src.python.django_project.calculator.repository import DjangoSimulationResultRepository
+from src.python.django_project.calculator.serializers import FullSimulationReportSerializer
+
+INVESTMENT = Investment(
+    principal=1000.0,
+    annual_rate=0.12,
+    total_periods=24,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+    contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "simulation-tests"},
+}
+
+
+class DjangoSimulationCacheTests:
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_round_trip_through_backend(self):
+        cache = DjangoSimulationCache()
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        first = use_case.execute(INVESTMENT)
+        second = use_case.execute(INVESTMENT)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.summary, second.summary)
+        self.assertEqual(list(first.yearly_evolution), list(second.yearly_evolution))
+        self.assertIsInstance(caches["default"].get(cache._key(INVESTMENT)), bytes)
+
+    def test_find_resumable_by_family(self):
+        """O último prazo gravado do mesmo investimento é encontrado para retomada"""
+        cache = DjangoSimulationCache()
+        report = SimulateInvestmentUseCase(cache=cache).execute(INVESTMENT)
+        extended = replace(INVESTMENT, total_periods=INVESTMENT.total_periods * 2)
+
+        previous, previous_report = cache.find_resumable(extended)
+
+        self.assertEqual(previous, INVESTMENT)
+        self.assertEqual(previous_report.summary, report.summary)
+        self.assertIsNone(cache.find_resumable(INVESTMENT))
+
+    def test_extending_the_horizon_resumes_from_the_cached_report(self):
+        """Com as evoluções carregadas, a entrada é regravada e o prazo seguinte retoma dela"""
+        cache = DjangoSimulationCache()
+        use_case = SimulateInvestmentUseCase(cache=cache)
+        extended = replace(INVESTMENT, total_periods=INVESTMENT.total_periods + 12)
+
+        first = use_case.execute(INVESTMENT)
+        len(first.monthly_evolution)
+        self.assertIsInstance(cache.get(INVESTMENT).yearly_evolution, list)
+
+        with mock.patch.object(
+                IncrementalSimulationReportBuilder, "_extend", autospec=True,
+                side_effect=IncrementalSimulationReportBuilder._extend
+        ) as extend:
+            resumed = use_case.execute(extended)
+            extend.assert_not_called()
+            monthly = list(resumed.monthly_evolution)
+
+        extend.assert_called_once()
+        scratch = SimulateInvestmentUseCase().execute(extended)
+        self.assertEqual(resumed.summary, scratch.summary)
+        self.assertEqual(monthly, list(scratch.monthly_evolution))
+        self.assertEqual(list(resumed.yearly_evolution), list(scratch.yearly_evolution))
+
+    def test_single_flight_per_key(self):
+        cache = DjangoSimulationCache(poll_interval=0.01)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return SimulateInvestmentUseCase().execute(INVESTMENT)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute(INVESTMENT, compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r.summary == results[0].summary for r in results))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LocMemDjangoSimulationCacheTest(DjangoSimulationCacheTests, TestCase):
+    pass
+
+
+class FileBasedDjangoSimulationCacheTest(DjangoSimulationCacheTests, TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": self.directory.name,
+            },
+        })
+        self.settings_override.enable()
+        super().setUp()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.directory.cleanup()
+
+
+class SimulationCacheSettingsTest(TestCase):
+    def tearDown(self):
+        get_simulation_cache.cache_clear()
+
+    def _cache_for(self, config):
+        get_simulation_cache.cache_clear()
+        with override_settings(SIMULATION_CACHE=config):
+            return get_simulation_cache()
+
+    def test_backend_switch(self):
+        self.assertIsInstance(self._cache_for({"BACKEND": "local", "MAX_SIZE": 16}), LRUSimulationCache)
+        self.assertIsInstance(self._cache_for({"BACKEND": "django"}), DjangoSimulationCache)
+        self.assertIsNone(self._cache_for({"BACKEND": "local", "MAX_SIZE": 0}))
+        self.assertIsNone(self._cache_for({"BACKEND": None}))
+
+        with self.assertRaises(ValueError):
+            self._cache_for({"BACKEND": "redis"})
+
+
+class SimulateBatchEndpointTest(TestCase):
+    url = "/api/investments/simulate-batch/"
+
+    def test_returns_summaries_in_order_with_per_item_errors(self):
+        payload = [
+            {"principal": 1000, "annual_rate": 0.12, "total_periods": 12, "compounding_frequency": "MONTHLY"},
+            {"principal": "abc", "total_periods": 12},
+            {
+                "principal": 0, "annual_rate": 0.06, "total_periods": 72, "compounding_frequency": "MONTHLY",
+                "contribution_amount": 6000, "contribution_frequency": "MONTHLY"
+            },
+        ]
+
+        response = self.client.post(self.url, payload, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([item["index"] for item in body], [0, 1, 2])
+        self.assertIn("principal", body[1]["errors"])
+        self.assertNotIn("summary", body[1])
+
+        for index in (0, 2):
+            single = self.client.get("/api/investments/simulate/", payload[index])
+            self.assertEqual(body[index]["summary"], single.json())
+
+    def test_overflowing_growth_matches_single_simulation(self):
+        payload = [{"principal": 1000, "annual_rate": 20, "total_periods": 18250, "compounding_frequency": "DAILY"}]
+
+        response = self.client.post(self.url, payload, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["summary"]["final_balance"], "inf")
+
+    def test_rejects_non_list_and_empty_payloads(self):
+        for payload in ({"principal": 1000}, []):
+            response = self.client.post(self.url, payload, content_type="application/json")
+            self.assertEqual(response.status_code, 400)
+
+
+class SimulateEvolutionEndpointTest(TestCase):
+    url = "/api/investments/simulate-evolution/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 30, "compounding_frequency": "MONTHLY",
+        "contribution_amount": 100, "contribution_frequency": "MONTHLY",
+    }
+
+    def _report(self):
+        return SimulateInvestmentUseCase().execute(Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=30,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        ))
+
+    def test_streams_yearly_ndjson(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(rows, [asdict(year) for year in self._report().yearly_evolution])
+
+    def test_overflowing_ndjson_values_are_null(self):
+        params = {"principal": 1000, "annual_rate": 20, "total_periods": 18250, "compounding_frequency": "DAILY"}
+
+        response = self.client.get(self.url, params)
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(rows), 50)
+        self.assertIsInstance(rows[0]["final_balance"], float)
+        self.assertIsNone(rows[-1]["final_balance"])
+        self.assertEqual(rows[-1]["year"], 50)
+
+    def test_streams_monthly_csv(self):
+        response = self.client.get(self.url, {**self.params, "granularity": "monthly", "export_format": "csv"})
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        monthly = self._report().monthly_evolution
+        self.assertEqual(len(rows), 30)
+        self.assertEqual([int(row["month"]) for row in rows], [m.month for m in monthly])
+        self.assertEqual([float(row["final_balance"]) for row in rows], [m.final_balance for m in monthly])
+
+    def test_memory_stays_flat_for_long_daily_horizons(self):
+        params = {**self.params, "compounding_frequency": "DAILY", "granularity": "monthly"}
+        peaks = []
+        for years in (5, 50):
+            response = self.client.get(self.url, {**params, "total_periods": 365 * years})
+            tracemalloc.start()
+            for _ in response.streaming_content:
+                pass
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        self.assertLess(peaks[1], peaks[0] * 2)
+
+
+class SimulateSweepEndpointTest(TestCase):
+    url = "/api/investments/simulate-sweep/"
+    params = {
+        "principal": 1000, "compounding_frequency": "MONTHLY",
+        "rate_start": 0.0, "rate_stop": 0.12, "rate_steps": 3,
+        "periods_start": 12, "periods_stop": 36, "periods_steps": 2,
+        "contribution_start": 0, "contribution_stop": 100, "contribution_steps": 2,
+    }
+
+    def test_grid_matches_single_simulations(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["annual_rates"], [0.0, 0.06, 0.12])
+        self.assertEqual(body["total_periods"], [12, 36])
+        self.assertEqual(body["contribution_amounts"], [0.0, 100.0])
+
+        summary = SimulateInvestmentUseCase().execute(Investment(
+            principal=1000.0,
+            annual_rate=0.06,
+            total_periods=36,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        )).summary
+        self.assertAlmostEqual(body["final_balances"][1][1][1], summary.final_balance, places=6)
+        self.assertAlmostEqual(body["total_invested"][1][1], summary.total_invested, places=6)
+
+    def test_overflowing_cells_are_null(self):
+        params = {
+            **self.params, "compounding_frequency": "DAILY",
+            "rate_start": 0.12, "rate_stop": 20, "rate_steps": 2, "periods_start": 365, "periods_stop": 18250,
+        }
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+        final_balances = response.json()["final_balances"]
+        self.assertIsInstance(final_balances[0][1][1], float)
+        self.assertEqual(final_balances[1][1], [None, None])
+
+    def test_rejects_oversized_grids_and_invalid_rates(self):
+        oversized = {**self.params, "rate_steps": 1000, "periods_steps": 1000, "contribution_steps": 2}
+        invalid_rate = {**self.params, "rate_start": -12.0}
+        non_finite = [
+            {**self.params, name: value}
+            for name in ("principal", "rate_start", "rate_stop", "contribution_start", "contribution_stop")
+            for value in ("nan", "inf", "-inf")
+        ]
+
+        for params in (oversized, invalid_rate, *non_finite):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400)
+
+
+class GoalSeekEndpointTest(TestCase):
+    url = "/api/investments/goal-seek/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 120, "compounding_frequency": "MONTHLY",
+        "contribution_amount": 200, "contribution_frequency": "MONTHLY", "target_balance": 100000,
+    }
+
+    def test_solves_each_variable(self):
+        for solve_for in ("contribution_amount", "annual_rate", "total_periods"):
+            response = self.client.get(self.url, {**self.params, "solve_for": solve_for})
+
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertEqual(body["solve_for"], solve_for)
+            self.assertTrue(body["converged"])
+            self.assertGreaterEqual(body["achieved_balance"], 100000 * (1 - 1e-9))
+            self.assertIn("iterations", body)
+            self.assertIn("evaluations", body)
+
+    def test_contribution_uses_requested_frequency(self):
+        params = {**self.params, "contribution_amount": 0, "contribution_frequency": "YEARLY"}
+
+        body = self.client.get(self.url, {**params, "solve_for": "contribution_amount"}).json()
+
+        summary = SimulateInvestmentUseCase().execute(Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=120,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=body["value"], frequency=CompoundingFrequency.YEARLY)
+        )).summary
+        self.assertAlmostEqual(summary.final_balance, 100000, places=6)
+
+    def test_unreachable_target_returns_400(self):
+        params = {**self.params, "annual_rate": 0, "contribution_amount": 0, "solve_for": "total_periods"}
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("target_balance", response.json())
+
+
+class RateScheduleQueryTest(TestCase):
+    url = "/api/investments/simulate/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 24, "compounding_frequency": "MONTHLY",
+        "contribution_amount": 100, "contribution_frequency": "MONTHLY",
+    }
+
+    def test_schedule_changes_the_result(self):
+        constant = self.client.get(self.url, self.params).json()
+        scheduled = self.client.get(self.url, {**self.params, "rate_schedule": "13:0.24"}).json()
+
+        self.assertGreater(
+            float(scheduled["final_balance"].replace(",", "")),
+            float(constant["final_balance"].replace(",", ""))
+        )
+
+    def test_invalid_schedules_return_400(self):
+        for rate_schedule in ("13", "0:0.1", "13:abc", "13:0.1,13:0.2", "13:nan", "13:inf", "13:-inf", "13:1e309"):
+            response = self.client.get(self.url, {**self.params, "rate_schedule": rate_schedule})
+            self.assertEqual(response.status_code, 400, rate_schedule)
+            self.assertIn("rate_schedule", response.json())
+
+
+    def test_huge_finite_rate_does_not_fail(self):
+        for raw in ("false", "true"):
+            response = self.client.get(self.url, {**self.params, "rate_schedule": "13:1e308", "raw": raw})
+            self.assertEqual(response.status_code, 200, raw)
+
+
+class SimulationReportRenderingTest(TestCase):
+    url = "/api/investments/simulate/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 30, "compounding_frequency": "MONTHLY",
+        "contribution_amount": 100, "contribution_frequency": "MONTHLY",
+    }
+
+    def _report(self):
+        return SimulateInvestmentUseCase(growth_tables=get_growth_factor_tables()).execute(replace(
+            INVESTMENT,
+            total_periods=self.params["total_periods"]
+        ))
+
+    def test_summary_matches_serializer(self):
+        report = self._report()
+
+        body = self.client.get(self.url, self.params).json()
+
+        self.assertEqual(body, FullSimulationReportSerializer(report.summary).data)
+        self.assertEqual(body, summary_representation(report.summary))
+
+    def test_overflowing_growth_returns_inf(self):
+        params = {"principal": 1000, "annual_rate": 20, "total_periods": 18250, "compounding_frequency": "DAILY"}
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["final_balance"], "inf")
+
+    def test_raw_numbers_and_evolutions(self):
+        report = self._report()
+
+        body = self.client.get(self.url, {**self.params, "raw": "true", "evolution": "all"}).json()
+
+        self.assertEqual(body["final_balance"], report.summary.final_balance)
+        self.assertEqual(body["effective_annual_rate"], report.summary.effective_annual_rate)
+        self.assertEqual(body["yearly_evolution"], [asdict(row) for row in report.yearly_evolution])
+        self.assertEqual(body["monthly_evolution"], [asdict(row) for row in report.monthly_evolution])
+
+    def test_formatted_evolution(self):
+        report = self._report()
+
+        body = self.client.get(self.url, {**self.params, "evolution": "yearly"}).json()
+
+        self.assertNotIn("monthly_evolution", body)
+        self.assertEqual(len(body["yearly_evolution"]), 3)
+        last_year = report.yearly_evolution[-1]
+        self.assertEqual(body["yearly_evolution"][-1]["year"], 3)
+        self.assertEqual(body["yearly_evolution"][-1]["final_balance"], f"{last_year.final_balance:,.2f}")
+
+    def test_without_periods_evolutions_are_empty(self):
+        body = self.client.get(self.url, {**self.params, "total_periods": 0, "evolution": "all"}).json()
+
+        self.assertEqual(body["yearly_evolution"], [])
+        self.assertEqual(body["monthly_evolution"], [])
+
+    def test_non_finite_raw_values_are_null(self):
+        summary = replace(self._report().summary, final_balance=float("inf"), total_interest=float("-inf"))
+        payload = SimulationReportPayload(summary=summary, raw=True)
+
+        body = json.loads(render_simulation_report(payload))
+
+        self.assertIsNone(body["final_balance"])
+        self.assertIsNone(body["total_interest"])
+        self.assertEqual(body["total_invested"], summary.total_invested)
+
+    def test_overflowing_growth_with_raw_numbers_returns_null(self):
+        params = {
+            "principal": 1000, "annual_rate": 20, "total_periods": 18250, "compounding_frequency": "DAILY",
+            "raw": "true", "evolution": "yearly",
+        }
+
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertIsNone(body["final_balance"])
+        self.assertIsNone(body["yearly_evolution"][-1]["final_balance"])
+
+    def test_non_finite_inputs_return_400(self):
+        for name in ("principal", "annual_rate", "contribution_amount"):
+            for value in ("nan", "inf", "-inf"):
+                response = self.client.get(self.url, {**self.params, name: value, "raw": "true"})
+                self.assertEqual(response.status_code, 400, (name, value))
+                self.assertIn(name, response.json())
+
+
+ASYNC_SETTINGS = {"EXECUTOR": "thread", "MAX_CONCURRENCY": 1, "MAX_PENDING": 0, "INLINE_MAX_PERIODS": 24}
+
+
+@override_settings(SIMULATION_ASYNC=ASYNC_SETTINGS)
+class SimulateAsyncEndpointTest(TestCase):
+    url = "/api/investments/simulate-async/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 30, "compounding_frequency": "MONTHLY",
+        "contribution_amount": 100, "contribution_frequency": "MONTHLY",
+    }
+
+    def setUp(self):
+        get_async_simulation_executor.cache_clear()
+
+    def tearDown(self):
+        get_async_simulation_executor().close()
+        get_async_simulation_executor.cache_clear()
+
+    async def test_inline_matches_sync_endpoint(self):
+        response = await self.async_client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.client.get("/api/investments/simulate/", self.params).json())
+
+    async def test_long_evolution_runs_in_executor(self):
+        params = {**self.params, "evolution": "all"}
+
+        response = await self.async_client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.client.get("/api/investments/simulate/", params).json())
+        self.assertEqual(get_async_simulation_executor().in_flight, 0)
+
+    async def test_saturated_executor_returns_503(self):
+        release = threading.Event()
+        executor = get_async_simulation_executor()
+        running = asyncio.ensure_future(executor.run(release.wait))
+        try:
+            response = await self.async_client.get(self.url, {**self.params, "evolution": "yearly"})
+        finally:
+            release.set()
+            await running
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+    async def test_invalid_parameters_return_400(self):
+        response = await self.async_client.get(self.url, {**self.params, "total_periods": "abc"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("total_periods", response.json())
+
+
+@override_settings(SIMULATION_METRICS={"ENABLED": True, "PATH_PREFIX": "/api/investments/"})
+class ServerTimingMiddlewareTest(TestCase):
+    url = "/api/investments/simulate/"
+    params = {
+        "principal": 1000, "annual_rate": 0.12, "total_periods": 24, "compounding_frequency": "MONTHLY",
+        "evolution": "yearly",
+    }
+
+    def setUp(self):
+        get_stage_histograms().clear()
+
+    def _stages(self, response):
+        return [entry.split(";")[0] for entry in response["Server-Timing"].split(", ")]
+
+    def test_server_timing_header_lists_stages(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        stages = self._stages(response)
+        for stage in ("validation", "serialization", "total"):
+            self.assertIn(stage, stages)
+
+    async def test_async_endpoint_is_timed(self):
+        response = await self.async_client.get("/api/investments/simulate-async/", self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._stages(response)[0], "validation")
+        self.assertIn("total", self._stages(response))
+
+    def test_metrics_endpoint_aggregates_requests(self):
+        for _ in range(3):
+            self.client.get(self.url, self.params)
+
+        stages = self.client.get("/api/metrics/").json()["stages"]
+
+        self.assertEqual(stages["total"]["count"], 3)
+        self.assertEqual(stages["validation"]["buckets"]["+Inf"], 3)
+        self.assertNotIn("Server-Timing", self.client.get("/api/metrics/"))
+
+    @override_settings(SIMULATION_METRICS={"ENABLED": False})
+    def test_disabled_metrics(self):
+        response = self.client.get(self.url, self.params)
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 404)
+
+
+class SimulationProfilingTest(TestCase):
+    url = "/api/investments/simulate/"
+    params = {"principal": 1000, "annual_rate": 0.12, "total_periods": 24, "compounding_frequency": "MONTHLY"}
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        get_simulation_profiler.cache_clear()
+
+    def tearDown(self):
+        get_simulation_profiler.cache_clear()
+        self.temporary_directory.cleanup()
+
+    def _settings(self, **overrides):
+        return override_settings(SIMULATION_PROFILING={"ENABLED": True, "DIRECTORY": self.directory, **overrides})
+
+    def test_header_triggers_profile(self):
+        with self._settings():
+            response = self.client.get(self.url, self.params, headers={"X-Simulation-Profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        profile = response["X-Simulation-Profile"]
+        files = sorted(os.listdir(self.directory))
+        self.assertEqual(files, sorted([profile, profile.replace(".pstats", ".json")]))
+
+    def test_query_param_triggers_profile_once_per_interval(self):
+        with self._settings():
+            first = self.client.get(self.url, {**self.params, "profile": "true"})
+            second = self.client.get(self.url, {**self.params, "profile": "true"})
+
+        self.assertIn("X-Simulation-Profile", first)
+        self.assertNotIn("X-Simulation-Profile", second)
+        self.assertEqual(first.json(), second.json())
+
+    def test_not_profiled_without_request_or_when_disabled(self):
+        with self._settings():
+            self.assertNotIn("X-Simulation-Profile", self.client.get(self.url, self.params))
+        with self._settings(ENABLED=False):
+            response = self.client.get(self.url, self.params, headers={"X-Simulation-Profile": "1"})
+            self.assertNotIn("X-Simulation-Profile", response)
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class SimulationResultRepositoryTest(TestCase):
+    def setUp(self):
+        self.repository = DjangoSimulationResultRepository()
+
+    def test_round_trip_keeps_summary_and_yearly_evolution(self):
+        report = SimulateInvestmentUseCase().execute(INVESTMENT)
+        list(report.yearly_evolution)
+
+        self.repository.save(INVESTMENT, report)
+        loaded = self.repository.get(INVESTMENT)
+
+        self.assertEqual(loaded.summary, report.summary)
+        self.assertIsInstance(loaded.yearly_evolution, list)
+        self.assertEqual(loaded.yearly_evolution, report.yearly_evolution)
+        self.assertFalse(loaded.monthly_evolution.is_loaded)
+        self.assertEqual(loaded.monthly_evolution, report.monthly_evolution)
+
+    def test_missing_result_and_summary_only_rows(self):
+        self.assertIsNone(self.repository.get(INVESTMENT))
+
+        self.repository.save(INVESTMENT, SimulateInvestmentUseCase().execute(INVESTMENT))
+        model = SimulationResultModel.objects.get(investment_hash=investment_key(INVESTMENT))
+
+        self.assertIsNone(model.yearly_evolution)
+        self.assertFalse(self.repository.get(INVESTMENT).yearly_evolution.is_loaded)
+
+    def test_bulk_insert_keeps_existing_rows(self):
+        investments = [replace(INVESTMENT, total_periods=periods) for periods in (12, 24, 36)]
+        first = SimulateInvestmentUseCase().execute(investments[1])
+        list(first.yearly_evolution)
+        self.repository.save(investments[1], first)
+
+        self.repository.save_many([
+            (investment, SimulateInvestmentUseCase().execute(investment)) for investment in investments
+        ])
+
+        self.assertEqual(SimulationResultModel.objects.count(), 3)
+        self.assertIsInstance(self.repository.get(investments[1]).yearly_evolution, list)
+
+    def test_saved_evolution_fills_a_summary_only_row(self):
+        self.repository.save(INVESTMENT, SimulateInvestmentUseCase().execute(INVESTMENT))
+        SimulationResultModel.objects.update(final_balance=1.0)
+        report = SimulateInvestmentUseCase().execute(INVESTMENT)
+        list(report.yearly_evolution)
+
+        self.repository.save(INVESTMENT, report)
+
+        loaded = self.repository.get(INVESTMENT)
+        self.assertEqual(loaded.summary.final_balance, 1.0)
+        self.assertEqual(loaded.yearly_evolution, report.yearly_evolution)
+        self.assertEqual(SimulationResultModel.objects.count(), 1)
+
+
+class SimulationPersistenceEndpointTest(TestCase):
+    params = {"principal": 1000, "annual_rate": 0.12, "total_periods": 24, "compounding_frequency": "MONTHLY"}
+
+    def setUp(self):
+        self.settings_override = override_settings(
+            SIMULATION_CACHE={"BACKEND": None},
+            SIMULATION_PERSISTENCE={"ENABLED": True}
+        )
+        self.settings_override.enable()
+        get_simulation_cache.cache_clear()
+        get_simulation_result_repository.cache_clear()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        get_simulation_cache.cache_clear()
+        get_simulation_result_repository.cache_clear()
+
+    def test_simulate_reads_through_persisted_results(self):
+        first = self.client.get("/api/investments/simulate/", {**self.params, "evolution": "yearly"})
+        self.assertEqual(SimulationResultModel.objects.count(), 1)
+
+        # Um valor adulterado na tabela prova que a segunda resposta vem do banco
+        SimulationResultModel.objects.update(final_balance=1.0)
+        second = self.client.get("/api/investments/simulate/", {**self.params, "evolution": "yearly"})
+
+        self.assertEqual(second.json()["final_balance"], "1.00")
+        self.assertEqual(second.json()["yearly_evolution"], first.json()["yearly_evolution"])
+        self.assertEqual(SimulationResultModel.objects.count(), 1)
+
+    def test_long_horizon_saves_summary_only_until_evolution_is_requested(self):
+        params = {**self.params, "total_periods": 100 * 365, "compounding_frequency": "DAILY"}
+
+        self.client.get("/api/investments/simulate/", params)
+        self.assertIsNone(SimulationResultModel.objects.get().yearly_evolution)
+
+        response = self.client.get("/api/investments/simulate/", {**params, "evolution": "yearly"})
+
+        self.assertEqual(len(response.json()["yearly_evolution"]), 100)
+        self.assertIsNotNone(SimulationResultModel.objects.get().yearly_evolution)
+
+    def test_zero_periods_returns_summary(self):
+        for evolution in ("none", "yearly"):
+            response = self.client.get(
+                "/api/investments/simulate/", {**self.params, "total_periods": 0, "evolution": evolution}
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["final_balance"], "1,000.00")
+
+    def test_batch_inserts_summaries(self):
+        payload = [{**self.params, "annual_rate": rate} for rate in (0.05, 0.10, 0.12)]
+
+        response = self.client.post("/api/investments/simulate-batch/", payload, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SimulationResultModel.objects.count(), 3)
+        single = self.client.get("/api/investments/simulate/", self.params)
+        self.assertEqual(single.json(), response.json()[2]["summary"])
+
+    def test_disabled_by_default(self):
+        get_simulation_result_repository.cache_clear()
+        with override_settings(SIMULATION_PERSISTENCE={"ENABLED": False}):
+            self.assertIsNone(get_simulation_result_repository())
@@ -1,46 +1,337 @@
 # python
+import os
+from dataclasses import replace
+from typing import Any, Dict
+
+import numpy as np
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
 from drf_yasg.utils import swagger_auto_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import viewsets
 from rest_framework.status import HTTP_200_OK
 from rest_framework.decorators import action
 
+from src.python.application.builders.streaming_simulation_report_builder import StreamingSimulationReportBuilder
+from src.python.application.cache.report_codec import decode_report
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.goal_seek import GoalSeekVariable
+from src.python.application.domain.parameter_sweep import SweepAxes
 from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
-from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+from src.python.application.instrumentation.stage_timer import timed_stage
+from src.python.application.service.bounded_simulation_executor import ExecutorSaturatedError
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.parallel_simulation_executor import simulate_encoded_report
+from src.python.application.usecases.compound_interest_calculator import (
+    SimulateInvestmentBatchUseCase,
+    SimulateInvestmentSweepUseCase,
+    SimulateInvestmentUseCase,
+    SolveInvestmentGoalUseCase,
+)
+from src.python.django_project.calculator.cache import (
+    get_async_simulation_executor,
+    get_growth_factor_tables,
+    get_simulation_cache,
+    get_simulation_profiler,
+    get_simulation_result_repository,
+    get_stage_histograms,
+)
+from src.python.django_project.calculator.evolution_export import (
+    MONTHLY_FIELDS,
+    YEARLY_FIELDS,
+    iter_csv,
+    iter_ndjson,
+)
 from src.python.django_project.calculator.serializers import (
+    EvolutionExportQuerySerializer,
     FullSimulationReportSerializer,
+    GoalSeekQuerySerializer,
+    InvestmentBatchSerializer,
     InvestmentQuerySerializer,
+    SimulationReportQuerySerializer,
+    SweepQuerySerializer,
 )
+from src.python.django_project.calculator.renderers import (
+    SimulationReportJSONRenderer,
+    SimulationReportPayload,
+    render_simulation_report,
+    summary_representation,
+)
+
+
+def _to_investment(q: Dict[str, Any]) -> Investment:
+    compounding_frequency = CompoundingFrequency(q.get("compounding_frequency", CompoundingFrequency.YEARLY.value))
+
+    contribution_amount = float(q.get("contribution_amount", 0))
+    contribution = None
+    if contribution_amount:
+        contribution = Contribution(
+            amount=contribution_amount,
+            frequency=CompoundingFrequency(q.get("contribution_frequency", CompoundingFrequency.YEARLY.value))
+        )
+
+    return Investment(
+        principal=float(q.get("principal", 0)),
+        annual_rate=float(q.get("annual_rate", 0)),
+        total_periods=int(q.get("total_periods", 0)),
+        compounding_frequency=compounding_frequency,
+        contribution=contribution,
+        rate_schedule=tuple(q.get("rate_schedule", ()))
+    )
+
+
+def _to_report_payload(
+        report: FullSimulationReport,
+        investment: Investment,
+        q: Dict[str, Any]
+) -> SimulationReportPayload:
+    evolution = q.get("evolution", "none")
+    has_periods = investment.total_periods > 0
+    yearly_evolution = monthly_evolution = None
+    if evolution in ("yearly", "all"):
+        yearly_evolution = report.yearly_evolution if has_periods else []
+    if evolution in ("monthly", "all"):
+        monthly_evolution = report.monthly_evolution if has_periods else []
+
+    return SimulationReportPayload(
+        summary=report.summary,
+        yearly_evolution=yearly_evolution,
+        monthly_evolution=monthly_evolution,
+        raw=q.get("raw", False)
+    )
+
+
+def _profiling_requested(request: Request) -> bool:
+    config = getattr(settings, "SIMULATION_PROFILING", None) or {}
+    if not config.get("ENABLED", False):
+        return False
+
+    header = config.get("HEADER", "X-Simulation-Profile")
+    query_param = config.get("QUERY_PARAM", "profile")
+    value = request.headers.get(header) or request.query_params.get(query_param) or ""
+    return value.lower() in ("1", "true", "yes")
+
+
+def _to_sweep_axes(q: Dict[str, Any]) -> SweepAxes:
+    contribution_frequency = q.get("contribution_frequency")
+    periods = np.rint(np.linspace(q["periods_start"], q["periods_stop"], q["periods_steps"])).astype(int)
+
+    return SweepAxes(
+        principal=float(q.get("principal", 0)),
+        compounding_frequency=CompoundingFrequency(q.get("compounding_frequency", CompoundingFrequency.YEARLY.value)),
+        contribution_frequency=CompoundingFrequency(contribution_frequency) if contribution_frequency else None,
+        annual_rates=tuple(np.linspace(q["rate_start"], q["rate_stop"], q["rate_steps"]).tolist()),
+        total_periods=tuple(periods.tolist()),
+        contribution_amounts=tuple(
+            np.linspace(q["contribution_start"], q["contribution_stop"], q["contribution_steps"]).tolist()
+        )
+    )
+
+
+def _null_non_finite(values: np.ndarray) -> list:
+    # nan e ±inf não são JSON válido; viram null, como nos números crus de render_simulation_report
+    nested = values.astype(object)
+    nested[~np.isfinite(values)] = None
+    return nested.tolist()
 
 
 class CalculatorView(viewsets.ViewSet):
+    renderer_classes = [SimulationReportJSONRenderer, BrowsableAPIRenderer]
+
     @action(detail=False, methods=['get'], url_path='simulate')
-    @swagger_auto_schema(query_serializer=InvestmentQuerySerializer, responses={200: FullSimulationReportSerializer})
+    @swagger_auto_schema(
+        query_serializer=SimulationReportQuerySerializer,
+        responses={200: FullSimulationReportSerializer}
+    )
     def fetch(self, request: Request):
-        q_serializer = InvestmentQuerySerializer(data=request.query_params)
-        q_serializer.is_valid(raise_exception=True)
-        q = q_serializer.validated_data
+        with timed_stage("validation"):
+            q_serializer = SimulationReportQuerySerializer(data=request.query_params)
+            q_serializer.is_valid(raise_exception=True)
+            q = q_serializer.validated_data
+            investment = _to_investment(q)
 
-        compounding_frequency = CompoundingFrequency(q.get("compounding_frequency", CompoundingFrequency.YEARLY.value))
+        use_case = SimulateInvestmentUseCase(
+            cache=get_simulation_cache(),
+            growth_tables=get_growth_factor_tables(),
+            repository=get_simulation_result_repository()
+        )
 
-        contribution_amount = float(q.get("contribution_amount", 0))
-        contribution = None
-        if contribution_amount:
-            contribution = Contribution(
-                amount=contribution_amount,
-                frequency=CompoundingFrequency(q.get("contribution_frequency", CompoundingFrequency.YEARLY.value))
+        def simulate() -> SimulationReportPayload:
+            payload = _to_report_payload(
+                use_case.execute(investment=investment, with_yearly_evolution=q["evolution"] in ("yearly", "all")),
+                investment,
+                q
             )
+            # Carrega aqui as evoluções pedidas, para que entrem no perfil quando houver um
+            for evolution in (payload.yearly_evolution, payload.monthly_evolution):
+                if evolution is not None:
+                    len(evolution)
+            return payload
+
+        profiler = get_simulation_profiler() if _profiling_requested(request) else None
+        if profiler is None:
+            return Response(simulate(), status=HTTP_200_OK)
+
+        payload, profile_path = profiler.run(investment, simulate)
+        # O SimulationReportJSONRenderer converte o payload direto em JSON, sem o FullSimulationReportSerializer
+        response = Response(payload, status=HTTP_200_OK)
+        if profile_path is not None:
+            response["X-Simulation-Profile"] = os.path.basename(profile_path)
+        return response
+
+    @action(detail=False, methods=['post'], url_path='simulate-batch')
+    @swagger_auto_schema(request_body=InvestmentQuerySerializer(many=True))
+    def simulate_batch(self, request: Request):
+        batch_serializer = InvestmentBatchSerializer(data=request.data)
+        batch_serializer.is_valid(raise_exception=True)
+        items = batch_serializer.validated_data
+
+        valid_indexes = [index for index, item in enumerate(items) if not isinstance(item, ValidationError)]
+        summaries = SimulateInvestmentBatchUseCase(repository=get_simulation_result_repository()).execute(
+            [_to_investment(items[index]) for index in valid_indexes]
+        )
 
-        investment = Investment(
-            principal=float(q.get("principal", 0)),
-            annual_rate=float(q.get("annual_rate", 0)),
-            total_periods=int(q.get("total_periods", 0)),
-            compounding_frequency=compounding_frequency,
-            contribution=contribution
+        response = [
+            {"index": index, "errors": item.detail}
+            if isinstance(item, ValidationError) else None
+            for index, item in enumerate(items)
+        ]
+        for index, summary in zip(valid_indexes, summaries):
+            response[index] = {"index": index, "summary": summary_representation(summary)}
+
+        return Response(response, status=HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='simulate-evolution')
+    @swagger_auto_schema(query_serializer=EvolutionExportQuerySerializer)
+    def export_evolution(self, request: Request):
+        q_serializer = EvolutionExportQuerySerializer(data=request.query_params)
+        q_serializer.is_valid(raise_exception=True)
+        q = q_serializer.validated_data
+        investment = _to_investment(q)
+
+        monthly = q["granularity"] == "monthly"
+        report_builder = StreamingSimulationReportBuilder(
+            investment.compounding_frequency,
+            monthly=monthly,
+            yearly=not monthly
         )
+        rows = report_builder.stream(CompoundInterestCalculator().iter_periods(investment))
+        field_names = MONTHLY_FIELDS if monthly else YEARLY_FIELDS
+
+        if q["export_format"] == "csv":
+            response = StreamingHttpResponse(iter_csv(rows, field_names), content_type="text/csv")
+            response["Content-Disposition"] = f'attachment; filename="{q["granularity"]}_evolution.csv"'
+            return response
+
+        return StreamingHttpResponse(iter_ndjson(rows, field_names), content_type="application/x-ndjson")
+
+    @action(detail=False, methods=['get'], url_path='simulate-sweep')
+    @swagger_auto_schema(query_serializer=SweepQuerySerializer)
+    def simulate_sweep(self, request: Request):
+        q_serializer = SweepQuerySerializer(data=request.query_params)
+        q_serializer.is_valid(raise_exception=True)
+        axes = _to_sweep_axes(q_serializer.validated_data)
+
+        result = SimulateInvestmentSweepUseCase().execute(axes)
+
+        return Response({
+            "annual_rates": list(axes.annual_rates),
+            "total_periods": list(axes.total_periods),
+            "contribution_amounts": list(axes.contribution_amounts),
+            "final_balances": _null_non_finite(result.final_balances),
+            "total_invested": _null_non_finite(result.total_invested),
+        }, status=HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='goal-seek')
+    @swagger_auto_schema(query_serializer=GoalSeekQuerySerializer)
+    def goal_seek(self, request: Request):
+        q_serializer = GoalSeekQuerySerializer(data=request.query_params)
+        q_serializer.is_valid(raise_exception=True)
+        q = q_serializer.validated_data
+        solve_for = GoalSeekVariable(q["solve_for"])
+
+        investment = _to_investment(q)
+        if solve_for is GoalSeekVariable.CONTRIBUTION_AMOUNT:
+            # O aporte é a incógnita, mas a frequência informada continua valendo
+            investment = replace(investment, contribution=Contribution(
+                amount=0.0,
+                frequency=CompoundingFrequency(q["contribution_frequency"])
+            ))
+
+        try:
+            result = SolveInvestmentGoalUseCase().execute(investment, q["target_balance"], solve_for)
+        except ValueError as error:
+            raise ValidationError({"target_balance": [str(error)]})
+
+        return Response({
+            "solve_for": result.solve_for.value,
+            "value": result.value,
+            "target_balance": result.target_balance,
+            "achieved_balance": result.achieved_balance,
+            "method": result.method.value,
+            "iterations": result.iterations,
+            "evaluations": result.evaluations,
+            "converged": result.converged,
+        }, status=HTTP_200_OK)
+
+
+def _async_settings() -> Dict[str, Any]:
+    return getattr(settings, "SIMULATION_ASYNC", None) or {}
+
+
+def _metrics_settings() -> Dict[str, Any]:
+    return getattr(settings, "SIMULATION_METRICS", None) or {}
+
+
+def _runs_inline(investment: Investment, with_evolution: bool) -> bool:
+    # Sem evolução o resumo vem da forma fechada e custa O(1); só evoluções longas saem do event loop
+    return not with_evolution or investment.total_periods <= _async_settings().get("INLINE_MAX_PERIODS", 10 * 365)
+
+
+def _saturated_response() -> JsonResponse:
+    response = JsonResponse({"detail": "Too many simulations in progress, try again later."}, status=503)
+    response["Retry-After"] = str(_async_settings().get("RETRY_AFTER", 1))
+    return response
+
+
+async def simulate_async(request) -> HttpResponse:
+    """
+    Versão assíncrona de GET /api/investments/simulate, com os mesmos parâmetros e resposta.
+    A validação e as simulações curtas rodam no event loop; as longas (com evolução e mais de
+    INLINE_MAX_PERIODS períodos) vão para o BoundedSimulationExecutor, que responde 503 quando
+    todas as vagas estão ocupadas. O cache de relatórios não é consultado aqui, porque o backend
+    do Django faria E/S bloqueante dentro do event loop.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    with timed_stage("validation"):
+        q_serializer = SimulationReportQuerySerializer(data=request.GET)
+        if not q_serializer.is_valid():
+            return JsonResponse(q_serializer.errors, status=400)
+        q = q_serializer.validated_data
+        investment = _to_investment(q)
+
+    if _runs_inline(investment, q["evolution"] != "none"):
+        report = SimulateInvestmentUseCase(growth_tables=get_growth_factor_tables()).execute(investment)
+    else:
+        try:
+            with timed_stage("executor"):
+                data = await get_async_simulation_executor().run(simulate_encoded_report, investment)
+        except ExecutorSaturatedError:
+            return _saturated_response()
+        report = decode_report(data, investment)
+
+    with timed_stage("serialization"):
+        content = render_simulation_report(_to_report_payload(report, investment, q))
+    return HttpResponse(content, content_type="application/json")
 
-        full_simulation_report = SimulateInvestmentUseCase().execute(investment=investment)
 
-        serializer = FullSimulationReportSerializer(full_simulation_report.summary)
-        return Response(serializer.data, status=HTTP_200_OK)
+def metrics(request) -> JsonResponse:
+    """Histogramas por etapa das requisições medidas pelo ServerTimingMiddleware."""
+    if not _metrics_settings().get("ENABLED", False):
+        raise Http404("Simulation metrics are disabled")
+    return JsonResponse({"stages": get_stage_histograms().snapshot()})
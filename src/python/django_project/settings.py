@@ -51,6 +51,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'src.python.django_project.calculator.middleware.ServerTimingMiddleware',
 ]
 
 ROOT_URLCONF = 'django_project.urls'
@@ -119,3 +120,83 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+
+
+# Simulation result cache
+# BACKEND selects where simulation reports are cached:
+#   'local'  - per-process LRU cache; MAX_SIZE bounds the number of entries (0 disables it)
+#   'django' - shared cache through django.core.cache, using the CACHES entry named by ALIAS;
+#              LOCK_TIMEOUT/WAIT_TIMEOUT (seconds) control the single-flight lock per key
+#   None     - no caching
+# TTL is the lifetime of each entry in seconds (None keeps entries until evicted).
+
+SIMULATION_CACHE = {
+    'BACKEND': 'local',
+    'MAX_SIZE': 1024,
+    'TTL': None,
+    'ALIAS': 'default',
+    'LOCK_TIMEOUT': 30,
+    'WAIT_TIMEOUT': 10,
+}
+
+# Growth-factor tables shared by simulations with the same period rate and frequency.
+# MAX_CACHED_FACTORS bounds the total number of cached factors (0 disables the tables);
+# horizons longer than MAX_HORIZON periods are computed without tables.
+
+SIMULATION_GROWTH_TABLES = {
+    'MAX_CACHED_FACTORS': 1_000_000,
+    'MAX_HORIZON': 100 * 365,
+}
+
+# Async simulate endpoint (/api/investments/simulate-async/). Requests with an evolution longer than
+# INLINE_MAX_PERIODS periods run in a pool of MAX_CONCURRENCY workers (None uses the CPU count);
+# EXECUTOR is 'process' or 'thread'. At most MAX_PENDING more wait in the pool queue, further
+# requests get 503 with a Retry-After of RETRY_AFTER seconds.
+
+SIMULATION_ASYNC = {
+    'EXECUTOR': 'process',
+    'MAX_CONCURRENCY': None,
+    'MAX_PENDING': 32,
+    'INLINE_MAX_PERIODS': 10 * 365,
+    'RETRY_AFTER': 1,
+}
+
+# Per-stage timings (validation, repository, calculator, report, evolution, serialization) for
+# requests under PATH_PREFIX, returned in a Server-Timing header and aggregated into histograms
+# served by /api/metrics/. BUCKETS are the histogram upper bounds in seconds. Disabled, the middleware is
+# removed from the chain and the timers cost a single context-variable lookup.
+
+SIMULATION_METRICS = {
+    'ENABLED': False,
+    'PATH_PREFIX': '/api/investments/',
+}
+
+# Opt-in cProfile capture of GET /api/investments/simulate. With ENABLED, a request carrying the
+# HEADER (or the QUERY_PARAM) set to 1/true/yes is profiled, at most once every MIN_INTERVAL seconds
+# per process and never two at once. Each profile (FORMAT 'pstats' or 'collapsed') is written to
+# DIRECTORY with a JSON file holding the Investment parameters; the response names it in the
+# X-Simulation-Profile header.
+
+SIMULATION_PROFILING = {
+    'ENABLED': False,
+    'DIRECTORY': BASE_DIR / 'profiles',
+    'HEADER': 'X-Simulation-Profile',
+    'QUERY_PARAM': 'profile',
+    'MIN_INTERVAL': 60,
+    'FORMAT': 'pstats',
+}
+
+# Simulation results persisted in the simulation_results table and read before computing. Each
+# row keeps the summary and the yearly evolution of one Investment; batch runs insert summaries
+# BATCH_SIZE rows per statement. Requires the calculator migrations.
+
+SIMULATION_PERSISTENCE = {
+    'ENABLED': False,
+    'BATCH_SIZE': 500,
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
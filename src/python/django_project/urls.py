@@ -6,7 +6,7 @@ from rest_framework.routers import DefaultRouter
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
-from src.python.django_project.calculator.views import CalculatorView
+from src.python.django_project.calculator.views import CalculatorView, metrics, simulate_async
 from src.python.django_project.initial_project_app.views import InitialProjectView
 
 router = DefaultRouter()
@@ -26,6 +26,8 @@ schema_view = get_schema_view(
 urlpatterns = [
     path('', RedirectView.as_view(url='api/investments', permanent=False), name='home'),
     path('admin/', admin.site.urls),
+    path('api/investments/simulate-async/', simulate_async, name='investments-simulate-async'),
+    path('api/metrics/', metrics, name='metrics'),
     path('api/', include(router.urls)),
     path('swagger(<format>\\.json|\\.yaml)', schema_view.without_ui(cache_timeout=0), name='schema-json'),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
@@ -0,0 +1,169 @@
+from dataclasses import replace
+from typing import Optional
+
+import pytest
+
+from src.python.application.builders.incremental_simulation_report_builder import IncrementalSimulationReportBuilder
+from src.python.application.builders.lazy_simulation_report_builder import LazySimulationReportBuilder
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.domain.full_simulation_report import FullSimulationReport
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment,
+    SimulationCheckpoint
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+
+
+def _investment(total_periods: int, frequency: CompoundingFrequency = CompoundingFrequency.MONTHLY) -> Investment:
+    return Investment(
+        principal=2500.0,
+        annual_rate=0.09,
+        total_periods=total_periods,
+        compounding_frequency=frequency,
+        contribution=Contribution(amount=75.0, frequency=frequency)
+    )
+
+
+def _full_report(investment: Investment, calculator: CompoundInterestCalculator) -> FullSimulationReport:
+    result = calculator.simulate(investment)
+    summary = SimulationReportBuilder(result=result).build_summary(result, investment)
+    report = LazySimulationReportBuilder(investment, calculator).build(summary)
+    return FullSimulationReport(
+        summary=summary,
+        yearly_evolution=list(report.yearly_evolution),
+        monthly_evolution=list(report.monthly_evolution)
+    )
+
+
+class TestIncrementalSimulationReportBuilder:
+    """O relatório reaproveitado deve ser idêntico ao calculado do zero"""
+
+    @pytest.fixture(params=[None, GrowthFactorTables()], ids=["loop", "growth-tables"])
+    def calculator(self, request) -> CompoundInterestCalculator:
+        return CompoundInterestCalculator(growth_tables=request.param)
+
+    def _resume(
+            self,
+            calculator: CompoundInterestCalculator,
+            previous: Investment,
+            investment: Investment
+    ) -> Optional[FullSimulationReport]:
+        previous_report = _full_report(previous, calculator)
+        summary = _full_report(investment, calculator).summary
+        return IncrementalSimulationReportBuilder(investment, calculator).build(summary, previous, previous_report)
+
+    @pytest.mark.parametrize("previous_periods,total_periods", [
+        (120, 240),
+        (125, 240),
+        (125, 131),
+        (5, 30),
+        (240, 120),
+        (240, 125),
+        (240, 7),
+        (24, 24),
+    ])
+    def test_matches_full_simulation(
+            self,
+            calculator: CompoundInterestCalculator,
+            previous_periods: int,
+            total_periods: int
+    ):
+        """Estender ou encurtar o prazo, com ou sem ano incompleto, reproduz o cálculo completo"""
+        investment = _investment(total_periods)
+
+        report = self._resume(calculator, _investment(previous_periods), investment)
+
+        expected = _full_report(investment, calculator)
+        assert report.monthly_evolution == expected.monthly_evolution
+        assert report.yearly_evolution == expected.yearly_evolution
+        assert report.summary == expected.summary
+
+    def test_rate_schedule_and_mixed_contribution(self, calculator: CompoundInterestCalculator):
+        """Taxas variáveis e aportes com frequência própria continuam do ponto certo"""
+        previous = replace(
+            _investment(40),
+            contribution=Contribution(amount=300.0, frequency=CompoundingFrequency.YEARLY),
+            rate_schedule=(RateSegment(start_period=30, annual_rate=0.05), RateSegment(61, 0.11))
+        )
+        investment = replace(previous, total_periods=90)
+
+        report = self._resume(calculator, previous, investment)
+
+        expected = _full_report(investment, calculator)
+        assert report.monthly_evolution == expected.monthly_evolution
+        assert report.yearly_evolution == expected.yearly_evolution
+
+    def test_other_parameters_are_not_resumed(self, calculator: CompoundInterestCalculator):
+        """Só o prazo pode mudar; qualquer outro parâmetro exige o cálculo do zero"""
+        previous = _investment(60)
+        investment = replace(_investment(120), annual_rate=0.1)
+
+        assert self._resume(calculator, previous, investment) is None
+
+    def test_lazy_evolutions_are_not_resumed(self, calculator: CompoundInterestCalculator):
+        """Evoluções ainda não calculadas não são materializadas só para serem reaproveitadas"""
+        previous = _investment(60)
+        result = calculator.simulate(previous)
+        summary = SimulationReportBuilder(result=result).build_summary(result, previous)
+        previous_report = LazySimulationReportBuilder(previous, calculator).build(summary)
+
+        builder = IncrementalSimulationReportBuilder(_investment(120), calculator)
+
+        assert builder.build(summary, previous, previous_report) is None
+        assert not previous_report.monthly_evolution.is_loaded
+
+    def test_extension_only_simulates_new_periods(self, monkeypatch):
+        """Ao estender, só os períodos após o último ano completo são simulados"""
+        calculator = CompoundInterestCalculator()
+        previous = _investment(125)
+        previous_report = _full_report(previous, calculator)
+        investment = _investment(130)
+        simulated = []
+
+        def iter_periods(investment, checkpoint=None):
+            for detail in CompoundInterestCalculator.iter_periods(calculator, investment, checkpoint):
+                simulated.append(detail.period)
+                yield detail
+
+        monkeypatch.setattr(calculator, "iter_periods", iter_periods)
+        report = IncrementalSimulationReportBuilder(investment, calculator).build(
+            previous_report.summary, previous, previous_report
+        )
+        assert simulated == []
+
+        len(report.yearly_evolution)
+
+        assert simulated == list(range(121, 131))
+
+
+class TestSimulationCheckpoint:
+    """Retomada da simulação a partir de um checkpoint"""
+
+    def test_iter_periods_from_checkpoint(self):
+        """Os períodos após o checkpoint coincidem com os da simulação completa"""
+        calculator = CompoundInterestCalculator()
+        investment = replace(
+            _investment(100),
+            contribution=Contribution(amount=300.0, frequency=CompoundingFrequency.YEARLY),
+            rate_schedule=(RateSegment(start_period=45, annual_rate=0.04),)
+        )
+        details = list(calculator.iter_periods(investment))
+        checkpoint = SimulationCheckpoint(period=60, balance=details[59].balance, total_invested=0.0)
+
+        assert list(calculator.iter_periods(investment, checkpoint)) == details[60:]
+
+    def test_checkpoint_from_closed_form(self):
+        """checkpoint calcula saldo e total investido sem simular os períodos anteriores"""
+        calculator = CompoundInterestCalculator()
+        investment = _investment(100)
+        details = list(calculator.iter_periods(investment))
+
+        checkpoint = calculator.checkpoint(investment, 60)
+
+        assert checkpoint.period == 60
+        assert checkpoint.balance == pytest.approx(details[59].balance, rel=1e-12)
+        assert checkpoint.total_invested == pytest.approx(2500.0 + 60 * 75.0)
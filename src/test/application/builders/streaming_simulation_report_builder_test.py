@@ -0,0 +1,97 @@
+import pytest
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.builders.streaming_simulation_report_builder import StreamingSimulationReportBuilder
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.domain.year_summary import YearSummary
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+class TestStreamingSimulationReportBuilder:
+    """Compara o builder em passada única com o SimulationReportBuilder"""
+
+    @pytest.fixture
+    def calculator(self) -> CompoundInterestCalculator:
+        return CompoundInterestCalculator()
+
+    @pytest.mark.parametrize("frequency,total_periods", [
+        (CompoundingFrequency.MONTHLY, 36),
+        (CompoundingFrequency.MONTHLY, 40),
+        (CompoundingFrequency.DAILY, 800),
+        (CompoundingFrequency.YEARLY, 7),
+    ])
+    def test_matches_report_builder(
+            self,
+            calculator: CompoundInterestCalculator,
+            frequency: CompoundingFrequency,
+            total_periods: int
+    ):
+        """As duas evoluções devem ser idênticas às do builder tradicional, inclusive o ano incompleto"""
+        investment = Investment(
+            principal=2500.0,
+            annual_rate=0.09,
+            total_periods=total_periods,
+            compounding_frequency=frequency,
+            contribution=Contribution(amount=75.0, frequency=frequency)
+        )
+        report_builder = SimulationReportBuilder(result=calculator.simulate(investment, detailed=True))
+
+        monthly, yearly = StreamingSimulationReportBuilder(frequency).build(calculator.iter_periods(investment))
+
+        assert monthly == report_builder.build_monthly_evolution()
+        assert yearly == report_builder.build_yearly_evolution(frequency)
+
+    def test_iter_periods_matches_detailed_simulation(self, calculator: CompoundInterestCalculator):
+        """O gerador de períodos reproduz os detalhes da simulação detalhada"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=24,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+        assert list(calculator.iter_periods(investment)) == calculator.simulate(investment, detailed=True).period_details
+
+    def test_stream_emits_year_after_its_last_month(self, calculator: CompoundInterestCalculator):
+        """Cada ano é emitido logo após o seu último período"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=18,
+            compounding_frequency=CompoundingFrequency.MONTHLY
+        )
+
+        rows = list(StreamingSimulationReportBuilder(CompoundingFrequency.MONTHLY).stream(
+            calculator.iter_periods(investment)
+        ))
+
+        assert isinstance(rows[12], YearSummary)
+        assert all(isinstance(row, MonthlySummary) for row in rows[:12])
+        assert isinstance(rows[-1], YearSummary) and rows[-1].year == 2
+
+    def test_yearly_only(self, calculator: CompoundInterestCalculator):
+        """Com monthly=False apenas as linhas anuais são emitidas"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=24,
+            compounding_frequency=CompoundingFrequency.MONTHLY
+        )
+
+        monthly, yearly = StreamingSimulationReportBuilder(CompoundingFrequency.MONTHLY, monthly=False).build(
+            calculator.iter_periods(investment)
+        )
+
+        assert monthly == []
+        assert [y.year for y in yearly] == [1, 2]
+
+    def test_empty_periods_raise(self):
+        """Sem períodos não há evolução a construir"""
+        with pytest.raises(ValueError):
+            StreamingSimulationReportBuilder(CompoundingFrequency.MONTHLY).build(iter([]))
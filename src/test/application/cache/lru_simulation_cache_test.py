@@ -0,0 +1,155 @@
+from dataclasses import replace
+
+import pytest
+
+from src.python.application.cache.lru_simulation_cache import LRUSimulationCache
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _investment(principal: float = 1000.0, annual_rate: float = 0.12, contribution: float = 0.0) -> Investment:
+    return Investment(
+        principal=principal,
+        annual_rate=annual_rate,
+        total_periods=12,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        contribution=Contribution(amount=contribution, frequency=CompoundingFrequency.MONTHLY) if contribution else None
+    )
+
+
+class TestLRUSimulationCache:
+    """Testes do cache LRU de relatórios de simulação"""
+
+    def test_use_case_reads_through_cache(self):
+        """A segunda execução com o mesmo investimento é servida pelo cache"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        first = use_case.execute(_investment())
+        second = use_case.execute(_investment())
+
+        assert second is first
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.size == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Ao exceder o limite, a entrada menos usada recentemente é descartada"""
+        cache = LRUSimulationCache(max_size=2)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        use_case.execute(_investment(principal=1.0))
+        use_case.execute(_investment(principal=2.0))
+        use_case.execute(_investment(principal=1.0))
+        use_case.execute(_investment(principal=3.0))
+
+        assert cache.stats.evictions == 1
+        assert cache.get(_investment(principal=1.0)) is not None
+        assert cache.get(_investment(principal=2.0)) is None
+        assert cache.get(_investment(principal=3.0)) is not None
+
+    def test_entries_expire_after_ttl(self):
+        """Entradas com TTL vencido contam como miss e são removidas"""
+        clock = FakeClock()
+        cache = LRUSimulationCache(max_size=8, ttl=60.0, clock=clock)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        first = use_case.execute(_investment())
+        clock.now = 59.0
+        assert use_case.execute(_investment()) is first
+
+        clock.now = 60.0
+        assert use_case.execute(_investment()) is not first
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 2
+
+    def test_float_keys_compare_by_value(self):
+        """Chaves float são comparadas pelo valor exato, sem arredondamento"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        report = use_case.execute(_investment(annual_rate=0.3))
+
+        assert cache.get(_investment(annual_rate=0.1 + 0.2)) is None
+        assert cache.get(_investment(annual_rate=0.30000000000000000001)) is report
+        assert cache.get(_investment(principal=1000, annual_rate=0.3)) is report
+
+    def test_signed_zero_shares_entry(self):
+        """0.0 e -0.0 são iguais e produzem o mesmo relatório"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        report = use_case.execute(_investment(annual_rate=0.0))
+
+        assert use_case.execute(_investment(annual_rate=-0.0)) is report
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf")])
+    def test_non_finite_values_are_not_cached(self, value: float):
+        """Investimentos com NaN ou infinito não ocupam espaço no cache"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        use_case.execute(_investment(principal=value))
+        use_case.execute(_investment(contribution=value))
+        use_case.execute(replace(_investment(), rate_schedule=(RateSegment(6, value),)))
+
+        assert cache.stats.size == 0
+
+    def test_find_resumable_returns_same_investment_with_other_horizon(self):
+        """Investimentos que só diferem no prazo são encontrados pelo último gravado"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        report = use_case.execute(_investment())
+
+        assert cache.find_resumable(replace(_investment(), total_periods=24)) == (_investment(), report)
+        assert cache.find_resumable(_investment()) is None
+        assert cache.find_resumable(replace(_investment(), total_periods=24, annual_rate=0.1)) is None
+
+    def test_find_resumable_forgets_evicted_entries(self):
+        """Entradas descartadas deixam de ser candidatas à retomada"""
+        cache = LRUSimulationCache(max_size=1)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+
+        use_case.execute(_investment())
+        use_case.execute(_investment(principal=2.0))
+
+        assert cache.find_resumable(replace(_investment(), total_periods=24)) is None
+
+    def test_use_case_resumes_loaded_evolutions(self):
+        """Com as evoluções já carregadas, mudar o prazo reaproveita as linhas em cache"""
+        cache = LRUSimulationCache(max_size=8)
+        use_case = SimulateInvestmentUseCase(cache=cache)
+        previous = use_case.execute(_investment(contribution=50.0))
+        list(previous.monthly_evolution)
+        list(previous.yearly_evolution)
+
+        extended = replace(_investment(contribution=50.0), total_periods=30)
+        report = use_case.execute(extended)
+        expected = SimulateInvestmentUseCase().execute(extended)
+
+        assert not report.monthly_evolution.is_loaded
+        assert report.monthly_evolution[:12] == list(previous.monthly_evolution)
+        assert report.monthly_evolution[0] is previous.monthly_evolution[0]
+        assert report.monthly_evolution == list(expected.monthly_evolution)
+        assert report.yearly_evolution == list(expected.yearly_evolution)
+        assert report.summary == expected.summary
+
+    @pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"max_size": 1, "ttl": 0}])
+    def test_invalid_configuration(self, kwargs):
+        """Limite e TTL precisam ser positivos"""
+        with pytest.raises(ValueError):
+            LRUSimulationCache(**kwargs)
@@ -0,0 +1,134 @@
+from dataclasses import replace
+
+import pytest
+
+from src.python.application.cache.investment_key import canonical_investment, investment_key
+from src.python.application.cache.report_codec import (
+    decode_report,
+    decode_yearly_evolution,
+    encode_report,
+    encode_yearly_evolution
+)
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+@pytest.fixture
+def investment() -> Investment:
+    return Investment(
+        principal=10000.0,
+        annual_rate=0.10,
+        total_periods=30,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        contribution=Contribution(amount=500.0, frequency=CompoundingFrequency.MONTHLY)
+    )
+
+
+class TestInvestmentKey:
+    """Testes da chave canônica derivada do Investment"""
+
+    def test_key_is_stable_and_canonical(self, investment: Investment):
+        """Valores equivalentes geram a mesma chave; valores diferentes, chaves diferentes"""
+        same = Investment(
+            principal=10000,
+            annual_rate=0.10,
+            total_periods=30,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=500, frequency=CompoundingFrequency.MONTHLY)
+        )
+        other = Investment(
+            principal=10000.0,
+            annual_rate=0.1 + 1e-17 + 1e-16,
+            total_periods=30,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=500.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+        assert investment_key(investment) == investment_key(same)
+        assert investment_key(investment) != investment_key(other)
+        assert len(investment_key(investment)) == 64
+
+    def test_rate_schedule_is_part_of_the_key(self, investment: Investment):
+        """Cronogramas diferentes geram chaves diferentes; sem cronograma a forma canônica não muda"""
+        scheduled = replace(investment, rate_schedule=(RateSegment(13, 0.08),))
+        rescheduled = replace(investment, rate_schedule=(RateSegment(14, 0.08),))
+
+        assert canonical_investment(investment).count("|") == 5
+        assert canonical_investment(scheduled).startswith(canonical_investment(investment) + "|")
+        assert len({investment_key(investment), investment_key(scheduled), investment_key(rescheduled)}) == 3
+
+    def test_signed_zero_is_normalized(self):
+        """-0.0 e 0.0 produzem a mesma forma canônica"""
+        positive = Investment(0.0, 0.0, 12, CompoundingFrequency.YEARLY)
+        negative = Investment(-0.0, -0.0, 12, CompoundingFrequency.YEARLY)
+
+        assert canonical_investment(positive) == canonical_investment(negative)
+
+
+class TestReportCodec:
+    """Testes da serialização binária de FullSimulationReport"""
+
+    def test_summary_only_round_trip_keeps_evolutions_lazy(self, investment: Investment):
+        """Evoluções não materializadas não são gravadas e voltam preguiçosas"""
+        report = SimulateInvestmentUseCase().execute(investment)
+
+        data = encode_report(report)
+        decoded = decode_report(data, investment)
+
+        assert len(data) == 2 + 5 * 8
+        assert decoded.summary == report.summary
+        assert not decoded.monthly_evolution.is_loaded
+        assert decoded.monthly_evolution == report.monthly_evolution
+        assert decoded.yearly_evolution == report.yearly_evolution
+
+    def test_materialized_evolutions_round_trip(self, investment: Investment):
+        """Evoluções já materializadas são gravadas e lidas sem perda"""
+        report = SimulateInvestmentUseCase().execute(investment)
+        list(report.yearly_evolution)
+        list(report.monthly_evolution)
+
+        decoded = decode_report(encode_report(report), investment)
+
+        assert decoded == report
+        assert isinstance(decoded.monthly_evolution, list)
+        assert isinstance(decoded.yearly_evolution, list)
+
+    def test_only_loaded_sections_are_encoded(self, investment: Investment):
+        """Só a evolução materializada é gravada; a outra continua preguiçosa"""
+        report = SimulateInvestmentUseCase().execute(investment)
+        list(report.yearly_evolution)
+
+        decoded = decode_report(encode_report(report), investment)
+
+        assert isinstance(decoded.yearly_evolution, list)
+        assert not decoded.monthly_evolution.is_loaded
+        assert decoded == report
+
+    def test_unknown_version_is_rejected(self, investment: Investment):
+        """Dados de outra versão do formato são rejeitados"""
+        data = bytearray(encode_report(SimulateInvestmentUseCase().execute(investment)))
+        data[0] = 99
+
+        with pytest.raises(ValueError):
+            decode_report(bytes(data), investment)
+
+    def test_yearly_evolution_round_trip(self, investment: Investment):
+        """A evolução anual sozinha é gravada só depois de materializada"""
+        report = SimulateInvestmentUseCase().execute(investment)
+        assert encode_yearly_evolution(report) is None
+
+        yearly = list(report.yearly_evolution)
+        data = encode_yearly_evolution(report)
+
+        assert len(data) == 2 + 4 + len(yearly) * (4 + 6 * 8)
+        assert decode_yearly_evolution(data) == yearly
+
+    def test_report_without_yearly_evolution_is_rejected_as_yearly(self, investment: Investment):
+        """Dados sem a seção anual não são lidos como evolução anual"""
+        with pytest.raises(ValueError):
+            decode_yearly_evolution(encode_report(SimulateInvestmentUseCase().execute(investment)))
@@ -0,0 +1,46 @@
+import pytest
+
+from src.python.application.domain.simulation_result import PeriodDetail, PeriodDetails
+
+
+class TestPeriodDetails:
+    """Testes do armazenamento colunar de detalhes por período"""
+
+    @pytest.fixture
+    def details(self) -> PeriodDetails:
+        details = PeriodDetails()
+        details.append(110.0, 10.0, 0.0)
+        details.append(231.0, 21.0, 100.0)
+        details.append(364.1, 33.1, 100.0)
+        return details
+
+    def test_indexing_yields_period_detail(self, details: PeriodDetails):
+        """Indexar devolve PeriodDetail com o número do período"""
+        assert len(details) == 3
+        assert details[0] == PeriodDetail(period=1, balance=110.0, interest_earned=10.0, contribution=0.0)
+        assert details[-1] == PeriodDetail(period=3, balance=364.1, interest_earned=33.1, contribution=100.0)
+
+        with pytest.raises(IndexError):
+            details[3]
+
+    def test_slice_keeps_period_numbers(self, details: PeriodDetails):
+        """Fatias continuam colunares e preservam a numeração dos períodos"""
+        tail = details[1:]
+
+        assert isinstance(tail, PeriodDetails)
+        assert [d.period for d in tail] == [2, 3]
+        assert details[::2] == [details[0], details[2]]
+
+    def test_rows_iterate_columns(self, details: PeriodDetails):
+        """rows() percorre as colunas como tuplas"""
+        assert list(details.rows()) == [
+            (1, 110.0, 10.0, 0.0),
+            (2, 231.0, 21.0, 100.0),
+            (3, 364.1, 33.1, 100.0),
+        ]
+
+    def test_equality_with_list_of_period_details(self, details: PeriodDetails):
+        """A visão colunar é comparável à lista de dataclasses equivalente"""
+        assert details == list(details)
+        assert details != list(details)[:2]
+        assert not PeriodDetails()
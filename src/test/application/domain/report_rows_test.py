@@ -0,0 +1,41 @@
+import pickle
+from dataclasses import FrozenInstanceError, asdict, replace
+
+import pytest
+
+from src.python.application.domain.full_simulation_report import SimulationSummary
+from src.python.application.domain.monthly_summary import MonthlySummary
+from src.python.application.domain.simulation_result import PeriodDetail
+from src.python.application.domain.year_summary import YearSummary
+
+ROWS = [
+    PeriodDetail(3, 1030.0, 10.0, 100.0),
+    MonthlySummary(3, 1000.0, 1030.0, 20.0, 60.0, 10.0, 25.0),
+    YearSummary(1, 0.0, 1030.0, 60.0, 60.0, 25.0, 25.0),
+    SimulationSummary(1030.0, 1060.0, 25.0, 60.0, 0.1),
+]
+
+
+class TestReportRows:
+
+    @pytest.mark.parametrize("row", ROWS, ids=lambda row: type(row).__name__)
+    def test_should_not_have_instance_dict(self, row):
+        """Com slots, cada linha guarda só os campos, sem __dict__ por instância"""
+        assert not hasattr(row, "__dict__")
+
+    @pytest.mark.parametrize("row", ROWS, ids=lambda row: type(row).__name__)
+    def test_should_keep_dataclass_api(self, row):
+        """Imutabilidade, asdict, replace, igualdade e pickle continuam funcionando"""
+        first_field = next(iter(asdict(row)))
+
+        with pytest.raises(FrozenInstanceError):
+            setattr(row, first_field, 0)
+        assert type(row)(**asdict(row)) == row
+        assert replace(row, **{first_field: 99}) != row
+        assert pickle.loads(pickle.dumps(row)) == row
+        assert hash(row) == hash(type(row)(**asdict(row)))
+
+    def test_should_build_period_detail_positionally_in_field_order(self):
+        detail = PeriodDetail(3, 1030.0, 10.0, 100.0)
+
+        assert detail == PeriodDetail(period=3, balance=1030.0, interest_earned=10.0, contribution=100.0)
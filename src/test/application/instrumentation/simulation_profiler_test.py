@@ -0,0 +1,109 @@
+import json
+import os
+import pstats
+import threading
+
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.instrumentation.simulation_profiler import SimulationProfiler
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+INVESTMENT = Investment(
+    principal=1000.0,
+    annual_rate=0.12,
+    total_periods=120,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+    contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY),
+    rate_schedule=(RateSegment(start_period=61, annual_rate=0.08),)
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _simulate():
+    return CompoundInterestCalculator().simulate(INVESTMENT, detailed=True).final_amount
+
+
+class TestSimulationProfiler:
+    """Testes da captura de perfis de simulações"""
+
+    def test_writes_profile_and_parameters(self, tmp_path):
+        """O perfil pstats é gravado junto com os parâmetros do investimento"""
+        profiler = SimulationProfiler(str(tmp_path))
+
+        result, path = profiler.run(INVESTMENT, _simulate)
+
+        assert result == _simulate()
+        stats = pstats.Stats(path)
+        assert any(name == "simulate" for _, _, name in stats.stats)
+
+        with open(path.replace(".pstats", ".json"), encoding="utf-8") as file:
+            metadata = json.load(file)
+        assert metadata["investment"]["compounding_frequency"] == "MONTHLY"
+        assert metadata["investment"]["contribution"] == {"amount": 100.0, "frequency": "MONTHLY"}
+        assert metadata["investment"]["rate_schedule"] == [[61, 0.08]]
+        assert metadata["profile"] == os.path.basename(path)
+
+    def test_collapsed_format(self, tmp_path):
+        """No formato collapsed cada linha é uma pilha seguida do tempo em microssegundos"""
+        profiler = SimulationProfiler(str(tmp_path), profile_format="collapsed")
+
+        _, path = profiler.run(INVESTMENT, _simulate)
+
+        lines = open(path, encoding="utf-8").read().splitlines()
+        assert lines
+        for line in lines:
+            stack, value = line.rsplit(" ", 1)
+            assert stack and int(value) >= 0
+        assert any(line.split(" ")[0].endswith("(simulate)") for line in lines)
+
+    def test_rate_limited(self, tmp_path):
+        """Dentro de min_interval a função roda sem perfil"""
+        clock = FakeClock()
+        profiler = SimulationProfiler(str(tmp_path), min_interval=60.0, clock=clock)
+
+        assert profiler.run(INVESTMENT, _simulate)[1] is not None
+        clock.now = 59.0
+        assert profiler.run(INVESTMENT, _simulate)[1] is None
+        clock.now = 120.0
+        assert profiler.run(INVESTMENT, _simulate)[1] is not None
+        assert len(list(tmp_path.glob("*.pstats"))) == 2
+
+    def test_only_one_profile_at_a_time(self, tmp_path):
+        """Enquanto um perfil é capturado, outras chamadas rodam sem perfil"""
+        profiler = SimulationProfiler(str(tmp_path), min_interval=0.0)
+        started, release = threading.Event(), threading.Event()
+        paths = []
+
+        def slow():
+            started.set()
+            release.wait()
+
+        thread = threading.Thread(target=lambda: paths.append(profiler.run(INVESTMENT, slow)[1]))
+        thread.start()
+        started.wait()
+        try:
+            assert profiler.run(INVESTMENT, _simulate)[1] is None
+        finally:
+            release.set()
+            thread.join()
+
+        assert paths[0] is not None
+
+    @pytest.mark.parametrize("kwargs", [{"min_interval": -1}, {"profile_format": "svg"}])
+    def test_invalid_configuration(self, tmp_path, kwargs):
+        """Intervalo negativo e formatos desconhecidos são recusados"""
+        with pytest.raises(ValueError):
+            SimulationProfiler(str(tmp_path), **kwargs)
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from src.python.application.instrumentation.stage_timer import (
+    StageHistograms,
+    StageTimings,
+    collect_stage_timings,
+    timed,
+    timed_stage
+)
+from src.python.application.domain.simulation_result import Investment, CompoundingFrequency, Contribution
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+class TestStageTimer:
+    """Testes dos temporizadores de etapa"""
+
+    def test_stages_are_ignored_outside_collection(self):
+        """Sem coleta ativa os temporizadores não medem nada e o contexto é compartilhado"""
+        assert timed_stage("a") is timed_stage("b")
+
+        @timed("decorated")
+        def double(value):
+            return value * 2
+
+        assert double(4) == 8
+
+    def test_collects_and_accumulates_stages(self):
+        """Etapas repetidas somam as durações, na ordem em que terminaram pela primeira vez"""
+        @timed("decorated")
+        def work():
+            return sum(range(1000))
+
+        with collect_stage_timings() as timings:
+            with timed_stage("first"):
+                sum(range(1000))
+            work()
+            with timed_stage("first"):
+                work()
+
+        assert list(timings.durations) == ["first", "decorated"]
+        assert all(seconds > 0 for seconds in timings.durations.values())
+
+    def test_collection_is_isolated_per_task(self):
+        """Cada tarefa asyncio tem a sua coleta, mesmo intercaladas no mesmo event loop"""
+        async def request(stage: str) -> StageTimings:
+            with collect_stage_timings() as timings:
+                with timed_stage(stage):
+                    await asyncio.sleep(0.01)
+            return timings
+
+        async def scenario():
+            return await asyncio.gather(request("a"), request("b"))
+
+        first, second = asyncio.run(scenario())
+
+        assert list(first.durations) == ["a"]
+        assert list(second.durations) == ["b"]
+
+    def test_use_case_reports_its_stages(self):
+        """O caso de uso mede o cálculo, a montagem do relatório e a evolução quando carregada"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=24,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+        with collect_stage_timings() as timings:
+            report = SimulateInvestmentUseCase().execute(investment)
+            len(report.yearly_evolution)
+
+        assert list(timings.durations) == ["calculator", "report", "evolution"]
+
+
+class TestStageHistograms:
+    """Testes dos histogramas cumulativos por etapa"""
+
+    def test_cumulative_buckets(self):
+        """Cada bucket conta as observações menores ou iguais ao seu limite"""
+        histograms = StageHistograms(buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.01, 0.05, 2.0):
+            histograms.observe("calculator", seconds)
+
+        snapshot = histograms.snapshot()["calculator"]
+
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(2.065)
+        assert snapshot["buckets"] == {"0.01": 2, "0.1": 3, "+Inf": 4}
+
+    def test_observe_all_and_clear(self):
+        """observe_all registra todas as etapas de uma coleta"""
+        histograms = StageHistograms()
+        timings = StageTimings()
+        timings.add("validation", 0.001)
+        timings.add("total", 0.002)
+
+        histograms.observe_all(timings)
+        assert set(histograms.snapshot()) == {"validation", "total"}
+
+        histograms.clear()
+        assert histograms.snapshot() == {}
+
+    @pytest.mark.parametrize("buckets", [(), (0.1, 0.01), (0.1, 0.1)])
+    def test_invalid_buckets(self, buckets):
+        """Os limites precisam ser estritamente crescentes"""
+        with pytest.raises(ValueError):
+            StageHistograms(buckets=buckets)
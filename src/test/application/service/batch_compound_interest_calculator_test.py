@@ -0,0 +1,126 @@
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.batch_compound_interest_calculator import BatchCompoundInterestCalculator
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+
+
+def _scenarios():
+    investments = []
+    for frequency in CompoundingFrequency:
+        for annual_rate in (0.0, 0.03, 0.12, 0.45):
+            for years in (1, 3, 10):
+                for contribution in (None, Contribution(amount=200.0, frequency=frequency)):
+                    investments.append(
+                        Investment(
+                            principal=5000.0,
+                            annual_rate=annual_rate,
+                            total_periods=years * frequency.value,
+                            compounding_frequency=frequency,
+                            contribution=contribution
+                        )
+                    )
+    investments.append(
+        Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=24,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=50.0, frequency=CompoundingFrequency.YEARLY)
+        )
+    )
+    return investments
+
+
+class TestBatchCompoundInterestCalculator:
+    """Compara o motor vetorizado com o motor escalar"""
+
+    @pytest.fixture
+    def batch_calculator(self) -> BatchCompoundInterestCalculator:
+        return BatchCompoundInterestCalculator()
+
+    def test_final_balances_match_scalar_engine(self, batch_calculator: BatchCompoundInterestCalculator):
+        """Saldos finais, total investido e juros devem bater com simulate()"""
+        investments = _scenarios()
+        calculator = CompoundInterestCalculator()
+
+        batch = batch_calculator.simulate_many(investments)
+
+        assert len(batch) == len(investments)
+        for investment, result in zip(investments, batch.to_simulation_results()):
+            expected = calculator.simulate(investment, detailed=True)
+            assert result.final_amount == pytest.approx(expected.final_amount, rel=1e-9)
+            assert result.total_invested == pytest.approx(expected.total_invested, rel=1e-9)
+            assert result.total_interest == pytest.approx(expected.total_interest, rel=1e-9, abs=1e-6)
+
+    def test_balance_matrix_matches_period_details(self, batch_calculator: BatchCompoundInterestCalculator):
+        """Cada linha da matriz de saldos reproduz os saldos período a período"""
+        investments = _scenarios()
+        calculator = CompoundInterestCalculator()
+
+        batch = batch_calculator.simulate_many(investments, with_balances=True)
+
+        assert batch.balances.shape == (len(investments), max(i.total_periods for i in investments))
+        for row, investment in zip(batch.balances, investments):
+            details = calculator.simulate(investment, detailed=True).period_details
+            np.testing.assert_allclose(row[:len(details)], [d.balance for d in details], rtol=1e-9)
+            assert np.isnan(row[len(details):]).all()
+
+    def test_rate_below_minus_one_falls_back_to_scalar_engine(
+            self,
+            batch_calculator: BatchCompoundInterestCalculator
+    ):
+        """Taxas por período <= -100% seguem pelo laço escalar"""
+        investment = Investment(
+            principal=100.0,
+            annual_rate=-24.0,
+            total_periods=3,
+            compounding_frequency=CompoundingFrequency.MONTHLY
+        )
+
+        batch = batch_calculator.simulate_many([investment], with_balances=True)
+        expected = CompoundInterestCalculator().simulate(investment, detailed=True)
+
+        assert batch.final_amounts[0] == expected.final_amount
+        assert batch.balances[0].tolist() == [d.balance for d in expected.period_details]
+
+    def test_empty_batch(self, batch_calculator: BatchCompoundInterestCalculator):
+        """Lote vazio devolve arrays vazios"""
+        batch = batch_calculator.simulate_many([], with_balances=True)
+
+        assert len(batch) == 0
+        assert batch.balances.shape == (0, 0)
+        assert not math.isnan(batch.total_interest.sum())
+
+    @pytest.mark.parametrize("principal, contribution", [(1000.0, 0.0), (0.0, 10.0), (1000.0, 10.0)])
+    def test_overflowing_growth_matches_scalar_engine(
+            self,
+            batch_calculator: BatchCompoundInterestCalculator,
+            principal: float,
+            contribution: float
+    ):
+        """Crescimento além do maior float dá inf, como no motor escalar, sem nan nem avisos do numpy"""
+        investment = Investment(
+            principal=principal,
+            annual_rate=20.0,
+            total_periods=50 * 365,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=contribution, frequency=CompoundingFrequency.DAILY)
+            if contribution else None
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            batch = batch_calculator.simulate_many([investment], with_balances=True)
+        expected = CompoundInterestCalculator().simulate(investment, detailed=True)
+
+        assert batch.final_amounts[0] == expected.final_amount == math.inf
+        np.testing.assert_allclose(batch.balances[0], expected.period_details.balances, rtol=1e-9)
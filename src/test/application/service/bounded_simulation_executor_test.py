@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.python.application.service.bounded_simulation_executor import (
+    BoundedSimulationExecutor,
+    ExecutorSaturatedError
+)
+
+
+class TestBoundedSimulationExecutor:
+    """Testes do executor limitado usado pelo endpoint assíncrono"""
+
+    @pytest.fixture
+    def executor(self):
+        executor = BoundedSimulationExecutor(max_concurrency=1, max_pending=1, executor_class=ThreadPoolExecutor)
+        yield executor
+        executor.close()
+
+    def test_runs_off_the_event_loop(self, executor: BoundedSimulationExecutor):
+        """A função roda numa thread do pool e o resultado volta para a corrotina"""
+        async def scenario():
+            return await executor.run(lambda a, b: (a + b, threading.current_thread()), 2, 3)
+
+        total, thread = asyncio.run(scenario())
+
+        assert total == 5
+        assert thread is not threading.main_thread()
+        assert executor.in_flight == 0
+
+    def test_rejects_when_saturated(self, executor: BoundedSimulationExecutor):
+        """Acima de max_concurrency + max_pending a chamada é recusada sem enfileirar"""
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(executor.capacity)]
+            await asyncio.sleep(0)
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(release.wait)
+            release.set()
+            await asyncio.gather(*running)
+
+        asyncio.run(scenario())
+
+        assert executor.in_flight == 0
+
+    def test_slot_is_kept_until_cancelled_work_finishes(self, executor: BoundedSimulationExecutor):
+        """Cancelar quem aguarda não libera a vaga enquanto o trabalho ainda ocupa o pool"""
+        release = threading.Event()
+
+        async def scenario():
+            task = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.sleep(0.01)
+            assert executor.in_flight == 1
+            release.set()
+
+        asyncio.run(scenario())
+        executor.close()
+
+        assert executor.in_flight == 0
+
+    def test_errors_release_the_slot(self, executor: BoundedSimulationExecutor):
+        """Exceções da função chegam a quem aguarda e liberam a vaga"""
+        async def scenario():
+            await executor.run(int, "abc")
+
+        with pytest.raises(ValueError):
+            asyncio.run(scenario())
+
+        assert executor.in_flight == 0
+
+    @pytest.mark.parametrize("kwargs", [{"max_concurrency": 0}, {"max_pending": -1}])
+    def test_invalid_configuration(self, kwargs):
+        """Concorrência precisa ser positiva e a fila não pode ser negativa"""
+        with pytest.raises(ValueError):
+            BoundedSimulationExecutor(**kwargs)
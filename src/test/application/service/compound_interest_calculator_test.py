@@ -0,0 +1,328 @@
+import itertools
+import math
+
+import pytest
+
+from src.python.application.builders.simulation_report_builder import SimulationReportBuilder
+from src.python.application.builders.streaming_simulation_report_builder import StreamingSimulationReportBuilder
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.service.batch_compound_interest_calculator import BatchCompoundInterestCalculator
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.contribution_schedule import ContributionSchedule
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+
+# Tolerância relativa entre a fórmula fechada e o laço período a período.
+# O laço acumula um erro de arredondamento da ordem de n * 2^-53 (n = total de períodos);
+# para 50 anos diários isso fica abaixo de 1e-11, então 1e-9 deixa folga confortável.
+CLOSED_FORM_RELATIVE_TOLERANCE = 1e-9
+
+
+class TestCompoundInterestCalculatorClosedForm:
+    """Compara o caminho resumido (fórmula fechada) com o laço detalhado"""
+
+    @pytest.fixture
+    def calculator(self) -> CompoundInterestCalculator:
+        return CompoundInterestCalculator()
+
+    @pytest.mark.parametrize("frequency", list(CompoundingFrequency))
+    @pytest.mark.parametrize("years", [1, 5, 30, 50])
+    @pytest.mark.parametrize("annual_rate", [0.0, 0.0001, 0.06, 0.5])
+    @pytest.mark.parametrize("contribution_amount", [0.0, 250.0])
+    def test_summary_matches_iterative_result(
+            self,
+            calculator: CompoundInterestCalculator,
+            frequency: CompoundingFrequency,
+            years: int,
+            annual_rate: float,
+            contribution_amount: float
+    ):
+        """O resumo O(1) deve bater com o laço dentro da tolerância documentada"""
+        contribution = Contribution(amount=contribution_amount, frequency=frequency) if contribution_amount else None
+        investment = Investment(
+            principal=10000.0,
+            annual_rate=annual_rate,
+            total_periods=years * frequency.value,
+            compounding_frequency=frequency,
+            contribution=contribution
+        )
+
+        summary = calculator.simulate(investment)
+        iterative = calculator.simulate(investment, detailed=True)
+
+        assert summary.period_details is None
+        assert summary.final_amount == pytest.approx(iterative.final_amount, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert summary.total_invested == pytest.approx(iterative.total_invested, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert summary.total_interest == pytest.approx(
+            iterative.total_interest,
+            rel=CLOSED_FORM_RELATIVE_TOLERANCE,
+            abs=1e-6
+        )
+
+    def test_zero_periods_returns_principal(self, calculator: CompoundInterestCalculator):
+        """Sem períodos o saldo final é o próprio principal"""
+        investment = Investment(
+            principal=1500.0,
+            annual_rate=0.10,
+            total_periods=0,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=10.0, frequency=CompoundingFrequency.DAILY)
+        )
+
+        result = calculator.simulate(investment)
+
+        assert result.final_amount == 1500.0
+        assert result.total_invested == 1500.0
+        assert result.total_interest == 0.0
+
+    @pytest.mark.parametrize("investment", [
+        Investment(1000.0, 20.0, 18250, CompoundingFrequency.DAILY),
+        Investment(1000.0, 1e308, 30, CompoundingFrequency.YEARLY),
+        Investment(0.0, 20.0, 18250, CompoundingFrequency.DAILY, Contribution(10.0, CompoundingFrequency.MONTHLY)),
+        Investment(1000.0, 0.10, 18250, CompoundingFrequency.DAILY, rate_schedule=(RateSegment(13, 20.0),)),
+    ], ids=["closed-form", "huge-rate", "event-schedule", "rate-schedule"])
+    def test_overflowing_growth_returns_inf(self, calculator: CompoundInterestCalculator, investment: Investment):
+        """Crescimento acima do maior float vira inf, como no laço, em vez de OverflowError"""
+        summary = calculator.simulate(investment)
+
+        assert summary.final_amount == math.inf
+        assert calculator.simulate(investment, detailed=True).final_amount == math.inf
+
+    def test_zero_balance_stays_zero_with_overflowing_growth(self, calculator: CompoundInterestCalculator):
+        """Sem principal nem aportes o saldo continua zero, e não nan"""
+        investment = Investment(0.0, 20.0, 18250, CompoundingFrequency.DAILY)
+
+        assert calculator.simulate(investment).final_amount == 0.0
+
+
+def _reference_balance(investment: Investment) -> float:
+    """Simulação de referência: calcula explicitamente quantos aportes caem em cada período"""
+    periods_per_year = investment.compounding_frequency.value
+    contributions_per_year = investment.contribution.frequency.value
+    period_rate = investment.annual_rate / periods_per_year
+
+    # Aporte k acontece no instante k / fc anos, isto é, no início do período floor(k * f / fc) + 1
+    deposits_per_period = [0] * (investment.total_periods + 1)
+    for k in itertools.count():
+        period = k * periods_per_year // contributions_per_year + 1
+        if period > investment.total_periods:
+            break
+        deposits_per_period[period] += 1
+
+    balance = investment.principal
+    for period in range(1, investment.total_periods + 1):
+        balance += investment.contribution.amount * deposits_per_period[period]
+        balance *= 1 + period_rate
+    return balance
+
+
+class TestMixedFrequencyContributions:
+    """Aportes com frequência diferente da capitalização seguem o cronograma de eventos"""
+
+    @pytest.fixture
+    def calculator(self) -> CompoundInterestCalculator:
+        return CompoundInterestCalculator()
+
+    @pytest.mark.parametrize("compounding_frequency", list(CompoundingFrequency))
+    @pytest.mark.parametrize("contribution_frequency", list(CompoundingFrequency))
+    @pytest.mark.parametrize("years", [1, 3])
+    def test_every_frequency_pairing(
+            self,
+            calculator: CompoundInterestCalculator,
+            compounding_frequency: CompoundingFrequency,
+            contribution_frequency: CompoundingFrequency,
+            years: int
+    ):
+        """Resumo, simulação detalhada e referência concordam para todas as combinações de frequência"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=years * compounding_frequency.value,
+            compounding_frequency=compounding_frequency,
+            contribution=Contribution(amount=100.0, frequency=contribution_frequency)
+        )
+
+        summary = calculator.simulate(investment)
+        detailed = calculator.simulate(investment, detailed=True)
+        expected_deposits = 100.0 * contribution_frequency.value * years
+
+        assert summary.total_invested == pytest.approx(1000.0 + expected_deposits)
+        assert detailed.total_invested == pytest.approx(1000.0 + expected_deposits)
+        assert sum(detailed.period_details.contributions) == pytest.approx(expected_deposits)
+        assert summary.final_amount == pytest.approx(_reference_balance(investment), rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert detailed.final_amount == pytest.approx(summary.final_amount, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+
+        batch = BatchCompoundInterestCalculator().simulate_many([investment]).to_simulation_results()[0]
+        assert batch.final_amount == pytest.approx(summary.final_amount, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+
+    def test_monthly_deposits_into_daily_compounding_land_on_schedule(self, calculator: CompoundInterestCalculator):
+        """Depósitos mensais numa capitalização diária caem a cada 30 ou 31 dias"""
+        investment = Investment(
+            principal=0.0,
+            annual_rate=0.10,
+            total_periods=365,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=500.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+        details = calculator.simulate(investment, detailed=True).period_details
+        deposit_days = [d.period for d in details if d.contribution]
+
+        assert deposit_days == [1, 31, 61, 92, 122, 153, 183, 213, 244, 274, 305, 335]
+
+    def test_schedule_events_cost_is_proportional_to_contributions(self):
+        """Depósitos mensais em 30 anos diários geram 360 eventos, não 10.950"""
+        schedule = ContributionSchedule(amount=1.0, periods_per_year=365, contributions_per_year=12)
+
+        assert sum(1 for _ in schedule.events(30 * 365)) == 360
+        assert schedule.deposits_until(30 * 365) == 360
+        assert math.isclose(schedule.total_until(365), 12.0)
+
+
+def _reference_scheduled_balances(investment: Investment):
+    """Referência período a período: aporte no início do período e taxa do trecho vigente"""
+    schedule = ContributionSchedule.for_investment(investment)
+    periods_per_year = investment.compounding_frequency.value
+    segments = sorted(investment.rate_schedule, key=lambda segment: segment.start_period)
+
+    balance = investment.principal
+    balances = []
+    for period in range(1, investment.total_periods + 1):
+        annual_rate = investment.annual_rate
+        for segment in segments:
+            if segment.start_period <= period:
+                annual_rate = segment.annual_rate
+        balance += schedule.amount_for_period(period) if schedule else 0.0
+        balance *= 1 + annual_rate / periods_per_year
+        balances.append(balance)
+    return balances
+
+
+SCHEDULED = Investment(
+    principal=5000.0,
+    annual_rate=0.12,
+    total_periods=40,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+    contribution=Contribution(amount=250.0, frequency=CompoundingFrequency.MONTHLY),
+    rate_schedule=(RateSegment(7, 0.06), RateSegment(13, 0.0), RateSegment(20, -0.03), RateSegment(33, 0.2))
+)
+
+
+class TestRateSchedule:
+    """Cronogramas de taxa: capitalização em forma fechada trecho a trecho"""
+
+    @pytest.fixture(params=[None, GrowthFactorTables()], ids=["loop", "growth-tables"])
+    def calculator(self, request) -> CompoundInterestCalculator:
+        return CompoundInterestCalculator(growth_tables=request.param)
+
+    @pytest.mark.parametrize(
+        "investment",
+        [
+            SCHEDULED,
+            Investment(
+                principal=5000.0,
+                annual_rate=0.12,
+                total_periods=40,
+                compounding_frequency=CompoundingFrequency.MONTHLY,
+                contribution=Contribution(amount=1000.0, frequency=CompoundingFrequency.YEARLY),
+                rate_schedule=SCHEDULED.rate_schedule
+            ),
+            Investment(
+                principal=1000.0,
+                annual_rate=0.1,
+                total_periods=5 * 365,
+                compounding_frequency=CompoundingFrequency.DAILY,
+                contribution=Contribution(amount=300.0, frequency=CompoundingFrequency.MONTHLY),
+                rate_schedule=(RateSegment(400, 0.13), RateSegment(1000, 0.05))
+            ),
+        ],
+        ids=["uniform", "yearly-into-monthly", "monthly-into-daily"]
+    )
+    def test_summary_and_details_match_reference(
+            self,
+            calculator: CompoundInterestCalculator,
+            investment: Investment
+    ):
+        """Resumo, detalhes, iter_periods e balance_at batem com a referência período a período"""
+        expected = _reference_scheduled_balances(investment)
+
+        summary = calculator.simulate(investment)
+        detailed = calculator.simulate(investment, detailed=True)
+
+        assert summary.final_amount == pytest.approx(expected[-1], rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert list(detailed.period_details.balances) == pytest.approx(expected, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert [d.balance for d in calculator.iter_periods(investment)] == pytest.approx(expected, rel=1e-12)
+        for period in (1, 6, 7, 13, 19, 20, 33, investment.total_periods):
+            assert calculator.balance_at(investment, period) == pytest.approx(
+                expected[period - 1], rel=CLOSED_FORM_RELATIVE_TOLERANCE
+            )
+
+    def test_period_windows_cross_segment_boundaries(self, calculator: CompoundInterestCalculator):
+        """Janelas de period_details que atravessam trechos reproduzem a simulação completa"""
+        full = calculator.simulate(SCHEDULED, detailed=True).period_details
+
+        for start, stop in ((1, 8), (6, 14), (13, 13), (19, 41), (33, 34)):
+            window = calculator.period_details(SCHEDULED, start, stop)
+            assert window.first_period == start
+            assert list(window.balances) == pytest.approx(list(full.balances[start - 1:stop - 1]), rel=1e-12)
+            assert list(window.interests) == pytest.approx(
+                list(full.interests[start - 1:stop - 1]), rel=1e-9, abs=1e-9
+            )
+
+    def test_yearly_evolution_across_boundaries(self, calculator: CompoundInterestCalculator):
+        """Evolução anual e mensal seguem corretas com mudanças de taxa no meio do ano"""
+        expected = _reference_scheduled_balances(SCHEDULED)
+
+        result = calculator.simulate(SCHEDULED, detailed=True)
+        builder = SimulationReportBuilder(result=result)
+        yearly = builder.build_yearly_evolution(SCHEDULED.compounding_frequency)
+        monthly = builder.build_monthly_evolution()
+        streamed_monthly, streamed_yearly = StreamingSimulationReportBuilder(
+            SCHEDULED.compounding_frequency
+        ).build(calculator.iter_periods(SCHEDULED))
+
+        year_ends = [expected[11], expected[23], expected[35], expected[39]]
+        assert [year.final_balance for year in yearly] == pytest.approx(year_ends)
+        assert [year.final_balance for year in streamed_yearly] == pytest.approx(year_ends)
+        assert yearly[-1].interest_total == pytest.approx(expected[-1] - 5000.0 - 40 * 250.0)
+        assert [m.interest_this_month for m in streamed_monthly] == pytest.approx(
+            [m.interest_this_month for m in monthly]
+        )
+        # No período 13 a taxa é zero: não há juros naquele mês
+        assert monthly[12].interest_this_month == 0.0
+
+    def test_rate_at_or_below_minus_one_falls_back_to_loop(self, calculator: CompoundInterestCalculator):
+        """Um trecho com perda total por período não tem forma fechada e usa o laço"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=24,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY),
+            rate_schedule=(RateSegment(10, -12.0), RateSegment(11, 0.12))
+        )
+        expected = _reference_scheduled_balances(investment)
+
+        assert calculator.simulate(investment).final_amount == pytest.approx(expected[-1], rel=1e-12)
+        assert calculator.balance_at(investment, 15) == pytest.approx(expected[14], rel=1e-12)
+
+    def test_batch_falls_back_to_scalar_engine(self):
+        """O motor em lote delega ao motor escalar as linhas com cronograma"""
+        plain = Investment(
+            principal=5000.0,
+            annual_rate=0.12,
+            total_periods=40,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=250.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+        batch = BatchCompoundInterestCalculator().simulate_many([plain, SCHEDULED], with_balances=True)
+
+        expected = _reference_scheduled_balances(SCHEDULED)
+        assert batch.final_amounts[1] == pytest.approx(expected[-1], rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert list(batch.balances[1]) == pytest.approx(expected, rel=CLOSED_FORM_RELATIVE_TOLERANCE)
+        assert batch.final_amounts[0] != pytest.approx(batch.final_amounts[1])
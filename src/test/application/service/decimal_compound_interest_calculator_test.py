@@ -0,0 +1,111 @@
+from decimal import Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP
+
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.decimal_compound_interest_calculator import DecimalCompoundInterestCalculator
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentDecimalUseCase
+
+MONTHLY = CompoundingFrequency.MONTHLY
+
+INVESTMENT = Investment(
+    principal=10000.0,
+    annual_rate=0.1075,
+    total_periods=360,
+    compounding_frequency=MONTHLY,
+    contribution=Contribution(amount=333.33, frequency=MONTHLY)
+)
+CENT = Decimal("0.01")
+
+
+class TestDecimalCompoundInterestCalculator:
+    """Motor decimal com arredondamento por período"""
+
+    def test_rounding_rule_is_applied_to_each_period(self):
+        """Juros de 0,125 viram 0,12 no arredondamento bancário e 0,13 no half-up"""
+        investment = Investment(
+            principal=1.25,
+            annual_rate=0.1,
+            total_periods=1,
+            compounding_frequency=CompoundingFrequency.YEARLY
+        )
+
+        bankers = DecimalCompoundInterestCalculator(rounding=ROUND_HALF_EVEN).simulate(investment)
+        half_up = DecimalCompoundInterestCalculator(rounding=ROUND_HALF_UP).simulate(investment)
+
+        assert bankers.total_interest == Decimal("0.12")
+        assert half_up.total_interest == Decimal("0.13")
+
+    def test_every_period_is_in_cents_and_totals_reconcile(self):
+        """Saldos e juros ficam em centavos, e juros + aportes fecham exatamente com o saldo"""
+        result = DecimalCompoundInterestCalculator().simulate(INVESTMENT, detailed=True)
+
+        assert len(result.period_details) == 360
+        for detail in result.period_details:
+            assert detail.balance == detail.balance.quantize(CENT)
+            assert detail.interest_earned == detail.interest_earned.quantize(CENT)
+        assert result.final_amount == result.total_invested + result.total_interest
+        assert result.total_interest == sum(detail.interest_earned for detail in result.period_details)
+        assert result.total_invested == Decimal("10000.00") + 360 * Decimal("333.33")
+
+    def test_stays_within_rounding_drift_of_float_engine(self):
+        """A diferença para o motor float é só o acúmulo de arredondamentos de centavo"""
+        decimal_result = DecimalCompoundInterestCalculator().simulate(INVESTMENT)
+        float_result = CompoundInterestCalculator().simulate(INVESTMENT)
+
+        assert float(decimal_result.final_amount) == pytest.approx(float_result.final_amount, abs=0.005 * 360 * 10)
+
+    def test_unrounded_mode_matches_float_engine(self):
+        """Sem arredondamento por período o resultado só difere do float pela precisão"""
+        result = DecimalCompoundInterestCalculator(precision=40, places=None).simulate(INVESTMENT)
+
+        assert float(result.final_amount) == pytest.approx(
+            CompoundInterestCalculator().simulate(INVESTMENT).final_amount, rel=1e-12
+        )
+
+    def test_period_rate_is_derived_in_decimal(self):
+        """0,12 ao ano em capitalização mensal é exatamente 1% ao mês"""
+        investment = Investment(principal=1000.0, annual_rate=0.12, total_periods=2, compounding_frequency=MONTHLY)
+
+        result = DecimalCompoundInterestCalculator().simulate(investment, detailed=True)
+
+        assert [d.balance for d in result.period_details] == [Decimal("1010.00"), Decimal("1020.10")]
+
+    def test_mixed_contributions_and_rate_schedule(self):
+        """Aportes em outra frequência e cronograma de taxas seguem o mesmo calendário do motor float"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=30,
+            compounding_frequency=MONTHLY,
+            contribution=Contribution(amount=600.0, frequency=CompoundingFrequency.YEARLY),
+            rate_schedule=(RateSegment(13, 0.06),)
+        )
+
+        result = DecimalCompoundInterestCalculator(places=None).simulate(investment, detailed=True)
+        expected = CompoundInterestCalculator().simulate(investment, detailed=True).period_details
+
+        assert [float(d.contribution) for d in result.period_details] == list(expected.contributions)
+        assert [float(d.balance) for d in result.period_details] == pytest.approx(list(expected.balances), rel=1e-12)
+
+    @pytest.mark.parametrize("kwargs", [{"precision": 0}, {"places": -1}])
+    def test_rejects_invalid_settings(self, kwargs):
+        """Precisão precisa ser positiva e casas decimais não negativas"""
+        with pytest.raises(ValueError):
+            DecimalCompoundInterestCalculator(**kwargs)
+
+    def test_use_case_builds_report_from_decimal_engine(self):
+        """O relatório completo usa os valores do motor decimal"""
+        report = SimulateInvestmentDecimalUseCase().execute(INVESTMENT)
+        expected = DecimalCompoundInterestCalculator().simulate(INVESTMENT)
+
+        assert report.summary.final_balance == float(expected.final_amount)
+        assert len(report.yearly_evolution) == 30
+        assert report.yearly_evolution[-1].final_balance == float(expected.final_amount)
+        assert len(report.monthly_evolution) == 360
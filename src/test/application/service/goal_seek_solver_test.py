@@ -0,0 +1,102 @@
+from dataclasses import replace
+
+import pytest
+
+from src.python.application.domain.goal_seek import GoalSeekMethod, GoalSeekVariable
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.goal_seek_solver import GoalSeekSolver
+
+MONTHLY = CompoundingFrequency.MONTHLY
+YEARLY = CompoundingFrequency.YEARLY
+
+UNIFORM = Investment(
+    principal=1000.0,
+    annual_rate=0.12,
+    total_periods=120,
+    compounding_frequency=MONTHLY,
+    contribution=Contribution(amount=200.0, frequency=MONTHLY)
+)
+MIXED = replace(UNIFORM, contribution=Contribution(amount=2000.0, frequency=YEARLY))
+
+
+def _balance(investment: Investment) -> float:
+    return CompoundInterestCalculator().simulate(investment).final_amount
+
+
+class TestGoalSeekSolver:
+    """Resolve aporte, taxa ou prazo e confere o resultado com uma simulação direta"""
+
+    @pytest.fixture
+    def solver(self) -> GoalSeekSolver:
+        return GoalSeekSolver()
+
+    @pytest.mark.parametrize("investment", [UNIFORM, MIXED])
+    def test_contribution_is_solved_in_closed_form(self, solver: GoalSeekSolver, investment: Investment):
+        """O aporte encontrado leva exatamente ao saldo alvo"""
+        result = solver.solve(investment, 100000.0, GoalSeekVariable.CONTRIBUTION_AMOUNT)
+
+        solved = replace(investment, contribution=replace(investment.contribution, amount=result.value))
+        assert result.method is GoalSeekMethod.CLOSED_FORM
+        assert result.converged and result.iterations == 0
+        assert _balance(solved) == pytest.approx(100000.0, rel=1e-12)
+
+    def test_contribution_is_zero_when_target_is_already_reached(self, solver: GoalSeekSolver):
+        """Sem necessidade de aportes, o aporte exigido é zero"""
+        result = solver.solve(UNIFORM, 500.0, GoalSeekVariable.CONTRIBUTION_AMOUNT)
+
+        assert result.value == 0.0
+        assert result.achieved_balance >= 500.0
+
+    @pytest.mark.parametrize("investment", [UNIFORM, MIXED, replace(UNIFORM, annual_rate=0.0)])
+    def test_rate_converges_to_target(self, solver: GoalSeekSolver, investment: Investment):
+        """A taxa encontrada reproduz o saldo alvo dentro da tolerância"""
+        target = _balance(replace(investment, annual_rate=0.0731))
+
+        result = solver.solve(investment, target, GoalSeekVariable.ANNUAL_RATE)
+
+        assert result.converged
+        assert result.value == pytest.approx(0.0731, rel=1e-7)
+        assert result.iterations <= 50
+        assert result.evaluations >= result.iterations
+
+    @pytest.mark.parametrize(
+        "investment, method",
+        [
+            (UNIFORM, GoalSeekMethod.CLOSED_FORM),
+            (replace(UNIFORM, annual_rate=0.0), GoalSeekMethod.CLOSED_FORM),
+            (replace(UNIFORM, annual_rate=-0.02), GoalSeekMethod.CLOSED_FORM),
+            (MIXED, GoalSeekMethod.BISECTION),
+        ]
+    )
+    def test_periods_is_smallest_horizon_reaching_target(
+            self,
+            solver: GoalSeekSolver,
+            investment: Investment,
+            method: GoalSeekMethod
+    ):
+        """O prazo é o menor número de períodos cujo saldo atinge o alvo"""
+        result = solver.solve(investment, 20000.0, GoalSeekVariable.TOTAL_PERIODS)
+
+        assert result.method is method and result.converged
+        assert _balance(replace(investment, total_periods=result.value)) >= 20000.0
+        assert _balance(replace(investment, total_periods=result.value - 1)) < 20000.0
+
+    @pytest.mark.parametrize(
+        "investment, target, solve_for",
+        [
+            (replace(UNIFORM, contribution=None, annual_rate=0.0), 5000.0, GoalSeekVariable.TOTAL_PERIODS),
+            (replace(UNIFORM, annual_rate=-0.5), 1e9, GoalSeekVariable.TOTAL_PERIODS),
+            (replace(UNIFORM, total_periods=0), 5000.0, GoalSeekVariable.ANNUAL_RATE),
+            (replace(UNIFORM, principal=0.0, contribution=None), 5000.0, GoalSeekVariable.ANNUAL_RATE),
+            (replace(UNIFORM, total_periods=0), 5000.0, GoalSeekVariable.CONTRIBUTION_AMOUNT),
+        ]
+    )
+    def test_unreachable_targets_raise(self, solver: GoalSeekSolver, investment, target, solve_for):
+        """Alvos impossíveis geram ValueError em vez de laços sem fim"""
+        with pytest.raises(ValueError):
+            solver.solve(investment, target, solve_for)
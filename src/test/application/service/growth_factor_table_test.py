@@ -0,0 +1,128 @@
+import math
+
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.growth_factor_table import GrowthFactorTables
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+
+def _investment(total_periods: int = 120, annual_rate: float = 0.12, principal: float = 1000.0) -> Investment:
+    return Investment(
+        principal=principal,
+        annual_rate=annual_rate,
+        total_periods=total_periods,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+    )
+
+
+class TestGrowthFactorTables:
+    """Testes das tabelas de fatores de crescimento pré-calculados"""
+
+    @pytest.mark.parametrize("frequency", list(CompoundingFrequency))
+    @pytest.mark.parametrize("annual_rate", [0.0, 0.07, 0.5])
+    def test_detailed_simulation_matches_iterative_loop(self, frequency: CompoundingFrequency, annual_rate: float):
+        """Saldos, juros e aportes obtidos pelas tabelas batem com o laço período a período"""
+        investment = Investment(
+            principal=2500.0,
+            annual_rate=annual_rate,
+            total_periods=10 * frequency.value,
+            compounding_frequency=frequency,
+            contribution=Contribution(amount=50.0, frequency=frequency)
+        )
+
+        expected = CompoundInterestCalculator().simulate(investment, detailed=True)
+        result = CompoundInterestCalculator(growth_tables=GrowthFactorTables()).simulate(investment, detailed=True)
+
+        assert result.final_amount == pytest.approx(expected.final_amount, rel=1e-9)
+        assert result.total_invested == expected.total_invested
+        assert len(result.period_details) == len(expected.period_details)
+        for actual, reference in zip(result.period_details, expected.period_details):
+            assert actual.period == reference.period
+            assert actual.balance == pytest.approx(reference.balance, rel=1e-9)
+            assert actual.interest_earned == pytest.approx(reference.interest_earned, rel=1e-9, abs=1e-9)
+            assert actual.contribution == reference.contribution
+
+    @pytest.mark.parametrize("principal, contribution_amount", [(1000.0, 0.0), (0.0, 5.0), (1000.0, 5.0)])
+    def test_overflowing_factors_match_loop(self, principal: float, contribution_amount: float):
+        """Fatores que estouram dão inf como no laço, sem nan por 0 * inf"""
+        contribution = Contribution(contribution_amount, CompoundingFrequency.DAILY) if contribution_amount else None
+        investment = Investment(principal, 20.0, 18250, CompoundingFrequency.DAILY, contribution)
+
+        tables = CompoundInterestCalculator(growth_tables=GrowthFactorTables()).simulate(investment, detailed=True)
+        loop = CompoundInterestCalculator().simulate(investment, detailed=True)
+
+        assert list(tables.period_details.balances[-3:]) == [math.inf] * 3
+        assert not any(math.isnan(value) for value in tables.period_details.interests)
+        assert tables.period_details.balances[-1] == loop.period_details.balances[-1]
+        assert tables.period_details.interests[-1] == loop.period_details.interests[-1]
+
+    def test_tables_are_shared_and_extended(self):
+        """Horizontes maiores estendem a tabela existente; menores são servidos por consulta"""
+        tables = GrowthFactorTables()
+        calculator = CompoundInterestCalculator(growth_tables=tables)
+
+        calculator.simulate(_investment(total_periods=120), detailed=True)
+        calculator.simulate(_investment(total_periods=60, principal=5.0), detailed=True)
+        calculator.simulate(_investment(total_periods=360), detailed=True)
+
+        stats = tables.stats
+        assert (stats.misses, stats.hits, stats.extensions) == (1, 1, 1)
+        assert stats.tables == 1
+
+    def test_memory_bound_evicts_least_recently_used_tables(self):
+        """O total de fatores guardados respeita o limite configurado"""
+        tables = GrowthFactorTables(max_cached_factors=250)
+        calculator = CompoundInterestCalculator(growth_tables=tables)
+
+        for annual_rate in (0.05, 0.06, 0.07):
+            calculator.simulate(_investment(total_periods=120, annual_rate=annual_rate), detailed=True)
+
+        assert tables.stats.evictions == 1
+        assert tables.stats.cached_factors <= 250
+
+    def test_balance_at_and_period_slice(self):
+        """Qualquer saldo ou fatia de períodos é respondido sem simular os anteriores"""
+        investment = _investment(total_periods=240)
+        calculator = CompoundInterestCalculator(growth_tables=GrowthFactorTables())
+        full = CompoundInterestCalculator().simulate(investment, detailed=True).period_details
+
+        assert calculator.balance_at(investment, 0) == investment.principal
+        assert calculator.balance_at(investment, 150) == pytest.approx(full[149].balance, rel=1e-9)
+
+        window = calculator.period_details(investment, 100, 112)
+        assert [d.period for d in window] == list(range(100, 112))
+        for actual, reference in zip(window, full[99:111]):
+            assert actual.balance == pytest.approx(reference.balance, rel=1e-9)
+            assert actual.interest_earned == pytest.approx(reference.interest_earned, rel=1e-9)
+
+        with pytest.raises(ValueError):
+            calculator.balance_at(investment, 241)
+
+    def test_horizon_beyond_limit_falls_back_to_loop(self):
+        """Horizontes acima de max_horizon continuam sendo simulados pelo laço"""
+        tables = GrowthFactorTables(max_horizon=12)
+        result = CompoundInterestCalculator(growth_tables=tables).simulate(_investment(total_periods=24), detailed=True)
+
+        assert len(result.period_details) == 24
+        assert tables.stats.tables == 0
+
+    def test_use_case_evolutions_match_streaming_path(self):
+        """O relatório montado com tabelas é equivalente ao montado em streaming"""
+        investment = _investment(total_periods=30)
+
+        expected = SimulateInvestmentUseCase().execute(investment)
+        result = SimulateInvestmentUseCase(growth_tables=GrowthFactorTables()).execute(investment)
+
+        assert len(result.yearly_evolution) == len(expected.yearly_evolution) == 3
+        for actual, reference in zip(result.yearly_evolution, expected.yearly_evolution):
+            assert actual.year == reference.year
+            assert actual.final_balance == pytest.approx(reference.final_balance, rel=1e-9)
+            assert actual.interest_this_year == pytest.approx(reference.interest_this_year, rel=1e-9)
+            assert actual.deposits_total == reference.deposits_total
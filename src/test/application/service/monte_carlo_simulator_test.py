@@ -0,0 +1,142 @@
+import math
+import tracemalloc
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.python.application.domain.monte_carlo import RateDistribution, StochasticRateModel
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution,
+    RateSegment
+)
+from src.python.application.service.monte_carlo_simulator import MonteCarloSimulator
+from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+
+INVESTMENT = Investment(
+    principal=10000.0,
+    annual_rate=0.08,
+    total_periods=42,
+    compounding_frequency=CompoundingFrequency.MONTHLY,
+    contribution=Contribution(amount=300.0, frequency=CompoundingFrequency.MONTHLY)
+)
+
+
+class TestMonteCarloSimulator:
+    """Simulação com taxa estocástica em blocos de caminhos"""
+
+    @pytest.fixture
+    def simulator(self) -> MonteCarloSimulator:
+        return MonteCarloSimulator(chunk_paths=64)
+
+    @pytest.mark.parametrize("distribution", list(RateDistribution))
+    def test_zero_volatility_matches_deterministic_report(self, simulator, distribution):
+        """Sem volatilidade todas as faixas coincidem com a evolução anual determinística"""
+        expected = list(SimulateInvestmentUseCase().execute(INVESTMENT).yearly_evolution)
+
+        result = simulator.simulate(INVESTMENT, StochasticRateModel(0.0, distribution), paths=10)
+
+        for band in result.bands:
+            assert len(band.yearly_evolution) == len(expected)
+            for year, expected_year in zip(band.yearly_evolution, expected):
+                assert year.year == expected_year.year
+                assert year.initial_balance == pytest.approx(expected_year.initial_balance, rel=1e-9)
+                assert year.final_balance == pytest.approx(expected_year.final_balance, rel=1e-9)
+                assert year.deposits_total == pytest.approx(expected_year.deposits_total, rel=1e-12)
+                assert year.interest_this_year == pytest.approx(expected_year.interest_this_year, rel=1e-7)
+                assert year.interest_total == pytest.approx(expected_year.interest_total, rel=1e-7)
+
+    def test_rate_schedule_moves_the_mean(self, simulator):
+        """Com cronograma, a média de cada período segue o trecho vigente"""
+        investment = replace(INVESTMENT, rate_schedule=(RateSegment(13, 0.02), RateSegment(25, 0.15)))
+        expected = list(SimulateInvestmentUseCase().execute(investment).yearly_evolution)
+
+        result = simulator.simulate(investment, StochasticRateModel(0.0), paths=4, percentiles=(50.0,))
+
+        assert [year.final_balance for year in result.band(50.0).yearly_evolution] == pytest.approx(
+            [year.final_balance for year in expected], rel=1e-9
+        )
+
+    def test_same_seed_reproduces_bands(self, simulator):
+        """Com a mesma semente o resultado é reproduzível"""
+        model = StochasticRateModel(0.15, RateDistribution.LOGNORMAL, seed=123)
+
+        first = simulator.simulate(INVESTMENT, model, paths=500)
+        second = simulator.simulate(INVESTMENT, model, paths=500)
+
+        assert first == second
+
+    def test_chunk_size_does_not_change_result(self):
+        """Os blocos consomem o gerador na mesma ordem, então o tamanho do bloco não altera as faixas"""
+        model = StochasticRateModel(0.15, seed=99)
+
+        small = MonteCarloSimulator(chunk_paths=7).simulate(INVESTMENT, model, paths=100)
+        whole = MonteCarloSimulator(chunk_paths=100).simulate(INVESTMENT, model, paths=100)
+
+        assert small == whole
+
+    @pytest.mark.parametrize("distribution", list(RateDistribution))
+    def test_memory_budget_bounds_the_growth_matrix(self, distribution):
+        """Horizontes diários longos reduzem o bloco ao orçamento sem alterar as faixas"""
+        investment = replace(INVESTMENT, total_periods=15 * 365, compounding_frequency=CompoundingFrequency.DAILY)
+        model = StochasticRateModel(0.15, distribution=distribution, seed=5)
+        budget = 1024 * 1024
+
+        tracemalloc.start()
+        try:
+            bounded = MonteCarloSimulator(max_chunk_bytes=budget).simulate(investment, model, paths=64)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 3 * budget
+        assert bounded == MonteCarloSimulator().simulate(investment, model, paths=64)
+
+    def test_bands_are_ordered_by_percentile(self, simulator):
+        """Percentis maiores nunca têm saldo final menor"""
+        result = simulator.simulate(INVESTMENT, StochasticRateModel(0.2, seed=7), paths=1000)
+
+        finals = np.array([[year.final_balance for year in band.yearly_evolution] for band in result.bands])
+        assert result.percentiles == (5.0, 25.0, 50.0, 75.0, 95.0)
+        assert np.all(np.diff(finals, axis=0) >= 0)
+        assert result.band(95.0).yearly_evolution[-1].final_balance > result.band(5.0).yearly_evolution[-1].final_balance
+
+    def test_lognormal_preserves_expected_growth(self):
+        """Na lognormal a média dos fatores de crescimento reproduz a taxa informada"""
+        investment = Investment(
+            principal=1000.0,
+            annual_rate=0.12,
+            total_periods=12,
+            compounding_frequency=CompoundingFrequency.MONTHLY
+        )
+        model = StochasticRateModel(0.1, RateDistribution.LOGNORMAL, seed=1)
+
+        result = MonteCarloSimulator().simulate(investment, model, paths=20000, percentiles=(50.0,))
+
+        deterministic = 1000.0 * (1 + 0.01) ** 12
+        median = result.band(50.0).yearly_evolution[-1].final_balance
+        # A mediana de uma lognormal fica abaixo da média, por exp(-variância / 2)
+        assert median == pytest.approx(deterministic * math.exp(-0.1 ** 2 / 2), rel=0.01)
+
+    def test_partial_last_year_is_reported(self, simulator):
+        """Horizontes que não fecham o ano terminam com um ano parcial, como no relatório determinístico"""
+        result = simulator.simulate(INVESTMENT, StochasticRateModel(0.1, seed=3), paths=50, percentiles=(50.0,))
+
+        years = result.band(50.0).yearly_evolution
+        assert [year.year for year in years] == [1, 2, 3, 4]
+        assert years[-1].deposits_this_year == pytest.approx(6 * 300.0)
+
+    @pytest.mark.parametrize(
+        "model, paths, percentiles",
+        [
+            (StochasticRateModel(0.1), 0, (50.0,)),
+            (StochasticRateModel(-0.1), 10, (50.0,)),
+            (StochasticRateModel(0.1), 10, (101.0,)),
+        ]
+    )
+    def test_rejects_invalid_arguments(self, simulator, model, paths, percentiles):
+        """Quantidade de caminhos, volatilidade e percentis são validados"""
+        with pytest.raises(ValueError):
+            simulator.simulate(INVESTMENT, model, paths, percentiles)
@@ -0,0 +1,111 @@
+from dataclasses import asdict
+
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.parallel_simulation_executor import (
+    ParallelSimulationExecutor,
+    simulate_full_report
+)
+from src.python.application.usecases.compound_interest_calculator import (
+    SimulateInvestmentDetailedBatchUseCase,
+    SimulateInvestmentUseCase
+)
+
+
+def _investments():
+    return [
+        Investment(
+            principal=1000.0 * index,
+            annual_rate=0.01 * index,
+            total_periods=index * frequency.value // 2,
+            compounding_frequency=frequency,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+        for index in range(12)
+        for frequency in (CompoundingFrequency.MONTHLY, CompoundingFrequency.YEARLY)
+    ]
+
+
+def _as_dict(report):
+    return {
+        "summary": asdict(report.summary),
+        "yearly": [asdict(year) for year in report.yearly_evolution],
+        "monthly": [asdict(month) for month in report.monthly_evolution],
+    }
+
+
+@pytest.fixture
+def executor():
+    with ParallelSimulationExecutor(max_workers=2, chunk_size=5, serial_threshold=0) as executor:
+        yield executor
+
+
+class TestParallelSimulationExecutor:
+    """O executor paralelo deve devolver os mesmos relatórios da execução serial, na mesma ordem"""
+
+    def test_parallel_reports_match_use_case(self, executor: ParallelSimulationExecutor):
+        """Resumo e evoluções batem com SimulateInvestmentUseCase, cenário a cenário"""
+        investments = _investments()
+
+        reports = executor.run(investments)
+
+        assert len(reports) == len(investments)
+        for investment, report in zip(investments, reports):
+            expected = SimulateInvestmentUseCase().execute(investment)
+            assert report.summary == expected.summary
+            if investment.total_periods:
+                assert _as_dict(report) == _as_dict(expected)
+            else:
+                assert list(report.yearly_evolution) == [] and list(report.monthly_evolution) == []
+
+    def test_pool_is_reused_between_calls_and_released_on_close(self, executor: ParallelSimulationExecutor):
+        """O mesmo pool atende chamadas sucessivas até close()"""
+        executor.run(_investments())
+        pool = executor._pool
+
+        executor.run(_investments())
+
+        assert pool is not None and executor._pool is pool
+        executor.close()
+        assert executor._pool is None
+
+    def test_small_batches_run_serially_without_pool(self):
+        """Lotes abaixo do limite são simulados no próprio processo"""
+        investments = _investments()[:4]
+        executor = ParallelSimulationExecutor(max_workers=4, serial_threshold=10)
+
+        reports = executor.run(investments)
+        encoded = executor.run_encoded(investments)
+
+        assert executor._pool is None
+        assert [_as_dict(r) for r in reports] == [_as_dict(simulate_full_report(i)) for i in investments]
+        assert len(encoded) == len(investments) and all(isinstance(data, bytes) for data in encoded)
+
+    @pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"chunk_size": 0}])
+    def test_rejects_non_positive_settings(self, kwargs):
+        """max_workers e chunk_size precisam ser positivos"""
+        with pytest.raises(ValueError):
+            ParallelSimulationExecutor(**kwargs)
+
+
+class TestSimulateInvestmentDetailedBatchUseCase:
+    """O caso de uso encerra o pool que criou, mas não o de um executor recebido"""
+
+    def test_owned_executor_is_closed_on_exit(self):
+        with SimulateInvestmentDetailedBatchUseCase() as use_case:
+            use_case.executor.serial_threshold = 0
+            use_case.execute(_investments())
+            assert use_case.executor._pool is not None
+
+        assert use_case.executor._pool is None
+
+    def test_injected_executor_stays_open(self, executor: ParallelSimulationExecutor):
+        with SimulateInvestmentDetailedBatchUseCase(executor) as use_case:
+            use_case.execute(_investments())
+
+        assert executor._pool is not None
@@ -0,0 +1,113 @@
+import itertools
+import warnings
+
+import pytest
+
+from src.python.application.domain.parameter_sweep import SweepAxes
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    Contribution
+)
+from src.python.application.service.compound_interest_calculator import CompoundInterestCalculator
+from src.python.application.service.parameter_sweep_calculator import ParameterSweepCalculator
+
+
+def _assert_grid_matches_scalar_engine(axes: SweepAxes) -> None:
+    result = ParameterSweepCalculator().sweep(axes)
+    calculator = CompoundInterestCalculator()
+    contribution_frequency = axes.contribution_frequency or axes.compounding_frequency
+
+    assert result.final_balances.shape == axes.shape
+    assert result.total_invested.shape == axes.shape[1:]
+
+    for (i, rate), (j, periods), (k, amount) in itertools.product(
+            enumerate(axes.annual_rates),
+            enumerate(axes.total_periods),
+            enumerate(axes.contribution_amounts)
+    ):
+        expected = calculator.simulate(
+            Investment(
+                principal=axes.principal,
+                annual_rate=rate,
+                total_periods=periods,
+                compounding_frequency=axes.compounding_frequency,
+                contribution=Contribution(amount=amount, frequency=contribution_frequency)
+            ),
+            detailed=True
+        )
+        assert result.final_balances[i, j, k] == pytest.approx(expected.final_amount, rel=1e-9, abs=1e-9)
+        assert result.total_invested[j, k] == pytest.approx(expected.total_invested, rel=1e-12)
+
+
+class TestParameterSweepCalculator:
+    """Compara cada célula da grade com o motor escalar"""
+
+    @pytest.mark.parametrize("frequency", list(CompoundingFrequency))
+    def test_uniform_contributions_match_scalar_engine(self, frequency: CompoundingFrequency):
+        """Aportes na mesma frequência da capitalização, incluindo taxa zero e negativa"""
+        axes = SweepAxes(
+            principal=2500.0,
+            compounding_frequency=frequency,
+            annual_rates=(-0.05, 0.0, 0.07, 0.3),
+            total_periods=(0, 1, frequency.value, 3 * frequency.value + 1),
+            contribution_amounts=(0.0, 150.0, 1000.0)
+        )
+
+        _assert_grid_matches_scalar_engine(axes)
+
+    @pytest.mark.parametrize(
+        "compounding, contributions",
+        [
+            (CompoundingFrequency.MONTHLY, CompoundingFrequency.YEARLY),
+            (CompoundingFrequency.MONTHLY, CompoundingFrequency.DAILY),
+            (CompoundingFrequency.DAILY, CompoundingFrequency.MONTHLY),
+            (CompoundingFrequency.YEARLY, CompoundingFrequency.MONTHLY),
+        ]
+    )
+    def test_mixed_frequency_contributions_match_scalar_engine(
+            self,
+            compounding: CompoundingFrequency,
+            contributions: CompoundingFrequency
+    ):
+        """Aportes em frequência diferente da capitalização seguem o mesmo calendário do motor escalar"""
+        axes = SweepAxes(
+            principal=1000.0,
+            compounding_frequency=compounding,
+            contribution_frequency=contributions,
+            annual_rates=(0.0, 0.12),
+            total_periods=(1, compounding.value - 1 or 1, 2 * compounding.value + 3),
+            contribution_amounts=(50.0, 200.0)
+        )
+
+        _assert_grid_matches_scalar_engine(axes)
+
+    def test_rejects_rate_at_or_below_minus_one_per_period(self):
+        """Taxas por período <= -100% não têm forma fechada"""
+        axes = SweepAxes(
+            principal=1000.0,
+            compounding_frequency=CompoundingFrequency.YEARLY,
+            annual_rates=(0.1, -1.0),
+            total_periods=(10,),
+            contribution_amounts=(0.0,)
+        )
+
+        with pytest.raises(ValueError):
+            ParameterSweepCalculator().sweep(axes)
+
+    @pytest.mark.parametrize("principal", [0.0, 1000.0])
+    @pytest.mark.parametrize("contributions", [CompoundingFrequency.DAILY, CompoundingFrequency.MONTHLY])
+    def test_overflowing_growth_matches_scalar_engine(self, principal: float, contributions: CompoundingFrequency):
+        """Horizontes longos com taxa alta dão inf, como no motor escalar, sem nan nem avisos do numpy"""
+        axes = SweepAxes(
+            principal=principal,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution_frequency=contributions,
+            annual_rates=(0.12, 20.0),
+            total_periods=(365, 50 * 365),
+            contribution_amounts=(0.0, 10.0)
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            _assert_grid_matches_scalar_engine(axes)
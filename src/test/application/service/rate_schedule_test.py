@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from src.python.application.domain.simulation_result import (
+    Investment,
+    CompoundingFrequency,
+    RateSegment
+)
+from src.python.application.service.rate_schedule import period_rates, rate_intervals
+
+
+def _investment(*segments: RateSegment) -> Investment:
+    return Investment(
+        principal=1000.0,
+        annual_rate=0.12,
+        total_periods=24,
+        compounding_frequency=CompoundingFrequency.MONTHLY,
+        rate_schedule=segments
+    )
+
+
+class TestRateIntervals:
+    """Trechos de taxa constante derivados do cronograma"""
+
+    def test_without_schedule_single_interval(self):
+        """Sem cronograma, annual_rate vale para todo o horizonte"""
+        assert rate_intervals(_investment(), 24) == [(1, 24, 0.01)]
+        assert rate_intervals(_investment(), 0) == []
+
+    def test_base_rate_applies_before_first_segment(self):
+        """Antes do primeiro segmento vale annual_rate; segmentos após o horizonte são ignorados"""
+        investment = _investment(RateSegment(7, 0.24), RateSegment(13, 0.06), RateSegment(40, 0.5))
+
+        assert rate_intervals(investment, 24) == [(1, 6, 0.01), (7, 12, 0.02), (13, 24, 0.005)]
+        assert rate_intervals(investment, 10) == [(1, 6, 0.01), (7, 10, 0.02)]
+
+    def test_segment_starting_at_first_period_replaces_base_rate(self):
+        """Um segmento no período 1 substitui annual_rate desde o início"""
+        investment = _investment(RateSegment(1, 0.24), RateSegment(3, 0.0))
+
+        np.testing.assert_array_equal(period_rates(investment, 4), [0.02, 0.02, 0.0, 0.0])
+
+    @pytest.mark.parametrize(
+        "segments",
+        [
+            (RateSegment(0, 0.1),),
+            (RateSegment(5, 0.1), RateSegment(5, 0.2)),
+            (RateSegment(8, 0.1), RateSegment(3, 0.2)),
+        ]
+    )
+    def test_invalid_schedules_are_rejected(self, segments):
+        """Segmentos precisam começar no período 1 ou depois, em ordem estritamente crescente"""
+        with pytest.raises(ValueError):
+            rate_intervals(_investment(*segments), 24)
@@ -1,5 +1,12 @@
+from dataclasses import replace
+
 import pytest
-from src.python.application.usecases.compound_interest_calculator import SimulateInvestmentUseCase
+from src.python.application.repositories.simulation_result_repository import SimulationResultRepository
+from src.python.application.usecases.compound_interest_calculator import (
+    PERSISTED_YEARLY_EVOLUTION_MAX_PERIODS,
+    SimulateInvestmentBatchUseCase,
+    SimulateInvestmentUseCase
+)
 from src.python.application.domain.simulation_result import (
     Investment,
     CompoundingFrequency,
@@ -597,3 +604,143 @@ class TestSimulationComparativeAnalysis:
 
         assert True
 
+
+
+class TestSimulateInvestmentUseCaseLazyEvolution:
+    """Testes da avaliação preguiçosa das evoluções mensal e anual"""
+
+    @pytest.fixture
+    def use_case(self) -> SimulateInvestmentUseCase:
+        return SimulateInvestmentUseCase()
+
+    @pytest.fixture
+    def investment(self) -> Investment:
+        return Investment(
+            principal=1000.0,
+            annual_rate=0.10,
+            total_periods=365 * 2,
+            compounding_frequency=CompoundingFrequency.DAILY,
+            contribution=Contribution(amount=10.0, frequency=CompoundingFrequency.DAILY)
+        )
+
+    def test_summary_does_not_build_evolutions(self, use_case: SimulateInvestmentUseCase, investment: Investment):
+        """Acessar apenas o resumo não deve materializar as evoluções"""
+        result = use_case.execute(investment)
+
+        assert result.summary.total_invested == pytest.approx(1000.0 + 10.0 * 730)
+        assert not result.monthly_evolution.is_loaded
+        assert not result.yearly_evolution.is_loaded
+
+    def test_evolutions_are_built_together_on_first_access(
+            self,
+            use_case: SimulateInvestmentUseCase,
+            investment: Investment
+    ):
+        """O primeiro acesso materializa as evoluções de forma consistente com o resumo"""
+        result = use_case.execute(investment)
+
+        assert len(result.yearly_evolution) == 2
+        assert len(result.monthly_evolution) == 730
+        assert result.monthly_evolution[-1].final_balance == pytest.approx(result.summary.final_balance, rel=1e-9)
+        assert result.yearly_evolution[-1].final_balance == result.monthly_evolution[-1].final_balance
+
+
+class InMemorySimulationResultRepository(SimulationResultRepository):
+    def __init__(self):
+        self.reports = {}
+        self.writes = 0
+
+    def get(self, investment: Investment):
+        return self.reports.get(investment)
+
+    def save_many(self, results):
+        self.writes += 1
+        for investment, report in results:
+            self.reports.setdefault(investment, report)
+
+
+class TestSimulateInvestmentUseCaseRepository:
+    """Testes da leitura através do repositório de resultados persistidos"""
+
+    @pytest.fixture
+    def repository(self) -> InMemorySimulationResultRepository:
+        return InMemorySimulationResultRepository()
+
+    @pytest.fixture
+    def investment(self) -> Investment:
+        return Investment(
+            principal=1000.0,
+            annual_rate=0.10,
+            total_periods=36,
+            compounding_frequency=CompoundingFrequency.MONTHLY,
+            contribution=Contribution(amount=100.0, frequency=CompoundingFrequency.MONTHLY)
+        )
+
+    def test_computes_and_saves_with_yearly_evolution(
+            self,
+            repository: InMemorySimulationResultRepository,
+            investment: Investment
+    ):
+        """Sem resultado gravado, calcula e persiste o relatório já com a evolução anual"""
+        report = SimulateInvestmentUseCase(repository=repository).execute(investment)
+
+        assert repository.reports[investment] is report
+        assert report.yearly_evolution.is_loaded
+        assert report.summary == SimulateInvestmentUseCase().execute(investment).summary
+
+    def test_long_horizon_saves_summary_only_unless_evolution_requested(
+            self,
+            repository: InMemorySimulationResultRepository,
+            investment: Investment
+    ):
+        """Acima do horizonte barato, a evolução anual só é calculada para gravar quando foi pedida"""
+        long_horizon = replace(investment, total_periods=PERSISTED_YEARLY_EVOLUTION_MAX_PERIODS + 12)
+        requested = replace(long_horizon, principal=2000.0)
+        use_case = SimulateInvestmentUseCase(repository=repository)
+
+        summary_only = use_case.execute(long_horizon)
+        with_evolution = use_case.execute(requested, with_yearly_evolution=True)
+
+        assert not summary_only.yearly_evolution.is_loaded
+        assert not summary_only.monthly_evolution.is_loaded
+        assert with_evolution.yearly_evolution.is_loaded
+
+    def test_requested_evolution_is_saved_over_a_summary_only_result(
+            self,
+            repository: InMemorySimulationResultRepository,
+            investment: Investment
+    ):
+        """Um resultado gravado só com o resumo é gravado de novo quando a evolução anual é pedida"""
+        long_horizon = replace(investment, total_periods=PERSISTED_YEARLY_EVOLUTION_MAX_PERIODS + 12)
+        use_case = SimulateInvestmentUseCase(repository=repository)
+        use_case.execute(long_horizon)
+
+        report = use_case.execute(long_horizon, with_yearly_evolution=True)
+
+        assert report.yearly_evolution.is_loaded
+        assert repository.writes == 2
+
+    def test_reads_saved_result_before_computing(
+            self,
+            repository: InMemorySimulationResultRepository,
+            investment: Investment
+    ):
+        """Um resultado gravado é devolvido sem nova simulação nem nova escrita"""
+        saved = SimulateInvestmentUseCase(repository=repository).execute(investment)
+
+        again = SimulateInvestmentUseCase(repository=repository).execute(investment)
+
+        assert again is saved
+        assert repository.writes == 1
+
+    def test_batch_saves_all_summaries_in_one_call(self, repository: InMemorySimulationResultRepository):
+        """O lote grava todos os resumos de uma vez, sem calcular as evoluções"""
+        investments = [
+            Investment(1000.0, rate, 24, CompoundingFrequency.MONTHLY) for rate in (0.05, 0.10, 0.15)
+        ]
+
+        summaries = SimulateInvestmentBatchUseCase(repository=repository).execute(investments)
+
+        assert repository.writes == 1
+        assert [repository.reports[investment].summary for investment in investments] == summaries
+        assert not any(repository.reports[investment].yearly_evolution.is_loaded for investment in investments)
@@ -0,0 +1,33 @@
+import pytest
+
+from src.benchmark.performance_suite import Measurement, compare
+
+BASELINE = {"case": {"seconds": 1.0, "peak_bytes": 1000}}
+
+
+class TestCompare:
+    """Limites de tempo e memória da comparação com o baseline"""
+
+    @pytest.mark.parametrize("measurement", [
+        Measurement(seconds=1.25, peak_bytes=1000),
+        Measurement(seconds=0.5, peak_bytes=1100),
+        Measurement(seconds=1.0, peak_bytes=1150),
+    ])
+    def test_within_thresholds_passes(self, measurement: Measurement):
+        """No limite de tempo, no de memória ou dentro da folga absoluta não há regressão"""
+        assert compare({"case": measurement}, BASELINE, threshold=0.25, memory_threshold=0.10, memory_slack=50) == []
+
+    @pytest.mark.parametrize("measurement", [
+        Measurement(seconds=1.26, peak_bytes=1000),
+        Measurement(seconds=1.0, peak_bytes=1151),
+    ])
+    def test_beyond_thresholds_fails(self, measurement: Measurement):
+        """Mais lento que o limite, ou com mais memória que o limite mais a folga, é regressão"""
+        regressions = compare({"case": measurement}, BASELINE, threshold=0.25, memory_threshold=0.10, memory_slack=50)
+
+        assert regressions == ["case"]
+
+    def test_cases_without_baseline_are_ignored(self):
+        results = {"case": Measurement(seconds=1.0, peak_bytes=1000), "new": Measurement(seconds=9.0, peak_bytes=9000)}
+
+        assert compare(results, BASELINE, threshold=0.25, memory_threshold=0.10) == []